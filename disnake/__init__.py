@@ -33,8 +33,10 @@ from .asset import *
 from .audit_logs import *
 from .automod import *
 from .bans import *
+from .cdn import *
 from .channel import *
 from .client import *
+from .cluster import *
 from .colour import *
 from .components import *
 from .custom_warnings import *
@@ -51,6 +53,11 @@ from .gateway import (
 from .guild import *
 from .guild_preview import *
 from .guild_scheduled_event import *
+from .http import (
+    RequestMetrics as RequestMetrics,  # don't want to export everything from this module
+    RetryPolicy as RetryPolicy,
+    retry_policy as retry_policy,
+)
 from .i18n import *
 from .integrations import *
 from .interactions import *
@@ -58,12 +65,14 @@ from .invite import *
 from .member import *
 from .mentions import *
 from .message import *
+from .monitor import *
 from .object import *
 from .onboarding import *
 from .partial_emoji import *
 from .permissions import *
 from .player import *
 from .poll import *
+from .ratelimit import *
 from .raw_models import *
 from .reaction import *
 from .role import *
@@ -82,5 +91,6 @@ from .voice_region import *
 from .webhook import *
 from .welcome_screen import *
 from .widget import *
+from .worker import *
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import time
 from abc import ABC
 from collections.abc import Callable, Mapping, Sequence
 from typing import (
@@ -92,6 +93,99 @@ if TYPE_CHECKING:
 MISSING = utils.MISSING
 
 
+async def _purge_helper(
+    channel: GuildMessageable,
+    *,
+    limit: int | None,
+    check: Callable[[Message], bool],
+    before: SnowflakeTime | None,
+    after: SnowflakeTime | None,
+    around: SnowflakeTime | None,
+    oldest_first: bool | None,
+    bulk: bool,
+    progress: Callable[[int, int], Any] | None,
+) -> list[Message]:
+    # Retrieving history, bulk deletes and single deletes use separate rate limit buckets,
+    # so they run concurrently, each one as fast as its bucket allows.
+    if check is MISSING:
+        check = lambda m: True
+
+    iterator = channel.history(
+        limit=limit,
+        before=before,
+        after=after,
+        oldest_first=oldest_first,
+        around=around,
+        prefetch=1,
+    )
+    ret: list[Message] = []
+    scanned = 0
+    deleted = 0
+
+    # messages older than 14 days can't be bulk deleted
+    minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
+
+    # `None` marks the end of each queue
+    bulk_queue: asyncio.Queue[list[Message] | None] = asyncio.Queue()
+    single_queue: asyncio.Queue[Message | None] = asyncio.Queue()
+
+    def report(count: int) -> None:
+        nonlocal deleted
+        deleted += count
+        if progress is not None:
+            progress(deleted, scanned)
+
+    async def scan() -> None:
+        nonlocal scanned
+        batch: list[Message] = []
+        async for message in iterator:
+            scanned += 1
+            if not check(message):
+                continue
+            ret.append(message)
+
+            if bulk and message.id >= minimum_time:
+                batch.append(message)
+                if len(batch) == 100:
+                    bulk_queue.put_nowait(batch)
+                    batch = []
+            else:
+                single_queue.put_nowait(message)
+
+        if batch:
+            bulk_queue.put_nowait(batch)
+        bulk_queue.put_nowait(None)
+        single_queue.put_nowait(None)
+
+    async def bulk_delete() -> None:
+        while (batch := await bulk_queue.get()) is not None:
+            await channel.delete_messages(batch)
+            report(len(batch))
+
+    async def single_delete() -> None:
+        while (message := await single_queue.get()) is not None:
+            await message.delete()
+            report(1)
+
+    tasks = [
+        asyncio.create_task(scan()),
+        asyncio.create_task(bulk_delete()),
+        asyncio.create_task(single_delete()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        # stop at the first error, without waiting for other requests to finish
+        errors = [exc for task in done if (exc := task.exception()) is not None]
+        if errors:
+            raise errors[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await iterator.aclose()
+
+    return ret
+
+
 @runtime_checkable
 class Snowflake(Protocol):
     """An ABC that details the common operations on a Discord model.
@@ -1845,6 +1939,7 @@ class Messageable:
         after: SnowflakeTime | None = None,
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = None,
+        prefetch: int = 0,
     ) -> HistoryIterator:
         """Returns an :class:`.AsyncIterator` that enables receiving the destination's message history.
 
@@ -1889,6 +1984,13 @@ class Messageable:
         oldest_first: :class:`bool` | :data:`None`
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        prefetch: :class:`int`
+            The number of pages to request in advance while the current page is being processed,
+            which reduces the time spent waiting for responses when retrieving many messages.
+            Use :meth:`.AsyncIterator.aclose` to cancel pending requests if the iterator is not exhausted.
+            Defaults to ``0``.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -1905,7 +2007,13 @@ class Messageable:
         from .iterators import HistoryIterator  # cyclic import
 
         return HistoryIterator(
-            self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first
+            self,
+            limit=limit,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            prefetch=prefetch,
         )
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import os
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Literal, TypeAlias, Union
 
 import yarl
@@ -64,6 +65,44 @@ class AssetMixin:
 
         return await self._state.http.get_from_cdn(self.url)
 
+    def stream(self, *, chunk_size: int = 2**16) -> AsyncIterator[bytes]:
+        """Returns an :term:`asynchronous iterator` over the content of this asset,
+        without loading all of it into memory.
+
+        .. versionadded:: |vnext|
+
+        Examples
+        --------
+        .. code-block:: python3
+
+            async for chunk in asset.stream():
+                hasher.update(chunk)
+
+        Parameters
+        ----------
+        chunk_size: :class:`int`
+            The maximum size of each chunk, in bytes.
+
+        Raises
+        ------
+        DiscordException
+            There was no internal connection state.
+        HTTPException
+            Downloading the asset failed.
+        NotFound
+            The asset was deleted.
+
+        Yields
+        ------
+        :class:`bytes`
+            A chunk of the asset's content.
+        """
+        if self._state is None:
+            msg = "Invalid state (no ConnectionState provided)"
+            raise DiscordException(msg)
+
+        return self._state.http.stream_from_cdn(self.url, chunk_size=chunk_size)
+
     async def save(
         self,
         fp: str | bytes | os.PathLike[str] | os.PathLike[bytes] | io.BufferedIOBase,
@@ -74,6 +113,10 @@ class AssetMixin:
 
         Saves this asset into a file-like object.
 
+        .. versionchanged:: |vnext|
+            The asset is now written in chunks while it is being downloaded,
+            instead of being loaded into memory first.
+
         Parameters
         ----------
         fp: :class:`io.BufferedIOBase` | :class:`os.PathLike`
@@ -98,15 +141,7 @@ class AssetMixin:
         :class:`int`
             The number of bytes written.
         """
-        data = await self.read()
-        if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
-            if seek_begin:
-                fp.seek(0)
-            return written
-        else:
-            with open(fp, "wb") as f:  # noqa: ASYNC230
-                return f.write(data)
+        return await utils._save_stream(self.stream(), fp, seek_begin=seek_begin)
 
     async def to_file(
         self,
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+import yarl
+
+__all__ = (
+    "CDNCache",
+    "CDNCacheWriter",
+)
+
+# query parameters of signed attachment urls, which change regularly for the same file
+_SIGNATURE_PARAMS = frozenset({"ex", "is", "hm"})
+
+
+class CDNCache:
+    """An on-disk cache for files downloaded from Discord's CDN, such as assets and attachments.
+
+    Files are keyed by their URL, ignoring the signature parameters of attachment URLs,
+    so the same asset (e.g. an avatar hash in a specific size and format) is only
+    downloaded once. When the total size of the cached files exceeds ``max_size``,
+    the least recently used files are evicted.
+
+    Every client should use its own directory, as the cache's size
+    and usage order are tracked in memory. The cache may be used from multiple threads;
+    its methods do blocking disk I/O, so clients call them in an executor.
+
+    This can be passed to :class:`Client` using the ``cdn_cache`` parameter.
+
+    .. versionadded:: |vnext|
+
+    Parameters
+    ----------
+    path: :class:`str` | :class:`os.PathLike`
+        The directory to store cached files in. It is created if it doesn't exist yet,
+        existing files from previous runs are reused.
+    max_size: :class:`int`
+        The maximum total size of all cached files, in bytes.
+        Defaults to 256 MiB.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, max_size: int = 256 * 1024 * 1024) -> None:
+        if max_size <= 0:
+            msg = "max_size must be greater than 0"
+            raise ValueError(msg)
+
+        self.path: str = os.fspath(path)
+        self.max_size: int = max_size
+        # guards `_entries` and `_size`, which are accessed from executor threads
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size: int = 0
+
+        os.makedirs(self.path, exist_ok=True)
+        existing: list[os.DirEntry[str]] = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # leftover from an interrupted download
+                    os.remove(entry.path)
+                else:
+                    existing.append(entry)
+
+        # restore the usage order using access/modification times, oldest first
+        for entry in sorted(existing, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._entries[entry.name] = size
+            self._size += size
+        with self._lock:
+            self._evict()
+
+    def __repr__(self) -> str:
+        return f"<CDNCache path={self.path!r} size={self._size} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """:class:`int`: The total size of all cached files, in bytes."""
+        return self._size
+
+    @staticmethod
+    def _key(url: str) -> str:
+        parsed = yarl.URL(url)
+        query = [(k, v) for k, v in parsed.query.items() if k not in _SIGNATURE_PARAMS]
+        normalized = parsed.with_query(query).with_fragment(None)
+        return hashlib.sha256(str(normalized).encode()).hexdigest()
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def open(self, url: str) -> io.BufferedReader | None:
+        """Opens the cached file for the given URL for reading.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the file.
+
+        Returns
+        -------
+        :class:`io.BufferedReader` | :data:`None`
+            The cached file, or :data:`None` if the URL is not cached.
+        """
+        key = self._key(url)
+        path = self._file_path(key)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                fp = open(path, "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                # removed externally
+                self._size -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return fp
+
+    def get(self, url: str) -> bytes | None:
+        """Returns the contents of the cached file for the given URL.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the file.
+
+        Returns
+        -------
+        :class:`bytes` | :data:`None`
+            The cached content, or :data:`None` if the URL is not cached.
+        """
+        fp = self.open(url)
+        if fp is None:
+            return None
+        with fp:
+            return fp.read()
+
+    def put(self, url: str, data: bytes) -> None:
+        """Stores the given content for a URL in the cache.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the file.
+        data: :class:`bytes`
+            The content of the file.
+        """
+        with self.writer(url) as writer:
+            writer.write(data)
+
+    def writer(self, url: str) -> CDNCacheWriter:
+        """Returns a writer for incrementally storing the content of a URL in the cache.
+
+        The content is written to a temporary file, which only gets added
+        to the cache once the writer is committed, i.e. when exiting
+        the writer's context manager without an exception.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The URL of the file.
+
+        Returns
+        -------
+        :class:`CDNCacheWriter`
+            The writer.
+        """
+        return CDNCacheWriter(self, self._key(url))
+
+    def clear(self) -> None:
+        """Removes all files from the cache."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _add(self, key: str, tmp_path: str, size: int) -> None:
+        with self._lock:
+            os.replace(tmp_path, self._file_path(key))
+            self._size += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    # must be called with the lock held
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key)
+        try:
+            os.remove(self._file_path(key))
+        except FileNotFoundError:
+            pass
+
+    # must be called with the lock held
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            self._remove(next(iter(self._entries)))
+
+
+class CDNCacheWriter:
+    """Incrementally writes a file to a :class:`CDNCache`.
+
+    This is returned by :meth:`CDNCache.writer`, and should not be created manually.
+
+    .. versionadded:: |vnext|
+    """
+
+    __slots__ = ("_cache", "_key", "_tmp_path", "_fp", "_size")
+
+    def __init__(self, cache: CDNCache, key: str) -> None:
+        self._cache = cache
+        self._key = key
+        self._tmp_path = cache._file_path(f"{key}.{uuid.uuid4().hex}.tmp")
+        self._fp = open(self._tmp_path, "wb")  # noqa: SIM115
+        self._size = 0
+
+    def __enter__(self) -> CDNCacheWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> None:
+        """Writes a chunk of data to the file."""
+        self._size += self._fp.write(data)
+
+    def commit(self) -> None:
+        """Adds the written file to the cache."""
+        if self._fp.closed:
+            return
+        self._fp.close()
+        if self._size > self._cache.max_size:
+            # would get evicted immediately anyway
+            os.remove(self._tmp_path)
+            return
+        self._cache._add(self._key, self._tmp_path, self._size)
+
+    def abort(self) -> None:
+        """Discards the written data."""
+        if self._fp.closed:
+            return
+        self._fp.close()
+        try:
+            os.remove(self._tmp_path)
+        except FileNotFoundError:
+            pass
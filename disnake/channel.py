@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
 import datetime
-import time
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
@@ -155,11 +153,6 @@ class VoiceChannelEffect:
         )
 
 
-async def _single_delete_strategy(messages: Iterable[Message]) -> None:
-    for m in messages:
-        await m.delete()
-
-
 class TextChannel(disnake.abc.Messageable, disnake.abc.GuildChannel, Hashable):
     """Represents a Discord guild text channel.
 
@@ -707,6 +700,7 @@ class TextChannel(disnake.abc.Messageable, disnake.abc.GuildChannel, Hashable):
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = False,
         bulk: bool = True,
+        progress: Callable[[int, int], Any] | None = None,
     ) -> list[Message]:
         r"""|coro|
 
@@ -714,11 +708,18 @@ class TextChannel(disnake.abc.Messageable, disnake.abc.GuildChannel, Hashable):
         ``check``. If a ``check`` is not provided then all messages are deleted
         without discrimination.
 
+        Messages are deleted while the message history is still being retrieved.
+        Messages older than two weeks are deleted individually, concurrently with bulk deletes.
+        If the purge is cancelled, pending requests are cancelled as well.
+
         You must have :attr:`~Permissions.manage_messages` permission to
         delete messages even if they are your own.
         :attr:`~Permissions.read_message_history` permission is
         also needed to retrieve message history.
 
+        .. versionchanged:: |vnext|
+            Retrieving and deleting messages now happens concurrently.
+
         Examples
         --------
         Deleting bot's messages ::
@@ -749,6 +750,11 @@ class TextChannel(disnake.abc.Messageable, disnake.abc.GuildChannel, Hashable):
             If ``True``, use bulk delete. Setting this to ``False`` is useful for mass-deleting
             a bot's own messages without :attr:`Permissions.manage_messages`. When ``True``, will
             fall back to single delete if messages are older than two weeks.
+        progress: :class:`~collections.abc.Callable`\[[:class:`int`, :class:`int`], Any] | :data:`None`
+            A function called whenever messages were deleted, with the total number of
+            messages deleted so far and the number of messages searched through so far.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -762,52 +768,17 @@ class TextChannel(disnake.abc.Messageable, disnake.abc.GuildChannel, Hashable):
         :class:`list`\[:class:`.Message`]
             A list of messages that were deleted.
         """
-        if check is MISSING:
-            check = lambda m: True
-
-        iterator = self.history(
-            limit=limit, before=before, after=after, oldest_first=oldest_first, around=around
+        return await disnake.abc._purge_helper(
+            self,
+            limit=limit,
+            check=check,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            bulk=bulk,
+            progress=progress,
         )
-        ret: list[Message] = []
-        count = 0
-
-        minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-        strategy = self.delete_messages if bulk else _single_delete_strategy
-
-        async for message in iterator:
-            if count == 100:
-                to_delete = ret[-100:]
-                await strategy(to_delete)
-                count = 0
-                await asyncio.sleep(1)
-
-            if not check(message):
-                continue
-
-            if message.id < minimum_time:
-                # older than 14 days old
-                if count == 1:
-                    await ret[-1].delete()
-                elif count >= 2:
-                    to_delete = ret[-count:]
-                    await strategy(to_delete)
-
-                count = 0
-                strategy = _single_delete_strategy
-
-            count += 1
-            ret.append(message)
-
-        # SOme messages remaining to poll
-        if count >= 2:
-            # more than 2 messages -> bulk delete
-            to_delete = ret[-count:]
-            await strategy(to_delete)
-        elif count == 1:
-            # delete a single message
-            await ret[-1].delete()
-
-        return ret
 
     async def webhooks(self) -> list[Webhook]:
         r"""|coro|
@@ -1774,6 +1745,7 @@ class VoiceChannel(disnake.abc.Messageable, VocalGuildChannel):
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = False,
         bulk: bool = True,
+        progress: Callable[[int, int], Any] | None = None,
     ) -> list[Message]:
         r"""|coro|
 
@@ -1781,6 +1753,10 @@ class VoiceChannel(disnake.abc.Messageable, VocalGuildChannel):
         ``check``. If a ``check`` is not provided then all messages are deleted
         without discrimination.
 
+        Messages are deleted while the message history is still being retrieved.
+        Messages older than two weeks are deleted individually, concurrently with bulk deletes.
+        If the purge is cancelled, pending requests are cancelled as well.
+
         You must have :attr:`~Permissions.manage_messages` permission to
         delete messages even if they are your own.
         :attr:`~Permissions.read_message_history` permission is
@@ -1788,6 +1764,9 @@ class VoiceChannel(disnake.abc.Messageable, VocalGuildChannel):
 
         .. versionadded:: 2.5
 
+        .. versionchanged:: |vnext|
+            Retrieving and deleting messages now happens concurrently.
+
         .. note::
 
             See :meth:`TextChannel.purge` for examples.
@@ -1812,6 +1791,11 @@ class VoiceChannel(disnake.abc.Messageable, VocalGuildChannel):
             If ``True``, use bulk delete. Setting this to ``False`` is useful for mass-deleting
             a bot's own messages without :attr:`Permissions.manage_messages`. When ``True``, will
             fall back to single delete if messages are older than two weeks.
+        progress: :class:`~collections.abc.Callable`\[[:class:`int`, :class:`int`], Any] | :data:`None`
+            A function called whenever messages were deleted, with the total number of
+            messages deleted so far and the number of messages searched through so far.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -1825,52 +1809,17 @@ class VoiceChannel(disnake.abc.Messageable, VocalGuildChannel):
         :class:`list`\[:class:`.Message`]
             A list of messages that were deleted.
         """
-        if check is MISSING:
-            check = lambda m: True
-
-        iterator = self.history(
-            limit=limit, before=before, after=after, oldest_first=oldest_first, around=around
+        return await disnake.abc._purge_helper(
+            self,
+            limit=limit,
+            check=check,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            bulk=bulk,
+            progress=progress,
         )
-        ret: list[Message] = []
-        count = 0
-
-        minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-        strategy = self.delete_messages if bulk else _single_delete_strategy
-
-        async for message in iterator:
-            if count == 100:
-                to_delete = ret[-100:]
-                await strategy(to_delete)
-                count = 0
-                await asyncio.sleep(1)
-
-            if not check(message):
-                continue
-
-            if message.id < minimum_time:
-                # older than 14 days old
-                if count == 1:
-                    await ret[-1].delete()
-                elif count >= 2:
-                    to_delete = ret[-count:]
-                    await strategy(to_delete)
-
-                count = 0
-                strategy = _single_delete_strategy
-
-            count += 1
-            ret.append(message)
-
-        # SOme messages remaining to poll
-        if count >= 2:
-            # more than 2 messages -> bulk delete
-            to_delete = ret[-count:]
-            await strategy(to_delete)
-        elif count == 1:
-            # delete a single message
-            await ret[-1].delete()
-
-        return ret
 
     async def webhooks(self) -> list[Webhook]:
         r"""|coro|
@@ -2685,6 +2634,7 @@ class StageChannel(disnake.abc.Messageable, VocalGuildChannel):
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = False,
         bulk: bool = True,
+        progress: Callable[[int, int], Any] | None = None,
     ) -> list[Message]:
         r"""|coro|
 
@@ -2692,6 +2642,10 @@ class StageChannel(disnake.abc.Messageable, VocalGuildChannel):
         ``check``. If a ``check`` is not provided then all messages are deleted
         without discrimination.
 
+        Messages are deleted while the message history is still being retrieved.
+        Messages older than two weeks are deleted individually, concurrently with bulk deletes.
+        If the purge is cancelled, pending requests are cancelled as well.
+
         You must have :attr:`~Permissions.manage_messages` permission to
         delete messages even if they are your own.
         :attr:`~Permissions.read_message_history` permission is
@@ -2699,6 +2653,9 @@ class StageChannel(disnake.abc.Messageable, VocalGuildChannel):
 
         .. versionadded:: 2.9
 
+        .. versionchanged:: |vnext|
+            Retrieving and deleting messages now happens concurrently.
+
         .. note::
 
             See :meth:`TextChannel.purge` for examples.
@@ -2723,6 +2680,11 @@ class StageChannel(disnake.abc.Messageable, VocalGuildChannel):
             If ``True``, use bulk delete. Setting this to ``False`` is useful for mass-deleting
             a bot's own messages without :attr:`Permissions.manage_messages`. When ``True``, will
             fall back to single delete if messages are older than two weeks.
+        progress: :class:`~collections.abc.Callable`\[[:class:`int`, :class:`int`], Any] | :data:`None`
+            A function called whenever messages were deleted, with the total number of
+            messages deleted so far and the number of messages searched through so far.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -2736,52 +2698,17 @@ class StageChannel(disnake.abc.Messageable, VocalGuildChannel):
         :class:`list`\[:class:`.Message`]
             A list of messages that were deleted.
         """
-        if check is MISSING:
-            check = lambda m: True
-
-        iterator = self.history(
-            limit=limit, before=before, after=after, oldest_first=oldest_first, around=around
+        return await disnake.abc._purge_helper(
+            self,
+            limit=limit,
+            check=check,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            bulk=bulk,
+            progress=progress,
         )
-        ret: list[Message] = []
-        count = 0
-
-        minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-        strategy = self.delete_messages if bulk else _single_delete_strategy
-
-        async for message in iterator:
-            if count == 100:
-                to_delete = ret[-100:]
-                await strategy(to_delete)
-                count = 0
-                await asyncio.sleep(1)
-
-            if not check(message):
-                continue
-
-            if message.id < minimum_time:
-                # older than 14 days old
-                if count == 1:
-                    await ret[-1].delete()
-                elif count >= 2:
-                    to_delete = ret[-count:]
-                    await strategy(to_delete)
-
-                count = 0
-                strategy = _single_delete_strategy
-
-            count += 1
-            ret.append(message)
-
-        # SOme messages remaining to poll
-        if count >= 2:
-            # more than 2 messages -> bulk delete
-            to_delete = ret[-count:]
-            await strategy(to_delete)
-        elif count == 1:
-            # delete a single message
-            await ret[-1].delete()
-
-        return ret
 
     async def webhooks(self) -> list[Webhook]:
         r"""|coro|
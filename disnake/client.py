@@ -7,14 +7,18 @@ import inspect
 import logging
 import signal
 import sys
+import time
 import traceback
 import types
-from collections.abc import Callable, Coroutine, Generator, Mapping, Sequence
+from collections import deque
+from collections.abc import Callable, Coroutine, Generator, Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from errno import ECONNRESET
 from typing import (
     TYPE_CHECKING,
     Any,
+    Final,
     Literal,
     TypedDict,
     TypeVar,
@@ -38,7 +42,14 @@ from .backoff import ExponentialBackoff
 from .channel import PartialMessageable, _threaded_channel_factory
 from .emoji import Emoji
 from .entitlement import Entitlement
-from .enums import ApplicationCommandType, ChannelType, Event, Status
+from .enums import (
+    ApplicationCommandType,
+    ChannelType,
+    Event,
+    EventDispatchMode,
+    EventOverflowPolicy,
+    Status,
+)
 from .errors import (
     ConnectionClosed,
     GatewayNotFound,
@@ -51,11 +62,12 @@ from .flags import ApplicationFlags, Intents, MemberCacheFlags
 from .gateway import DiscordWebSocket, GatewayParams, ReconnectWebSocket
 from .guild import Guild
 from .guild_preview import GuildPreview
-from .http import HTTPClient
+from .http import HTTPClient, RequestMetrics, RetryPolicy
 from .i18n import LocalizationProtocol, LocalizationStore
 from .invite import Invite
 from .iterators import EntitlementIterator, GuildIterator
 from .mentions import AllowedMentions
+from .message import Message
 from .object import Object
 from .sku import SKU
 from .soundboard import GuildSoundboardSound, SoundboardSound
@@ -65,22 +77,27 @@ from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factor
 from .template import Template
 from .threads import Thread
 from .ui.view import View
-from .user import ClientUser, User
+from .user import ClientUser, User, _UserTag
 from .utils import MISSING
 from .voice_client import VoiceClient
 from .voice_region import VoiceRegion
 from .webhook import Webhook
 from .widget import Widget
+from .worker import _WorkerHandler
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from typing_extensions import NotRequired
 
     from .abc import GuildChannel, PrivateChannel, Snowflake, SnowflakeTime
     from .app_commands import APIApplicationCommand, MessageCommand, SlashCommand, UserCommand
     from .asset import AssetBytes
+    from .cdn import CDNCache
     from .channel import DMChannel
     from .member import Member
-    from .message import Message
+    from .monitor import LoopMonitor
+    from .ratelimit import RateLimitStore
     from .types.application_role_connection import (
         ApplicationRoleConnectionMetadata as ApplicationRoleConnectionMetadataPayload,
     )
@@ -91,6 +108,9 @@ if TYPE_CHECKING:
 __all__ = (
     "Client",
     "SessionStartLimit",
+    "EventLimit",
+    "ListenerProfiling",
+    "ListenerStats",
 )
 
 T = TypeVar("T")
@@ -138,6 +158,695 @@ def _cleanup_loop(loop: asyncio.AbstractEventLoop) -> None:
         loop.close()
 
 
+def _create_eager_task(coro: Coroutine[Any, Any, Any], *, name: str) -> asyncio.Task[Any] | None:
+    # runs the coroutine until it first suspends, and only creates a task if it does;
+    # returns None if the coroutine finished synchronously
+    if sys.version_info >= (3, 12):
+        task = asyncio.Task(coro, loop=asyncio.get_running_loop(), name=name, eager_start=True)
+        return None if task.done() else task
+    # stepping the coroutine outside of a task would make it run as part of the current task
+    # (e.g. for `asyncio.current_task()` and timeouts), so older versions always use a task
+    return asyncio.create_task(coro, name=name)
+
+
+@types.coroutine
+def _timed_coroutine(
+    coro: Coroutine[Any, Any, Any], on_step: Callable[[float], None]
+) -> Generator[Any, Any, Any]:
+    # drives a coroutine like `await coro` would, calling `on_step` with the time
+    # each step took, i.e. how long the coroutine blocked the event loop
+    send: Callable[[Any], Any] = coro.send
+    value: Any = None
+    while True:
+        start = time.perf_counter()
+        try:
+            yielded = send(value)
+        except StopIteration as e:
+            return e.value
+        finally:
+            on_step(time.perf_counter() - start)
+        try:
+            value = yield yielded
+        except GeneratorExit:
+            # closed before finishing, e.g. when garbage collected; close the coroutine
+            # as well instead of throwing the exception into it and resuming it afterwards
+            coro.close()
+            raise
+        except BaseException as exc:
+            send, value = coro.throw, exc
+        else:
+            send = coro.send
+
+
+# attribute paths to look up event filter values on the first event argument, tried in order
+_EVENT_FILTER_PATHS: Final[dict[str, tuple[tuple[str, ...], ...]]] = {
+    "channel_id": (("channel_id",), ("channel", "id"), ("message", "channel", "id")),
+    "guild_id": (("guild_id",), ("guild", "id"), ("message", "guild", "id")),
+    "message_id": (("message_id",), ("message", "id")),
+    "custom_id": (("data", "custom_id"),),
+}
+# filters sorted by how selective they usually are, the first one given is used as index
+_EVENT_FILTER_FIELDS: Final[tuple[str, ...]] = (
+    "message_id",
+    "custom_id",
+    "author_id",
+    "channel_id",
+    "guild_id",
+)
+
+
+def _event_author(args: tuple[Any, ...]) -> Any:
+    # messages and interactions have an author, while e.g. reaction and typing events
+    # pass the user as the second argument
+    author = getattr(args[0], "author", None)
+    if author is None and len(args) > 1 and isinstance(args[1], _UserTag):
+        author = args[1]
+    return author
+
+
+def _event_filter_value(field: str, args: tuple[Any, ...]) -> Any:
+    # returns the value of a filter field for the given event arguments,
+    # or None if the event doesn't have one
+    if not args:
+        return None
+    obj = args[0]
+    if field == "author_id":
+        author = _event_author(args)
+        return author.id if author is not None else getattr(obj, "user_id", None)
+    if field == "message_id" and isinstance(obj, Message):
+        return obj.id
+
+    for path in _EVENT_FILTER_PATHS[field]:
+        value = obj
+        for attr in path:
+            value = getattr(value, attr, None)
+            if value is None:
+                break
+        else:
+            return value
+    return None
+
+
+class _EventValues:
+    """Lazily computed filter values of a single dispatched event."""
+
+    __slots__ = ("args", "_values")
+
+    def __init__(self, args: tuple[Any, ...]) -> None:
+        self.args = args
+        self._values: dict[str, Any] = {}
+
+    def get(self, field: str) -> Any:
+        try:
+            return self._values[field]
+        except KeyError:
+            value = self._values[field] = _event_filter_value(field, self.args)
+            return value
+
+
+def _default_coalesce_key(*args: Any) -> Hashable:
+    # identifies the entity an event is about, e.g. the member of a presence update,
+    # the channel and user of a typing event, or the message and user of a reaction
+    if not args:
+        return None
+    return (
+        getattr(args[0], "id", None),
+        _event_filter_value("author_id", args),
+        _event_filter_value("message_id", args),
+        _event_filter_value("guild_id", args),
+        _event_filter_value("channel_id", args),
+    )
+
+
+# the position of the `before` argument of events with `before` and `after` arguments
+_COALESCE_BEFORE_INDEX: Final[dict[str, int]] = {
+    "on_guild_channel_update": 0,
+    "on_private_channel_update": 0,
+    "on_thread_update": 0,
+    "on_guild_update": 0,
+    "on_member_update": 0,
+    "on_presence_update": 0,
+    "on_user_update": 0,
+    "on_guild_role_update": 0,
+    "on_guild_scheduled_event_update": 0,
+    "on_stage_instance_update": 0,
+    "on_message_edit": 0,
+    "on_guild_emojis_update": 1,
+    "on_guild_stickers_update": 1,
+    "on_guild_soundboard_sounds_update": 1,
+    "on_voice_state_update": 1,
+}
+
+
+def _merge_coalesced_args(
+    event_name: str, first: tuple[Any, ...], latest: tuple[Any, ...]
+) -> tuple[Any, ...]:
+    # keeps the `before` argument of the first event for events with `before` and `after`
+    # arguments, and the latest state of everything else
+    index = _COALESCE_BEFORE_INDEX.get(event_name)
+    if index is None or len(first) != len(latest) or len(latest) < index + 2:
+        return latest
+    return (*latest[:index], first[index], *latest[index + 1 :])
+
+
+class _CoalescedEvent:
+    __slots__ = ("listener", "event_name", "dispatch_mode", "args", "kwargs", "handle")
+
+    def __init__(
+        self,
+        listener: CoroFunc,
+        event_name: str,
+        dispatch_mode: EventDispatchMode | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        handle: asyncio.TimerHandle,
+    ) -> None:
+        self.listener = listener
+        self.event_name = event_name
+        self.dispatch_mode = dispatch_mode
+        self.args = args
+        self.kwargs = kwargs
+        self.handle = handle
+
+
+class _ListenerOptions:
+    """The declarative filters and dispatch options of a listener added using :meth:`Client.add_listener`."""
+
+    __slots__ = (
+        "guild_ids",
+        "channel_ids",
+        "ignore_bots",
+        "check",
+        "dispatch_mode",
+        "coalesce",
+        "coalesce_key",
+    )
+
+    def __init__(
+        self,
+        *,
+        guild_ids: frozenset[int] | None,
+        channel_ids: frozenset[int] | None,
+        ignore_bots: bool,
+        check: Callable[..., bool] | None,
+        dispatch_mode: EventDispatchMode | None,
+        coalesce: float | None,
+        coalesce_key: Callable[..., Hashable] | None,
+    ) -> None:
+        self.guild_ids = guild_ids
+        self.channel_ids = channel_ids
+        self.ignore_bots = ignore_bots
+        self.check = check
+        self.dispatch_mode = dispatch_mode
+        self.coalesce = coalesce
+        self.coalesce_key = coalesce_key or _default_coalesce_key
+
+    def matches(self, values: _EventValues) -> bool:
+        if self.guild_ids is not None and values.get("guild_id") not in self.guild_ids:
+            return False
+        if self.channel_ids is not None and values.get("channel_id") not in self.channel_ids:
+            return False
+        if self.ignore_bots and values.args:
+            author = _event_author(values.args)
+            if author is not None and author.bot:
+                return False
+        if self.check is not None:
+            try:
+                return bool(self.check(*values.args))
+            except Exception:
+                _log.exception("Ignoring exception in listener check %r", self.check)
+                return False
+        return True
+
+
+class _ListenerIndex:
+    """The listeners of a single event in :attr:`Client.extra_events`.
+
+    Like :class:`_WaitForListeners`, listeners with ``channel_ids`` or ``guild_ids`` filters
+    are indexed by their IDs, so dispatching an event only has to evaluate the listeners
+    that can possibly match it. The index is rebuilt whenever the listener list changes.
+    """
+
+    __slots__ = ("listeners", "size", "unfiltered", "by_channel", "by_guild")
+
+    def __init__(
+        self, listeners: list[CoroFunc], options: Mapping[CoroFunc, _ListenerOptions]
+    ) -> None:
+        self.listeners = listeners
+        self.size = len(listeners)
+        # items are `(position, listener, options)`, the position keeps the order of listeners
+        self.unfiltered: list[tuple[int, CoroFunc, _ListenerOptions | None]] = []
+        self.by_channel: dict[int, list[tuple[int, CoroFunc, _ListenerOptions | None]]] = {}
+        self.by_guild: dict[int, list[tuple[int, CoroFunc, _ListenerOptions | None]]] = {}
+
+        for position, listener in enumerate(listeners):
+            options_ = options.get(listener)
+            entry = (position, listener, options_)
+            if options_ is None:
+                self.unfiltered.append(entry)
+            elif options_.channel_ids is not None:
+                for channel_id in options_.channel_ids:
+                    self.by_channel.setdefault(channel_id, []).append(entry)
+            elif options_.guild_ids is not None:
+                for guild_id in options_.guild_ids:
+                    self.by_guild.setdefault(guild_id, []).append(entry)
+            else:
+                self.unfiltered.append(entry)
+
+    def is_current(self, listeners: list[CoroFunc]) -> bool:
+        # `extra_events` is public and may be modified directly
+        return listeners is self.listeners and len(listeners) == self.size
+
+    def candidates(
+        self, values: _EventValues
+    ) -> list[tuple[int, CoroFunc, _ListenerOptions | None]]:
+        """Returns the listeners that may match the given event, in order."""
+        result = self.unfiltered
+        for field, index in (("channel_id", self.by_channel), ("guild_id", self.by_guild)):
+            if not index:
+                continue
+            value = values.get(field)
+            if value is not None and (bucket := index.get(value)):
+                result = sorted([*result, *bucket], key=lambda entry: entry[0])
+        return result
+
+
+class _EventLimiter:
+    """Runs the handlers of a single event according to an :class:`EventLimit`."""
+
+    __slots__ = ("client", "event_name", "limit", "running", "queue", "blocking")
+
+    def __init__(self, client: Client, event_name: str, limit: EventLimit) -> None:
+        self.client = client
+        self.event_name = event_name
+        self.limit = limit
+        self.running: int = 0
+        self.queue: deque[tuple[list[CoroFunc], tuple[Any, ...], dict[str, Any]]] = deque()
+        self.blocking: bool = False
+
+    def submit(
+        self, handlers: list[CoroFunc], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        job = (handlers, args, kwargs)
+        if self.running < self.limit.max_concurrency:
+            self.running += 1
+            asyncio.create_task(self._worker(job), name=f"disnake: {self.event_name}")
+            return
+
+        queue = self.queue
+        if len(queue) >= self.limit.max_queue:
+            overflow = self.limit.overflow
+            if overflow is EventOverflowPolicy.drop_newest:
+                _log.debug("Event queue for %s is full, dropping new event.", self.event_name)
+                return
+            if overflow is EventOverflowPolicy.drop_oldest:
+                _log.debug("Event queue for %s is full, dropping oldest event.", self.event_name)
+                if not queue:
+                    return
+                queue.popleft()
+            elif not self.blocking:
+                _log.warning(
+                    "Event queue for %s is full, pausing reading from the gateway.",
+                    self.event_name,
+                )
+                self.blocking = True
+                self.client._block_gateway_reads(self)
+        queue.append(job)
+
+    async def _worker(
+        self, job: tuple[list[CoroFunc], tuple[Any, ...], dict[str, Any]] | None
+    ) -> None:
+        client = self.client
+        event_name = self.event_name
+        try:
+            while job is not None:
+                handlers, args, kwargs = job
+                if len(handlers) == 1:
+                    await client._run_event(handlers[0], event_name, *args, **kwargs)
+                else:
+                    await asyncio.gather(
+                        *(client._run_event(coro, event_name, *args, **kwargs) for coro in handlers)
+                    )
+
+                queue = self.queue
+                job = queue.popleft() if queue else None
+                # with a `max_queue` of 0, events are still queued while blocking,
+                # so reads are resumed once the queue is empty
+                if self.blocking and (not queue or len(queue) < self.limit.max_queue):
+                    self.blocking = False
+                    client._unblock_gateway_reads(self)
+        finally:
+            self.running -= 1
+
+
+class _WaitForListener:
+    __slots__ = ("future", "check", "filters")
+
+    def __init__(
+        self,
+        future: asyncio.Future[Any],
+        check: Callable[..., bool] | None,
+        filters: dict[str, Any],
+    ) -> None:
+        self.future = future
+        self.check = check
+        self.filters = filters
+
+
+class _WaitForListeners:
+    """The :meth:`Client.wait_for` listeners of a single event.
+
+    Listeners with filters are indexed by their most selective filter, so dispatching
+    an event only has to evaluate the listeners that can possibly match it.
+    """
+
+    __slots__ = ("_unfiltered", "_indexes")
+
+    def __init__(self) -> None:
+        # dicts are used as ordered sets
+        self._unfiltered: dict[_WaitForListener, None] = {}
+        self._indexes: dict[str, dict[Any, dict[_WaitForListener, None]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._unfiltered) + sum(
+            len(bucket) for index in self._indexes.values() for bucket in index.values()
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._unfiltered or self._indexes)
+
+    def _bucket(
+        self, listener: _WaitForListener, *, create: bool
+    ) -> dict[_WaitForListener, None] | None:
+        if not listener.filters:
+            return self._unfiltered
+        field = next(f for f in _EVENT_FILTER_FIELDS if f in listener.filters)
+        value = listener.filters[field]
+        if create:
+            return self._indexes.setdefault(field, {}).setdefault(value, {})
+        index = self._indexes.get(field)
+        return index.get(value) if index is not None else None
+
+    def add(self, listener: _WaitForListener) -> None:
+        bucket = self._bucket(listener, create=True)
+        assert bucket is not None
+        bucket[listener] = None
+
+    def remove(self, listener: _WaitForListener) -> None:
+        bucket = self._bucket(listener, create=False)
+        if bucket is None or bucket.pop(listener, MISSING) is MISSING:
+            return
+        if not bucket and bucket is not self._unfiltered:
+            # clean up empty buckets and indexes
+            field = next(f for f in _EVENT_FILTER_FIELDS if f in listener.filters)
+            index = self._indexes[field]
+            del index[listener.filters[field]]
+            if not index:
+                del self._indexes[field]
+
+    def matching(self, values: _EventValues) -> list[_WaitForListener]:
+        """Returns the pending listeners whose filters match the given event."""
+        result = [listener for listener in self._unfiltered if not listener.future.done()]
+        for field, index in self._indexes.items():
+            value = values.get(field)
+            if value is None or (bucket := index.get(value)) is None:
+                continue
+            result.extend(
+                listener
+                for listener in bucket
+                if not listener.future.done()
+                and all(values.get(f) == v for f, v in listener.filters.items())
+            )
+        return result
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class EventLimit:
+    """Limits the number of handlers of an event running at the same time.
+
+    Events dispatched while the limit is reached are queued, and handled once
+    earlier events are done. Once the queue is full, the ``overflow`` policy applies.
+    This keeps floods of events (e.g. during raids) from creating an unbounded number of tasks.
+
+    Limits are passed to :class:`Client` using the ``event_limits`` parameter.
+    They apply per event, not per listener: all handlers of an event, except for
+    :meth:`Client.wait_for`, count as one unit and are run concurrently once the event
+    is taken from the queue, regardless of their :class:`EventDispatchMode`.
+    A slow listener therefore holds up the other listeners of the same event.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    max_concurrency: :class:`int`
+        The maximum number of events whose handlers run at the same time.
+    max_queue: :class:`int`
+        The maximum number of events waiting to be handled. Defaults to ``1000``.
+    overflow: :class:`EventOverflowPolicy`
+        What to do with new events when the queue is full.
+        Defaults to :attr:`EventOverflowPolicy.drop_oldest`.
+    """
+
+    max_concurrency: int
+    max_queue: int = 1000
+    overflow: EventOverflowPolicy = EventOverflowPolicy.drop_oldest
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+        if self.max_queue < 0:
+            msg = "max_queue must not be negative"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ListenerProfiling:
+    """Configures the profiling of event listeners.
+
+    When passed to :class:`Client` using the ``listener_profiling`` parameter, the client records
+    the number of invocations, run time and exceptions of every event handler, including
+    listeners added using :meth:`Client.listen`, cog listeners and ``on_*`` methods.
+    The results are available using :meth:`Client.listener_stats`.
+
+    Profiling adds a small overhead to every handler invocation, since each step
+    of the handler's coroutine is timed to detect handlers blocking the event loop.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    slow_threshold: :class:`float` | :data:`None`
+        If a handler blocks the event loop for longer than this many seconds
+        without suspending (e.g. due to blocking I/O or heavy computations), a warning is logged.
+        Defaults to ``0.1``. Set to :data:`None` to disable the warning.
+    log_interval: :class:`float` | :data:`None`
+        If set, the statistics of the slowest handlers are logged every this many seconds.
+        Defaults to :data:`None`.
+    samples: :class:`int`
+        The number of most recent run times kept per handler, used for calculating percentiles.
+        Defaults to ``1000``.
+    """
+
+    slow_threshold: float | None = 0.1
+    log_interval: float | None = None
+    samples: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.slow_threshold is not None and self.slow_threshold <= 0:
+            msg = "slow_threshold must be greater than 0"
+            raise ValueError(msg)
+        if self.log_interval is not None and self.log_interval <= 0:
+            msg = "log_interval must be greater than 0"
+            raise ValueError(msg)
+        if self.samples < 1:
+            msg = "samples must be at least 1"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ListenerStats:
+    """Execution statistics of a single event handler, returned by :meth:`Client.listener_stats`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    event: :class:`str`
+        The name of the event the handler ran for, e.g. ``on_message``.
+    listener: :class:`~collections.abc.Callable`
+        The handler.
+    invocations: :class:`int`
+        The number of times the handler was called.
+    exceptions: :class:`int`
+        The number of invocations that raised an exception.
+    running: :class:`int`
+        The number of invocations currently running.
+    total_time: :class:`float`
+        The total wall time of all finished invocations, in seconds.
+    p99_time: :class:`float`
+        The 99th percentile of the wall time of recent invocations, in seconds.
+    max_blocking_time: :class:`float`
+        The longest time the handler blocked the event loop without suspending, in seconds.
+    slow_invocations: :class:`int`
+        The number of invocations that blocked the event loop for longer than
+        :attr:`ListenerProfiling.slow_threshold`.
+    """
+
+    event: str
+    listener: Callable[..., Any]
+    invocations: int
+    exceptions: int
+    running: int
+    total_time: float
+    p99_time: float
+    max_blocking_time: float
+    slow_invocations: int
+
+    @property
+    def name(self) -> str:
+        """:class:`str`: The qualified name of the handler, e.g. ``MyCog.on_message``."""
+        return getattr(self.listener, "__qualname__", None) or repr(self.listener)
+
+
+class _ListenerProfile:
+    __slots__ = (
+        "event_name",
+        "listener",
+        "invocations",
+        "exceptions",
+        "running",
+        "total_time",
+        "durations",
+        "max_blocking_time",
+        "slow_invocations",
+    )
+
+    def __init__(self, event_name: str, listener: CoroFunc, samples: int) -> None:
+        self.event_name = event_name
+        self.listener = listener
+        self.running: int = 0
+        self.durations: deque[float] = deque(maxlen=samples)
+        self.reset()
+
+    def reset(self) -> None:
+        # `running` is kept, since handlers that are still running decrement it once done
+        self.invocations: int = 0
+        self.exceptions: int = 0
+        self.total_time: float = 0.0
+        self.durations.clear()
+        self.max_blocking_time: float = 0.0
+        self.slow_invocations: int = 0
+
+    def stats(self) -> ListenerStats:
+        durations = sorted(self.durations)
+        p99 = durations[min(len(durations) - 1, int(len(durations) * 0.99))] if durations else 0.0
+        return ListenerStats(
+            event=self.event_name,
+            listener=self.listener,
+            invocations=self.invocations,
+            exceptions=self.exceptions,
+            running=self.running,
+            total_time=self.total_time,
+            p99_time=p99,
+            max_blocking_time=self.max_blocking_time,
+            slow_invocations=self.slow_invocations,
+        )
+
+
+class _ListenerProfiler:
+    """Records the :class:`ListenerStats` of a client's event handlers."""
+
+    __slots__ = ("config", "profiles", "_log_task")
+
+    def __init__(self, config: ListenerProfiling) -> None:
+        self.config = config
+        self.profiles: dict[tuple[str, CoroFunc], _ListenerProfile] = {}
+        self._log_task: asyncio.Task[None] | None = None
+
+    async def run(self, func: CoroFunc, event_name: str, coro: Coroutine[Any, Any, Any]) -> None:
+        if self.config.log_interval is not None and self._log_task is None:
+            self._log_task = asyncio.create_task(self._log_periodically())
+
+        key = (event_name, func)
+        profile = self.profiles.get(key)
+        if profile is None:
+            profile = self.profiles[key] = _ListenerProfile(event_name, func, self.config.samples)
+
+        threshold = self.config.slow_threshold
+        slow = False
+
+        def on_step(duration: float) -> None:
+            nonlocal slow
+            if duration > profile.max_blocking_time:
+                profile.max_blocking_time = duration
+            if threshold is not None and duration > threshold and not slow:
+                slow = True
+                profile.slow_invocations += 1
+                _log.warning(
+                    "Listener %s for %s blocked the event loop for %.3f seconds.",
+                    getattr(func, "__qualname__", func),
+                    event_name,
+                    duration,
+                )
+
+        profile.invocations += 1
+        profile.running += 1
+        start = time.perf_counter()
+        try:
+            await _timed_coroutine(coro, on_step)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            profile.exceptions += 1
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            profile.running -= 1
+            profile.total_time += duration
+            profile.durations.append(duration)
+
+    def reset(self) -> None:
+        for key, profile in list(self.profiles.items()):
+            if profile.running:
+                # running handlers still hold a reference to their profile
+                profile.reset()
+            else:
+                del self.profiles[key]
+
+    def stats(self, event_name: str | None = None) -> list[ListenerStats]:
+        stats = [
+            profile.stats()
+            for profile in self.profiles.values()
+            if event_name is None or profile.event_name == event_name
+        ]
+        stats.sort(key=lambda s: s.total_time, reverse=True)
+        return stats
+
+    async def _log_periodically(self) -> None:
+        assert self.config.log_interval is not None
+        while True:
+            await asyncio.sleep(self.config.log_interval)
+            for stats in self.stats()[:10]:
+                _log.info(
+                    "Listener %s for %s: %d invocations, %d exceptions, %d running, "
+                    "%.3fs total, %.3fs p99, %.3fs max blocking.",
+                    stats.name,
+                    stats.event,
+                    stats.invocations,
+                    stats.exceptions,
+                    stats.running,
+                    stats.total_time,
+                    stats.p99_time,
+                    stats.max_blocking_time,
+                )
+
+    def close(self) -> None:
+        if self._log_task is not None:
+            self._log_task.cancel()
+            self._log_task = None
+
+
 class SessionStartLimit:
     """A class that contains information about the current session start limit,
     at the time when the client connected for the first time.
@@ -195,7 +904,7 @@ class _WebSocketParams(TypedDict):
 
 
 class Client:
-    """Represents a client connection that connects to Discord.
+    r"""Represents a client connection that connects to Discord.
     This class is used to interact with the Discord WebSocket and API.
 
     A number of options can be passed to the :class:`Client`.
@@ -221,6 +930,80 @@ class Client:
         Proxy URL.
     proxy_auth: :class:`aiohttp.BasicAuth` | :data:`None`
         An object that represents proxy HTTP Basic Authorization.
+    http_trace_configs: :class:`list`\[:class:`aiohttp.TraceConfig`] | :data:`None`
+        A list of :class:`aiohttp.TraceConfig`\s to attach to the HTTP session, allowing
+        you to instrument all requests made to the API.
+        The ``trace_request_ctx`` of REST requests is the :class:`RequestMetrics` instance
+        of that request, which can be used to group requests by route or rate limit bucket.
+
+        .. versionadded:: |vnext|
+
+    ratelimit_store: :class:`RateLimitStore` | :data:`None`
+        A store to share REST rate limit state with other clients using the same token,
+        e.g. in other processes. See :class:`SharedMemoryRateLimitStore`.
+        The store is not closed when the client is closed.
+
+        .. versionadded:: |vnext|
+
+    cdn_cache: :class:`CDNCache` | :data:`None`
+        An on-disk cache for files downloaded from Discord's CDN, e.g. using :meth:`Asset.read`
+        or :meth:`Attachment.save`.
+
+        .. versionadded:: |vnext|
+
+    cdn_connections_per_host: :class:`int`
+        The maximum number of simultaneous connections to each CDN host.
+        Downloads from the CDN use a separate connection pool from API requests,
+        which doesn't use ``connector``. Defaults to ``10``.
+
+        .. versionadded:: |vnext|
+
+    retry_policy: :class:`RetryPolicy` | :data:`None`
+        The default policy for retrying REST requests and limiting the time spent
+        waiting for rate limits. Defaults to a policy without a deadline.
+        Interaction responses and followups use a policy with a short deadline instead.
+
+        .. versionadded:: |vnext|
+
+    route_retry_policies: :class:`~collections.abc.Mapping`\[:class:`str`, :class:`RetryPolicy`] | :data:`None`
+        Policies for specific routes, overriding ``retry_policy``. Keys are either
+        route templates (e.g. ``/channels/{channel_id}/messages``), or a method followed
+        by a route template (e.g. ``POST /channels/{channel_id}/messages``).
+
+        .. versionadded:: |vnext|
+
+    event_dispatch_mode: :class:`.EventDispatchMode`
+        How event handlers are run when an event is dispatched,
+        see :attr:`event_dispatch_mode`. Defaults to :attr:`.EventDispatchMode.task`.
+
+        .. versionadded:: |vnext|
+
+    event_limits: :class:`~collections.abc.Mapping`\[:class:`str` | :class:`.Event`, :class:`EventLimit`] | :data:`None`
+        Limits for the number of concurrently running handlers of specific events,
+        e.g. ``{Event.message: EventLimit(max_concurrency=50)}``. Event names are
+        given without the ``on_`` prefix, like in :meth:`wait_for`.
+
+        .. versionadded:: |vnext|
+
+    listener_profiling: :class:`ListenerProfiling` | :data:`None`
+        If set, the execution of event handlers is profiled, see :meth:`listener_stats`.
+        Defaults to :data:`None`.
+
+        .. versionadded:: |vnext|
+
+    loop_monitor: :class:`LoopMonitor` | :data:`None`
+        If set, this monitor is started when connecting, measuring the event loop's
+        scheduling delay and optionally serving a health endpoint. Defaults to :data:`None`.
+
+        .. versionadded:: |vnext|
+
+    worker_pool: :class:`concurrent.futures.Executor` | :data:`None`
+        The executor to run listeners using :attr:`.EventDispatchMode.process` in,
+        usually a :class:`~concurrent.futures.ProcessPoolExecutor`.
+        The client does not shut it down when closing. Defaults to :data:`None`.
+
+        .. versionadded:: |vnext|
+
     shard_id: :class:`int` | :data:`None`
         Integer starting at ``0`` and less than :attr:`.shard_count`.
     shard_count: :class:`int` | :data:`None`
@@ -344,6 +1127,21 @@ class Client:
         application commands.
 
         .. versionadded:: 2.5
+    event_dispatch_mode: :class:`.EventDispatchMode`
+        How event handlers are run when an event is dispatched.
+        This can be overridden for individual listeners using the ``dispatch_mode``
+        parameter of :meth:`listen`.
+
+        .. versionadded:: |vnext|
+    loop_monitor: :class:`LoopMonitor` | :data:`None`
+        The monitor measuring the event loop's lag, if any.
+        Use :meth:`LoopMonitor.snapshot` to get its current statistics.
+
+        .. versionadded:: |vnext|
+    worker_pool: :class:`concurrent.futures.Executor` | :data:`None`
+        The executor listeners using :attr:`.EventDispatchMode.process` run in, if any.
+
+        .. versionadded:: |vnext|
     """
 
     def __init__(
@@ -361,6 +1159,17 @@ class Client:
         connector: aiohttp.BaseConnector | None = None,
         proxy: str | None = None,
         proxy_auth: aiohttp.BasicAuth | None = None,
+        http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+        ratelimit_store: RateLimitStore | None = None,
+        cdn_cache: CDNCache | None = None,
+        cdn_connections_per_host: int = 10,
+        retry_policy: RetryPolicy | None = None,
+        route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+        event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+        event_limits: Mapping[str | Event, EventLimit] | None = None,
+        listener_profiling: ListenerProfiling | None = None,
+        loop_monitor: LoopMonitor | None = None,
+        worker_pool: Executor | None = None,
         assume_unsync_clock: bool = True,
         max_messages: int | None = 1000,
         application_id: int | None = None,
@@ -382,7 +1191,7 @@ class Client:
             self.loop: asyncio.AbstractEventLoop = loop
 
         self.loop.set_debug(asyncio_debug)
-        self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        self._listeners: dict[str, _WaitForListeners] = {}
         self.session_start_limit: SessionStartLimit | None = None
 
         self.http: HTTPClient = HTTPClient(
@@ -390,6 +1199,12 @@ class Client:
             proxy=proxy,
             proxy_auth=proxy_auth,
             unsync_clock=assume_unsync_clock,
+            trace_configs=http_trace_configs,
+            ratelimit_store=ratelimit_store,
+            cdn_cache=cdn_cache,
+            cdn_connections_per_host=cdn_connections_per_host,
+            retry_policy=retry_policy,
+            route_retry_policies=route_retry_policies,
             loop=self.loop,
         )
 
@@ -458,6 +1273,27 @@ class Client:
         self.gateway_params: GatewayParams = gateway_params or GatewayParams()
 
         self.extra_events: dict[str, list[CoroFunc]] = {}
+        if event_dispatch_mode is EventDispatchMode.process:
+            msg = "EventDispatchMode.process can only be used for individual listeners"
+            raise ValueError(msg)
+        self.event_dispatch_mode: EventDispatchMode = event_dispatch_mode
+        self.worker_pool: Executor | None = worker_pool
+        self._event_limiters: dict[str, _EventLimiter] = {}
+        for event_, limit in (event_limits or {}).items():
+            method = "on_" + (event_.lower() if isinstance(event_, str) else event_.value)
+            self._event_limiters[method] = _EventLimiter(self, method, limit)
+        # cleared while the queue of a limited event is full, see `EventOverflowPolicy.block`
+        self._gateway_reads_unblocked: asyncio.Event = asyncio.Event()
+        self._gateway_reads_unblocked.set()
+        self._gateway_read_blockers: set[_EventLimiter] = set()
+        self._coalesced_events: dict[tuple[CoroFunc, Hashable], _CoalescedEvent] = {}
+        self._listener_profiler: _ListenerProfiler | None = (
+            _ListenerProfiler(listener_profiling) if listener_profiling is not None else None
+        )
+        self.loop_monitor: LoopMonitor | None = loop_monitor
+        # declarative filters of listeners in `extra_events`, by event name and listener
+        self._listener_options: dict[str, dict[CoroFunc, _ListenerOptions]] = {}
+        self._listener_indexes: dict[str, _ListenerIndex] = {}
 
     # internals
 
@@ -706,8 +1542,12 @@ class Client:
         return self._ready.is_set()
 
     async def _run_event(self, coro: CoroFunc, event_name: str, *args: Any, **kwargs: Any) -> None:
+        profiler = self._listener_profiler
         try:
-            await coro(*args, **kwargs)
+            if profiler is None:
+                await coro(*args, **kwargs)
+            else:
+                await profiler.run(coro, event_name, coro(*args, **kwargs))
         except asyncio.CancelledError:
             pass
         except Exception:
@@ -723,51 +1563,201 @@ class Client:
         # Schedules the task
         return asyncio.create_task(wrapped, name=f"disnake: {event_name}")
 
+    async def _run_events(
+        self, coros: list[CoroFunc], event_name: str, *args: Any, **kwargs: Any
+    ) -> None:
+        for coro in coros:
+            await self._run_event(coro, event_name, *args, **kwargs)
+
+    def _schedule_events(
+        self,
+        handlers: list[tuple[CoroFunc, EventDispatchMode]],
+        event_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        batch: list[CoroFunc] = []
+        for coro, mode in handlers:
+            if mode is EventDispatchMode.task:
+                self._schedule_event(coro, event_name, *args, **kwargs)
+            elif mode is EventDispatchMode.eager:
+                _create_eager_task(
+                    self._run_event(coro, event_name, *args, **kwargs),
+                    name=f"disnake: {event_name}",
+                )
+            else:
+                batch.append(coro)
+
+        if len(batch) == 1:
+            self._schedule_event(batch[0], event_name, *args, **kwargs)
+        elif batch:
+            asyncio.create_task(
+                self._run_events(batch, event_name, *args, **kwargs),
+                name=f"disnake: {event_name}",
+            )
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug("Dispatching event %s", event)
         method = "on_" + event
 
+        if self.loop_monitor is not None:
+            self.loop_monitor._record_event(event)
+
+        values = _EventValues(args)
         listeners = self._listeners.get(event)
         if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
+            # resolved listeners are removed by a done callback, see `wait_for`
+            for listener in listeners.matching(values):
+                future = listener.future
+                if future.done():
+                    # resolved by another listener's check
                     continue
-
-                try:
-                    result = condition(*args)
-                except Exception as exc:
-                    future.set_exception(exc)
-                    removed.append(i)
+                if listener.check is not None:
+                    try:
+                        result = listener.check(*args)
+                    except Exception as exc:
+                        future.set_exception(exc)
+                        continue
+                    if not result:
+                        continue
+
+                if len(args) == 0:
+                    future.set_result(None)
+                elif len(args) == 1:
+                    future.set_result(args[0])
                 else:
-                    if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
-
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+                    future.set_result(args)
 
+        default_mode = self.event_dispatch_mode
+        handlers: list[tuple[CoroFunc, EventDispatchMode]] = []
         try:
             coro = getattr(self, method)
         except AttributeError:
             pass
         else:
-            self._schedule_event(coro, method, *args, **kwargs)
+            handlers.append((coro, default_mode))
+
+        if extra_events := self.extra_events.get(method):
+            index = self._listener_indexes.get(method)
+            if index is None or not index.is_current(extra_events):
+                index = self._listener_indexes[method] = _ListenerIndex(
+                    extra_events, self._listener_options.get(method, {})
+                )
+            for _, event_, options_ in index.candidates(values):
+                if options_ is None:
+                    handlers.append((event_, default_mode))
+                    continue
+                # filters are evaluated here, to avoid creating tasks for listeners
+                # that would ignore the event anyway
+                if not options_.matches(values):
+                    continue
+                if options_.coalesce is not None:
+                    self._coalesce_event(event_, method, options_, args, kwargs)
+                    continue
+                handlers.append((event_, options_.dispatch_mode or default_mode))
+
+        if handlers:
+            self._handle_event(handlers, method, args, kwargs)
+
+    def _handle_event(
+        self,
+        handlers: list[tuple[CoroFunc, EventDispatchMode]],
+        event_name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if self.worker_pool is not None:
+            handlers = [
+                (_WorkerHandler(self, coro), EventDispatchMode.task)
+                if mode is EventDispatchMode.process
+                else (coro, mode)
+                for coro, mode in handlers
+            ]
+
+        limiter = self._event_limiters.get(event_name)
+        if limiter is None:
+            self._schedule_events(handlers, event_name, *args, **kwargs)
+        else:
+            limiter.submit([coro for coro, _ in handlers], args, kwargs)
 
-        for event_ in self.extra_events.get(method, []):
-            self._schedule_event(event_, method, *args, **kwargs)
+    def _coalesce_event(
+        self,
+        listener: CoroFunc,
+        event_name: str,
+        options: _ListenerOptions,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        assert options.coalesce is not None
+        try:
+            key = (listener, options.coalesce_key(*args))
+        except Exception:
+            _log.exception("Ignoring exception in coalesce key of listener %r", listener)
+            return
 
-    def add_listener(self, func: CoroFunc, name: str | Event = MISSING) -> None:
-        """The non decorator alternative to :meth:`.listen`.
+        pending = self._coalesced_events.get(key)
+        if pending is not None:
+            pending.args = _merge_coalesced_args(event_name, pending.args, args)
+            pending.kwargs = kwargs
+            return
+
+        # the window starts with the first event, so handlers are delayed by at most `coalesce`
+        handle = asyncio.get_running_loop().call_later(
+            options.coalesce, self._flush_coalesced_event, key
+        )
+        self._coalesced_events[key] = _CoalescedEvent(
+            listener, event_name, options.dispatch_mode, args, kwargs, handle
+        )
+
+    def _flush_coalesced_event(self, key: tuple[CoroFunc, Hashable]) -> None:
+        pending = self._coalesced_events.pop(key, None)
+        if pending is None:
+            return
+        mode = pending.dispatch_mode or self.event_dispatch_mode
+        self._handle_event(
+            [(pending.listener, mode)], pending.event_name, pending.args, pending.kwargs
+        )
+
+    def _cancel_coalesced_events(self) -> None:
+        for pending in self._coalesced_events.values():
+            pending.handle.cancel()
+        self._coalesced_events.clear()
+
+    async def _close_event_handling(self) -> None:
+        self._cancel_coalesced_events()
+        if self._listener_profiler is not None:
+            self._listener_profiler.close()
+        if self.loop_monitor is not None:
+            await self.loop_monitor._stop()
+
+    def _block_gateway_reads(self, limiter: _EventLimiter) -> None:
+        self._gateway_read_blockers.add(limiter)
+        self._gateway_reads_unblocked.clear()
+
+    def _unblock_gateway_reads(self, limiter: _EventLimiter) -> None:
+        self._gateway_read_blockers.discard(limiter)
+        if not self._gateway_read_blockers:
+            self._gateway_reads_unblocked.set()
+
+    async def _wait_for_gateway_reads(self) -> None:
+        # applies backpressure from full event queues to the gateway
+        if not self._gateway_reads_unblocked.is_set():
+            await self._gateway_reads_unblocked.wait()
+
+    def add_listener(
+        self,
+        func: CoroFunc,
+        name: str | Event = MISSING,
+        *,
+        guild_ids: Iterable[int] | None = None,
+        channel_ids: Iterable[int] | None = None,
+        ignore_bots: bool = False,
+        check: Callable[..., bool] | None = None,
+        dispatch_mode: EventDispatchMode | None = None,
+        coalesce: float | None = None,
+        coalesce_key: Callable[..., Hashable] | None = None,
+    ) -> None:
+        r"""The non decorator alternative to :meth:`.listen`.
 
         .. versionchanged:: 2.10
             The definition of this method was moved from :class:`.ext.commands.Bot`
@@ -779,6 +1769,49 @@ class Client:
             The function to call.
         name: :class:`str` | :class:`.Event`
             The name of the event to listen for. Defaults to ``func.__name__``.
+        guild_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these guilds.
+            Events outside of a guild (e.g. in DMs) are ignored.
+
+            .. versionadded:: |vnext|
+        channel_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these channels.
+
+            .. versionadded:: |vnext|
+        ignore_bots: :class:`bool`
+            Whether to ignore events by bots, e.g. messages or interactions
+            authored by a bot. Defaults to ``False``.
+
+            .. versionadded:: |vnext|
+        check: :class:`~collections.abc.Callable`\[..., :class:`bool`] | :data:`None`
+            A predicate called with the event's arguments, the listener is only
+            called if it returns ``True``.
+
+            .. versionadded:: |vnext|
+        dispatch_mode: :class:`.EventDispatchMode` | :data:`None`
+            How to run the listener when the event is dispatched.
+            Defaults to the client's ``event_dispatch_mode``.
+
+            .. versionadded:: |vnext|
+        coalesce: :class:`float` | :data:`None`
+            If set, events arriving within this many seconds of each other are coalesced
+            into a single call of the listener, per key returned by ``coalesce_key``.
+            The listener is called once the window (starting with the first event) is over,
+            with the arguments of the latest event; for the built-in events with ``before``
+            and ``after`` arguments (e.g. :func:`on_member_update`), ``before`` is taken
+            from the first event instead. The cache is still updated for every event.
+
+            This is useful for high-churn events where only the final state matters,
+            e.g. :func:`on_presence_update` or :func:`on_voice_state_update`.
+
+            .. versionadded:: |vnext|
+        coalesce_key: :class:`~collections.abc.Callable`\[..., :class:`~collections.abc.Hashable`] | :data:`None`
+            A function called with the event's arguments, returning the key that events
+            are coalesced by. Defaults to the ID of the entity the event is about
+            (e.g. the member or channel) along with its user, message, channel and guild
+            where applicable. Custom events should usually provide their own key.
+
+            .. versionadded:: |vnext|
 
         Example
         --------
@@ -796,8 +1829,11 @@ class Client:
         Raises
         ------
         TypeError
-            The function is not a coroutine function,
+            The function is not a coroutine function (or is one, when using
+            :attr:`.EventDispatchMode.process`),
             or a string or an :class:`.Event` was not passed as the name.
+        ValueError
+            :attr:`.EventDispatchMode.process` was used without a ``worker_pool``.
         """
         if name is not MISSING and not isinstance(name, (str, Event)):
             msg = f"add_listener expected str or Enum but received {name.__class__.__name__!r} instead."
@@ -809,7 +1845,14 @@ class Client:
             else (name if isinstance(name, str) else f"on_{name.value}")
         )
 
-        if not inspect.iscoroutinefunction(func):
+        if dispatch_mode is EventDispatchMode.process:
+            if inspect.iscoroutinefunction(func):
+                msg = "Listeners using EventDispatchMode.process must not be coroutines"
+                raise TypeError(msg)
+            if self.worker_pool is None:
+                msg = "EventDispatchMode.process requires a worker_pool"
+                raise ValueError(msg)
+        elif not inspect.iscoroutinefunction(func):
             msg = "Listeners must be coroutines"
             raise TypeError(msg)
 
@@ -818,6 +1861,31 @@ class Client:
         else:
             self.extra_events[name_] = [func]
 
+        if coalesce is not None and coalesce <= 0:
+            msg = "coalesce must be greater than 0"
+            raise ValueError(msg)
+
+        if (
+            guild_ids is not None
+            or channel_ids is not None
+            or ignore_bots
+            or check is not None
+            or dispatch_mode is not None
+            or coalesce is not None
+        ):
+            self._listener_options.setdefault(name_, {})[func] = _ListenerOptions(
+                guild_ids=frozenset(guild_ids) if guild_ids is not None else None,
+                channel_ids=frozenset(channel_ids) if channel_ids is not None else None,
+                ignore_bots=ignore_bots,
+                check=check,
+                dispatch_mode=dispatch_mode,
+                coalesce=coalesce,
+                coalesce_key=coalesce_key,
+            )
+        elif filters := self._listener_options.get(name_):
+            filters.pop(func, None)
+        self._listener_indexes.pop(name_, None)
+
     def remove_listener(self, func: CoroFunc, name: str | Event = MISSING) -> None:
         """Removes a listener from the pool of listeners.
 
@@ -852,14 +1920,35 @@ class Client:
                 self.extra_events[name].remove(func)
             except ValueError:
                 pass
+            else:
+                if func not in self.extra_events[name] and (
+                    filters := self._listener_options.get(name)
+                ):
+                    filters.pop(func, None)
+                self._listener_indexes.pop(name, None)
 
-    def listen(self, name: str | Event = MISSING) -> Callable[[CoroT], CoroT]:
-        """A decorator that registers another function as an external
+    def listen(
+        self,
+        name: str | Event = MISSING,
+        *,
+        guild_ids: Iterable[int] | None = None,
+        channel_ids: Iterable[int] | None = None,
+        ignore_bots: bool = False,
+        check: Callable[..., bool] | None = None,
+        dispatch_mode: EventDispatchMode | None = None,
+        coalesce: float | None = None,
+        coalesce_key: Callable[..., Hashable] | None = None,
+    ) -> Callable[[CoroT], CoroT]:
+        r"""A decorator that registers another function as an external
         event listener. Basically this allows you to listen to multiple
         events from different places e.g. such as :func:`.on_ready`
 
         The function being listened to must be a :ref:`coroutine function <coroutine>`.
 
+        Events can be filtered declaratively using the keyword-only parameters.
+        Filters are evaluated when the event is dispatched, before a task is created
+        for the listener, which is cheaper than returning early from the listener itself.
+
         .. versionchanged:: 2.10
             The definition of this method was moved from :class:`.ext.commands.Bot`
             to the :class:`.Client` class.
@@ -885,6 +1974,62 @@ class Client:
 
         Would print one, two and three in an unspecified order.
 
+        Only listening to messages by users in a specific channel:
+
+        .. code-block:: python3
+
+            @client.listen(Event.message, channel_ids=[1234], ignore_bots=True)
+            async def on_support_message(message):
+                ...
+
+        Parameters
+        ----------
+        name: :class:`str` | :class:`.Event`
+            The name of the event to listen for. Defaults to the function's name.
+        guild_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these guilds.
+            Events outside of a guild (e.g. in DMs) are ignored.
+
+            .. versionadded:: |vnext|
+        channel_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these channels.
+
+            .. versionadded:: |vnext|
+        ignore_bots: :class:`bool`
+            Whether to ignore events by bots, e.g. messages or interactions
+            authored by a bot. Defaults to ``False``.
+
+            .. versionadded:: |vnext|
+        check: :class:`~collections.abc.Callable`\[..., :class:`bool`] | :data:`None`
+            A predicate called with the event's arguments, the listener is only
+            called if it returns ``True``.
+
+            .. versionadded:: |vnext|
+        dispatch_mode: :class:`.EventDispatchMode` | :data:`None`
+            How to run the listener when the event is dispatched.
+            Defaults to the client's ``event_dispatch_mode``.
+
+            .. versionadded:: |vnext|
+        coalesce: :class:`float` | :data:`None`
+            If set, events arriving within this many seconds of each other are coalesced
+            into a single call of the listener, per key returned by ``coalesce_key``.
+            The listener is called once the window (starting with the first event) is over,
+            with the arguments of the latest event; for the built-in events with ``before``
+            and ``after`` arguments (e.g. :func:`on_member_update`), ``before`` is taken
+            from the first event instead. The cache is still updated for every event.
+
+            This is useful for high-churn events where only the final state matters,
+            e.g. :func:`on_presence_update` or :func:`on_voice_state_update`.
+
+            .. versionadded:: |vnext|
+        coalesce_key: :class:`~collections.abc.Callable`\[..., :class:`~collections.abc.Hashable`] | :data:`None`
+            A function called with the event's arguments, returning the key that events
+            are coalesced by. Defaults to the ID of the entity the event is about
+            (e.g. the member or channel) along with its user, message, channel and guild
+            where applicable. Custom events should usually provide their own key.
+
+            .. versionadded:: |vnext|
+
         Raises
         ------
         TypeError
@@ -896,7 +2041,17 @@ class Client:
             raise TypeError(msg)
 
         def decorator(func: CoroT) -> CoroT:
-            self.add_listener(func, name)
+            self.add_listener(
+                func,
+                name,
+                guild_ids=guild_ids,
+                channel_ids=channel_ids,
+                ignore_bots=ignore_bots,
+                check=check,
+                dispatch_mode=dispatch_mode,
+                coalesce=coalesce,
+                coalesce_key=coalesce_key,
+            )
             return func
 
         return decorator
@@ -914,6 +2069,80 @@ class Client:
         """
         return types.MappingProxyType(self.extra_events)
 
+    def add_http_metrics_listener(self, func: Callable[[RequestMetrics], Any]) -> None:
+        r"""Registers a function that is called with the :class:`RequestMetrics`
+        of every REST request once it has finished, successfully or not.
+
+        The function must be a regular (non-coroutine) function, and should
+        return quickly as it is called on the event loop after each request.
+        Exceptions raised by it are logged and otherwise ignored.
+
+        .. versionadded:: |vnext|
+
+        Parameters
+        ----------
+        func: :class:`~collections.abc.Callable`\[[:class:`RequestMetrics`], Any]
+            The function to call.
+
+        Raises
+        ------
+        TypeError
+            The function is a coroutine function.
+        """
+        if inspect.iscoroutinefunction(func):
+            msg = "HTTP metrics listeners must not be coroutines"
+            raise TypeError(msg)
+
+        self.http.add_metrics_listener(func)
+
+    def remove_http_metrics_listener(self, func: Callable[[RequestMetrics], Any]) -> None:
+        r"""Removes a function previously registered using :meth:`add_http_metrics_listener`.
+
+        .. versionadded:: |vnext|
+
+        Parameters
+        ----------
+        func: :class:`~collections.abc.Callable`\[[:class:`RequestMetrics`], Any]
+            The function to remove.
+        """
+        self.http.remove_metrics_listener(func)
+
+    def listener_stats(self, event: str | Event | None = None) -> list[ListenerStats]:
+        r"""Returns the execution statistics of event handlers,
+        if enabled using the ``listener_profiling`` parameter.
+
+        .. versionadded:: |vnext|
+
+        Parameters
+        ----------
+        event: :class:`str` | :class:`.Event` | :data:`None`
+            If given, only return the statistics of handlers of this event.
+            Like in :meth:`wait_for`, the name is given without the ``on_`` prefix.
+
+        Returns
+        -------
+        :class:`list`\[:class:`ListenerStats`]
+            The statistics, sorted by total run time in descending order.
+            Empty if profiling is disabled.
+        """
+        if self._listener_profiler is None:
+            return []
+        event_name = None
+        if event is not None:
+            event_name = "on_" + (event.lower() if isinstance(event, str) else event.value)
+        return self._listener_profiler.stats(event_name)
+
+    def reset_listener_stats(self) -> None:
+        """Resets the statistics returned by :meth:`listener_stats`.
+
+        Handlers that are still running remain counted in :attr:`ListenerStats.running`,
+        and their run time is recorded once they finish.
+
+        .. versionadded:: |vnext|
+        """
+        if self._listener_profiler is not None:
+            self._listener_profiler.reset()
+
     async def on_error(self, event_method: str, *args: Any, **kwargs: Any) -> None:
         """|coro|
 
@@ -980,6 +2209,11 @@ class Client:
 
         .. versionadded:: 1.4
 
+        .. versionchanged:: |vnext|
+            :class:`AutoShardedClient` spaces out IDENTIFYs according to
+            :attr:`SessionStartLimit.max_concurrency` itself, and only calls
+            this hook if it is overridden.
+
         Parameters
         ----------
         shard_id: :class:`int`
@@ -1071,6 +2305,9 @@ class Client:
         if not ignore_session_start_limit and self.session_start_limit.remaining == 0:
             raise SessionStartLimitReached(self.session_start_limit)
 
+        if self.loop_monitor is not None:
+            await self.loop_monitor._start(self)
+
         ws_params: _WebSocketParams = {
             "initial": True,
             "shard_id": self.shard_id,
@@ -1094,6 +2331,7 @@ class Client:
                 ws_params["initial"] = False
 
                 while True:
+                    await self._wait_for_gateway_reads()
                     await self.ws.poll_event()
 
             except ReconnectWebSocket as e:
@@ -1193,6 +2431,7 @@ class Client:
         if self.ws is not None and self.ws.open:  # pyright: ignore[reportUnnecessaryComparison]
             await self.ws.close(code=1000)
 
+        await self._close_event_handling()
         await self.http.close()
         self._ready.clear()
 
@@ -1703,6 +2942,11 @@ class Client:
         *,
         check: Callable[..., bool] | None = None,
         timeout: float | None = None,
+        channel_id: int | None = None,
+        message_id: int | None = None,
+        author_id: int | None = None,
+        guild_id: int | None = None,
+        custom_id: str | None = None,
     ) -> Any:
         r"""|coro|
 
@@ -1724,6 +2968,13 @@ class Client:
 
         This function returns the **first event that meets the requirements**.
 
+        Instead of comparing IDs in ``check``, prefer passing them as filters
+        (e.g. ``channel_id``). Listeners are indexed by their filters, so incoming events
+        are only checked against the listeners that can possibly match them,
+        which is considerably faster when many listeners are waiting at the same time.
+        If both filters and ``check`` are given, ``check`` is only called for events
+        matching all filters.
+
         Examples
         --------
         Waiting for a user reply: ::
@@ -1771,6 +3022,17 @@ class Client:
                     else:
                         await channel.send('\N{THUMBS UP SIGN}')
 
+        Waiting for a reply in the same channel using filters: ::
+
+            @client.event
+            async def on_message(message):
+                if message.content.startswith('$name'):
+                    await message.channel.send('What is your name?')
+                    reply = await client.wait_for(
+                        'message', channel_id=message.channel.id, author_id=message.author.id
+                    )
+                    await message.channel.send(f'Hello {reply.content}!')
+
 
         Parameters
         ----------
@@ -1784,6 +3046,29 @@ class Client:
         timeout: :class:`float` | :data:`None`
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        channel_id: :class:`int` | :data:`None`
+            Only match events in the channel with this ID, e.g. messages, interactions
+            or (raw) reactions.
+
+            .. versionadded:: |vnext|
+        message_id: :class:`int` | :data:`None`
+            Only match events for the message with this ID, e.g. message edits,
+            reactions or component interactions.
+
+            .. versionadded:: |vnext|
+        author_id: :class:`int` | :data:`None`
+            Only match events by the user with this ID, i.e. the author of messages
+            and interactions, or the user of reaction and typing events.
+
+            .. versionadded:: |vnext|
+        guild_id: :class:`int` | :data:`None`
+            Only match events in the guild with this ID.
+
+            .. versionadded:: |vnext|
+        custom_id: :class:`str` | :data:`None`
+            Only match component or modal interactions with this custom ID.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -1798,23 +3083,37 @@ class Client:
             :ref:`event <disnake_api_events>`.
         """
         future = self.loop.create_future()
-        if check is None:
-
-            def _check(*args) -> bool:
-                return True
-
-            check = _check
+        filters = {
+            field: value
+            for field, value in (
+                ("channel_id", channel_id),
+                ("message_id", message_id),
+                ("author_id", author_id),
+                ("guild_id", guild_id),
+                ("custom_id", custom_id),
+            )
+            if value is not None
+        }
+        listener = _WaitForListener(future, check, filters)
 
         ev = event.lower() if isinstance(event, str) else event.value
         try:
             listeners = self._listeners[ev]
         except KeyError:
-            listeners = []
-            self._listeners[ev] = listeners
+            listeners = self._listeners[ev] = _WaitForListeners()
 
-        listeners.append((future, check))
+        listeners.add(listener)
+        future.add_done_callback(lambda _: self._remove_wait_for_listener(ev, listener))
         return asyncio.wait_for(future, timeout)
 
+    def _remove_wait_for_listener(self, event: str, listener: _WaitForListener) -> None:
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            return
+        listeners.remove(listener)
+        if not listeners:
+            del self._listeners[event]
+
     # event registration
 
     def event(self, coro: CoroT) -> CoroT:
@@ -1916,6 +3215,7 @@ class Client:
         before: SnowflakeTime | None = None,
         after: SnowflakeTime | None = None,
         with_counts: bool = True,
+        prefetch: int = 0,
     ) -> GuildIterator:
         """Retrieves an :class:`.AsyncIterator` that enables receiving your guilds.
 
@@ -1963,6 +3263,14 @@ class Client:
 
             .. versionadded:: 2.10
 
+        prefetch: :class:`int`
+            The number of pages to request in advance while the current page is being processed,
+            which reduces the time spent waiting for responses when retrieving many guilds.
+            Use :meth:`.AsyncIterator.aclose` to cancel pending requests if the iterator is not exhausted.
+            Defaults to ``0``.
+
+            .. versionadded:: |vnext|
+
         Raises
         ------
         HTTPException
@@ -1973,7 +3281,14 @@ class Client:
         :class:`.Guild`
             The guild with the guild data parsed.
         """
-        return GuildIterator(self, limit=limit, before=before, after=after, with_counts=with_counts)
+        return GuildIterator(
+            self,
+            limit=limit,
+            before=before,
+            after=after,
+            with_counts=with_counts,
+            prefetch=prefetch,
+        )
 
     async def fetch_template(self, code: Template | str) -> Template:
         """|coro|
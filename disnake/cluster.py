@@ -0,0 +1,648 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import logging
+import multiprocessing
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .errors import ClientException
+from .http import HTTPClient
+from .shard import AutoShardedClient, _IdentifyLimiter
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+
+__all__ = (
+    "ClusterManager",
+    "ClusterIPC",
+    "ClusterGuild",
+)
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ClusterGuild:
+    """Basic information about a guild in another cluster, returned by :meth:`ClusterIPC.get_guild`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The guild ID.
+    name: :class:`str`
+        The guild's name.
+    member_count: :class:`int` | :data:`None`
+        The guild's member count, if available.
+    shard_id: :class:`int`
+        The ID of the shard the guild belongs to.
+    cluster_id: :class:`int`
+        The ID of the cluster the guild belongs to.
+    """
+
+    id: int
+    name: str
+    member_count: int | None
+    shard_id: int
+    cluster_id: int
+
+
+def _split_shards(shard_count: int, clusters: int) -> list[list[int]]:
+    # contiguous, evenly sized chunks of shard IDs
+    size, extra = divmod(shard_count, clusters)
+    result: list[list[int]] = []
+    start = 0
+    for i in range(clusters):
+        end = start + size + (i < extra)
+        result.append(list(range(start, end)))
+        start = end
+    return result
+
+
+class _Channel:
+    """One end of the pipe between the cluster manager and a cluster process.
+
+    Both ends can send requests to the other one, and handle requests of the other one
+    using ``handler``. Messages are read in a separate thread, as pipes can't be
+    read asynchronously on all platforms.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        handler: Callable[[str, tuple[Any, ...]], Awaitable[Any]],
+        *,
+        on_close: Callable[[], Any] | None = None,
+    ) -> None:
+        self._conn = conn
+        self._handler = handler
+        self._on_close = on_close
+        self._loop = asyncio.get_running_loop()
+        self._ids = itertools.count()
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self._thread = threading.Thread(target=self._read, name="disnake: cluster ipc", daemon=True)
+        self._thread.start()
+
+    def _read(self) -> None:
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            try:
+                self._loop.call_soon_threadsafe(self._receive, message)
+            except RuntimeError:
+                # loop is closed
+                return
+        try:
+            self._loop.call_soon_threadsafe(self._disconnected)
+        except RuntimeError:
+            pass
+
+    def _receive(self, message: tuple[Any, ...]) -> None:
+        kind, request_id = message[0], message[1]
+        if kind == "call":
+            task = asyncio.create_task(self._respond(request_id, message[2], message[3]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+
+        future = self._pending.pop(request_id, None)
+        if future is None or future.done():
+            return
+        if kind == "result":
+            future.set_result(message[2])
+        else:
+            future.set_exception(ClientException(f"Cluster request failed: {message[2]}"))
+
+    async def _respond(self, request_id: int, name: str, args: tuple[Any, ...]) -> None:
+        try:
+            result = await self._handler(name, args)
+        except Exception as e:
+            _log.exception("Failed to handle cluster request %r", name)
+            response = ("error", request_id, f"{type(e).__name__}: {e}")
+        else:
+            response = ("result", request_id, result)
+
+        # the connection may have been closed while handling the request,
+        # e.g. when the request was to close the client
+        if self._closed:
+            return
+        try:
+            self._send(response)
+        except (ClientException, OSError):
+            return
+        except Exception as e:
+            # e.g. the result isn't picklable
+            try:
+                self._send(("error", request_id, f"{type(e).__name__}: {e}"))
+            except (ClientException, OSError):
+                pass
+
+    def _send(self, message: tuple[Any, ...]) -> None:
+        if self._closed:
+            msg = "The cluster connection is closed"
+            raise ClientException(msg)
+        self._conn.send(message)
+
+    def _disconnected(self) -> None:
+        self._closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ClientException("The cluster connection was closed"))
+        self._pending.clear()
+        if self._on_close is not None:
+            self._on_close()
+
+    async def request(self, name: str, args: tuple[Any, ...] = ()) -> Any:
+        request_id = next(self._ids)
+        future = self._loop.create_future()
+        self._pending[request_id] = future
+        try:
+            self._send(("call", request_id, name, args))
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    def close(self) -> None:
+        self._closed = True
+        self._conn.close()
+
+
+class _ClusterQueries:
+    # queries available both in the manager and in cluster processes
+
+    shard_count: int | None
+    cluster_shards: list[list[int]]
+
+    async def _query(
+        self, targets: Sequence[int] | None, name: str, args: tuple[Any, ...] = ()
+    ) -> list[Any]:
+        raise NotImplementedError
+
+    def cluster_for_guild(self, guild_id: int) -> int:
+        """Returns the ID of the cluster the given guild belongs to.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The guild ID.
+
+        Returns
+        -------
+        :class:`int`
+            The cluster ID.
+        """
+        if self.shard_count is None:
+            msg = "The cluster layout is not known yet"
+            raise ClientException(msg)
+        shard_id = (guild_id >> 22) % self.shard_count
+        return next(i for i, shard_ids in enumerate(self.cluster_shards) if shard_id in shard_ids)
+
+    async def guild_count(self) -> int:
+        """|coro|
+
+        Returns the total number of guilds across all clusters.
+
+        :return type: :class:`int`
+        """
+        return sum(await self._query(None, "guild_count"))
+
+    async def get_guild(self, guild_id: int) -> ClusterGuild | None:
+        """|coro|
+
+        Returns information about a guild from the cluster it belongs to.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The guild ID.
+
+        Returns
+        -------
+        :class:`ClusterGuild` | :data:`None`
+            The guild, or :data:`None` if it wasn't found.
+        """
+        (guild,) = await self._query([self.cluster_for_guild(guild_id)], "get_guild", (guild_id,))
+        return guild
+
+    async def latencies(self) -> list[tuple[int, float]]:
+        r"""|coro|
+
+        Returns the latencies of all shards across all clusters, like :attr:`AutoShardedClient.latencies`.
+
+        :return type: :class:`list`\[:class:`tuple`\[:class:`int`, :class:`float`]]
+        """
+        results = await self._query(None, "latencies")
+        return sorted(latency for latencies in results for latency in latencies)
+
+    async def broadcast(self, func: Callable[..., Any], *args: Any) -> list[Any]:
+        r"""|coro|
+
+        Calls a function in every cluster, with the cluster's client and the given arguments,
+        and returns the results in the order of the cluster IDs.
+
+        The function may be a coroutine function. It must be defined at the top level
+        of a module, and the arguments and return values must be picklable.
+
+        Parameters
+        ----------
+        func: :class:`~collections.abc.Callable`
+            The function to call.
+        *args: Any
+            The arguments to pass to the function, after the client.
+
+        Returns
+        -------
+        :class:`list`
+            The results of each cluster.
+        """
+        return await self._query(None, "broadcast", (func, args))
+
+
+class ClusterIPC(_ClusterQueries):
+    r"""The connection of a cluster process to its :class:`ClusterManager`, available as
+    :attr:`AutoShardedClient.cluster` in clients started by a manager.
+
+    This allows querying the other clusters, e.g. to get the total guild count.
+
+    This should not be created manually.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    client: :class:`AutoShardedClient`
+        The client of this cluster.
+    cluster_id: :class:`int`
+        The ID of this cluster.
+    cluster_shards: :class:`list`\[:class:`list`\[:class:`int`]]
+        The shard IDs of every cluster, by cluster ID.
+    shard_count: :class:`int`
+        The total number of shards across all clusters.
+    """
+
+    def __init__(
+        self,
+        client: AutoShardedClient,
+        conn: Connection,
+        *,
+        cluster_id: int,
+        cluster_shards: list[list[int]],
+        shard_count: int,
+    ) -> None:
+        self.client: AutoShardedClient = client
+        self.cluster_id: int = cluster_id
+        self.cluster_shards: list[list[int]] = cluster_shards
+        self.shard_count: int | None = shard_count
+        self._channel = _Channel(conn, self._handle)
+
+    def __repr__(self) -> str:
+        return f"<ClusterIPC cluster_id={self.cluster_id} clusters={len(self.cluster_shards)}>"
+
+    @property
+    def shard_ids(self) -> list[int]:
+        r""":class:`list`\[:class:`int`]: The shard IDs of this cluster."""
+        return self.cluster_shards[self.cluster_id]
+
+    async def _query(
+        self, targets: Sequence[int] | None, name: str, args: tuple[Any, ...] = ()
+    ) -> list[Any]:
+        return await self._channel.request("query", (targets, name, args))
+
+    async def _wait_for_identify(self, shard_id: int) -> None:
+        await self._channel.request("identify", (shard_id,))
+
+    async def _handle(self, name: str, args: tuple[Any, ...]) -> Any:
+        client = self.client
+        if name == "guild_count":
+            return len(client.guilds)
+        if name == "get_guild":
+            guild = client.get_guild(args[0])
+            if guild is None:
+                return None
+            return ClusterGuild(
+                id=guild.id,
+                name=guild.name,
+                member_count=guild.member_count,
+                shard_id=guild.shard_id,
+                cluster_id=self.cluster_id,
+            )
+        if name == "latencies":
+            return client.latencies
+        if name == "broadcast":
+            func, func_args = args
+            result = func(client, *func_args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        if name == "close":
+            await client.close()
+            return None
+        msg = f"Unknown cluster request {name!r}"
+        raise ClientException(msg)
+
+    def _close(self) -> None:
+        self._channel.close()
+
+
+class _Cluster:
+    __slots__ = ("process", "channel")
+
+    def __init__(self, process: BaseProcess, channel: _Channel) -> None:
+        self.process = process
+        self.channel = channel
+
+
+def _run_cluster(
+    factory: Callable[..., AutoShardedClient],
+    token: str,
+    conn: Connection,
+    cluster_id: int,
+    cluster_shards: list[list[int]],
+    shard_count: int,
+) -> None:
+    # entry point of cluster processes
+    try:
+        asyncio.run(_cluster_main(factory, token, conn, cluster_id, cluster_shards, shard_count))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _cluster_main(
+    factory: Callable[..., AutoShardedClient],
+    token: str,
+    conn: Connection,
+    cluster_id: int,
+    cluster_shards: list[list[int]],
+    shard_count: int,
+) -> None:
+    client = factory(shard_ids=cluster_shards[cluster_id], shard_count=shard_count)
+    if not isinstance(client, AutoShardedClient):
+        msg = f"The client factory must return an AutoShardedClient, not {type(client).__name__!r}"
+        raise TypeError(msg)
+
+    client.cluster = ipc = ClusterIPC(
+        client,
+        conn,
+        cluster_id=cluster_id,
+        cluster_shards=cluster_shards,
+        shard_count=shard_count,
+    )
+    try:
+        await client.start(token)
+    finally:
+        if not client.is_closed():
+            await client.close()
+        ipc._close()
+
+
+class ClusterManager(_ClusterQueries):
+    r"""Runs a bot in multiple processes (clusters), each running an
+    :class:`AutoShardedClient` with a subset of the bot's shards.
+
+    Since every process has its own event loop, this allows using more than
+    one CPU core for large bots. The manager coordinates the IDENTIFYs of all clusters
+    according to the ``max_concurrency`` of the bot's session start limit,
+    restarts clusters that exit unexpectedly, and relays queries between clusters
+    (see :class:`ClusterIPC`).
+
+    Clients are created in each process by calling ``factory``, which must be defined
+    at the top level of a module: ::
+
+        def create_bot(**options):
+            bot = commands.InteractionBot(**options)
+            bot.load_extensions("cogs")
+            return bot
+
+        if __name__ == "__main__":
+            disnake.ClusterManager(create_bot, TOKEN, clusters=4).run()
+
+    .. versionadded:: |vnext|
+
+    Parameters
+    ----------
+    factory: :class:`~collections.abc.Callable`\[..., :class:`AutoShardedClient`]
+        Called in every cluster process with the ``shard_ids`` and ``shard_count``
+        keyword arguments, returning the (not yet started) client of the cluster.
+    token: :class:`str`
+        The bot token.
+    clusters: :class:`int`
+        The number of cluster processes to run.
+    shard_count: :class:`int` | :data:`None`
+        The total number of shards. Defaults to the number recommended by Discord.
+    restart_delay: :class:`float`
+        The number of seconds to wait before restarting a cluster that exited unexpectedly.
+        Defaults to ``5``.
+    mp_context: :class:`multiprocessing.context.BaseContext` | :data:`None`
+        The multiprocessing context to create processes with.
+        Defaults to the ``spawn`` context.
+
+    Attributes
+    ----------
+    cluster_shards: :class:`list`\[:class:`list`\[:class:`int`]]
+        The shard IDs of every cluster, by cluster ID. Empty until the manager was started.
+    shard_count: :class:`int` | :data:`None`
+        The total number of shards.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., AutoShardedClient],
+        token: str,
+        *,
+        clusters: int,
+        shard_count: int | None = None,
+        restart_delay: float = 5.0,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if clusters < 1:
+            msg = "clusters must be at least 1"
+            raise ValueError(msg)
+
+        self.factory: Callable[..., AutoShardedClient] = factory
+        self.token: str = token
+        self.clusters: int = clusters
+        self.shard_count: int | None = shard_count
+        self.restart_delay: float = restart_delay
+        self.cluster_shards: list[list[int]] = []
+        self._mp_context: BaseContext = mp_context or multiprocessing.get_context("spawn")
+        self._clusters: dict[int, _Cluster] = {}
+        self._identify: _IdentifyLimiter = _IdentifyLimiter(1)
+        self._closing = False
+        self._closed: asyncio.Event | None = None
+        self._restarts: set[asyncio.Task[None]] = set()
+
+    def __repr__(self) -> str:
+        return f"<ClusterManager clusters={self.clusters} shard_count={self.shard_count}>"
+
+    async def _query(
+        self, targets: Sequence[int] | None, name: str, args: tuple[Any, ...] = ()
+    ) -> list[Any]:
+        ids = range(len(self.cluster_shards)) if targets is None else targets
+        results = []
+        for cluster_id in ids:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                msg = f"Cluster {cluster_id} is not running"
+                raise ClientException(msg)
+            results.append(cluster.channel.request(name, args))
+        return await asyncio.gather(*results)
+
+    async def _handle(self, cluster_id: int, name: str, args: tuple[Any, ...]) -> Any:
+        if name == "identify":
+            (shard_id,) = args
+            await self._identify.acquire(shard_id)
+            _log.debug("Allowing shard ID %s of cluster %s to IDENTIFY.", shard_id, cluster_id)
+            return None
+        if name == "query":
+            targets, query, query_args = args
+            return await self._query(targets, query, query_args)
+        msg = f"Unknown cluster request {name!r}"
+        raise ClientException(msg)
+
+    def _attach(self, cluster_id: int, process: BaseProcess, conn: Connection) -> None:
+        async def handle(name: str, args: tuple[Any, ...]) -> Any:
+            return await self._handle(cluster_id, name, args)
+
+        channel = _Channel(conn, handle, on_close=lambda: self._on_cluster_exit(cluster_id))
+        self._clusters[cluster_id] = _Cluster(process, channel)
+
+    def _spawn(self, cluster_id: int) -> None:
+        assert self.shard_count is not None
+        parent_conn, child_conn = self._mp_context.Pipe()
+        process = self._mp_context.Process(
+            target=_run_cluster,
+            args=(
+                self.factory,
+                self.token,
+                child_conn,
+                cluster_id,
+                self.cluster_shards,
+                self.shard_count,
+            ),
+            name=f"disnake-cluster-{cluster_id}",
+        )
+        process.start()
+        # only the child process should hold this end, so the parent notices when it exits
+        child_conn.close()
+        self._attach(cluster_id, process, parent_conn)
+        _log.info(
+            "Started cluster %s with shard IDs %s (pid %s).",
+            cluster_id,
+            self.cluster_shards[cluster_id],
+            process.pid,
+        )
+
+    def _on_cluster_exit(self, cluster_id: int) -> None:
+        cluster = self._clusters.pop(cluster_id, None)
+        if cluster is None:
+            return
+        task = asyncio.create_task(self._reap(cluster_id, cluster))
+        self._restarts.add(task)
+        task.add_done_callback(self._restarts.discard)
+
+    async def _reap(self, cluster_id: int, cluster: _Cluster) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, cluster.process.join)
+        if self._closing:
+            return
+
+        _log.warning(
+            "Cluster %s exited unexpectedly with exit code %s, restarting in %.2fs.",
+            cluster_id,
+            cluster.process.exitcode,
+            self.restart_delay,
+        )
+        await asyncio.sleep(self.restart_delay)
+        if not self._closing:
+            self._spawn(cluster_id)
+
+    async def start(self) -> None:
+        """|coro|
+
+        Starts all cluster processes, and waits until the manager is closed.
+        """
+        self._closed = asyncio.Event()
+
+        http = HTTPClient(loop=asyncio.get_running_loop())
+        try:
+            await http.static_login(self.token)
+            recommended_shards, _, session_start_limit = await http.get_bot_gateway()
+        finally:
+            await http.close()
+
+        if self.shard_count is None:
+            self.shard_count = recommended_shards
+        if self.clusters > self.shard_count:
+            msg = f"Cannot run {self.clusters} clusters with only {self.shard_count} shards"
+            raise ValueError(msg)
+
+        self._identify = _IdentifyLimiter(session_start_limit["max_concurrency"])
+        self.cluster_shards = _split_shards(self.shard_count, self.clusters)
+        for cluster_id in range(self.clusters):
+            self._spawn(cluster_id)
+
+        await self._closed.wait()
+
+    async def close(self, *, timeout: float = 30.0) -> None:
+        """|coro|
+
+        Closes the clients of all clusters and waits for their processes to exit.
+        Processes that don't exit within ``timeout`` seconds are terminated.
+        """
+        if self._closing:
+            return
+        self._closing = True
+        for task in self._restarts:
+            task.cancel()
+
+        clusters = list(self._clusters.values())
+        self._clusters.clear()
+
+        async def stop(cluster: _Cluster) -> None:
+            try:
+                await asyncio.wait_for(cluster.channel.request("close"), timeout)
+            except (ClientException, asyncio.TimeoutError):
+                pass
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, cluster.process.join, timeout)
+            if cluster.process.is_alive():
+                _log.warning(
+                    "Cluster process %s did not exit, terminating it.", cluster.process.pid
+                )
+                cluster.process.terminate()
+            cluster.channel.close()
+
+        await asyncio.gather(*(stop(cluster) for cluster in clusters))
+        if self._closed is not None:
+            self._closed.set()
+
+    def run(self) -> None:
+        """Starts the clusters and blocks until the manager is closed,
+        e.g. using :kbd:`Ctrl-C`.
+
+        This handles creating and closing the event loop, similar to :meth:`Client.run`.
+        """
+
+        async def runner() -> None:
+            try:
+                await self.start()
+            finally:
+                await self.close()
+
+        try:
+            asyncio.run(runner())
+        except KeyboardInterrupt:
+            _log.info("Received signal to terminate the clusters.")
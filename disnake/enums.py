@@ -64,6 +64,8 @@ __all__ = (
     "ThreadSortOrder",
     "ThreadLayout",
     "Event",
+    "EventDispatchMode",
+    "EventOverflowPolicy",
     "ApplicationRoleConnectionMetadataType",
     "ApplicationEventWebhookStatus",
     "OnboardingPromptType",
@@ -2316,6 +2318,58 @@ class Event(Enum):
     """
 
 
+class EventDispatchMode(Enum):
+    """Specifies how event handlers are run when an event is dispatched.
+
+    .. versionadded:: |vnext|
+    """
+
+    task = "task"
+    """Every handler runs in its own task. This is the default."""
+    eager = "eager"
+    """Every handler starts running immediately when the event is dispatched,
+    and a task is only created if it has to wait for something (e.g. a request).
+    Handlers that finish without waiting don't need a task at all.
+
+    On Python 3.11 and earlier, this behaves like :attr:`task`.
+    """
+    batch = "batch"
+    """All handlers of an event using this mode run one after another in a single task.
+    A slow handler delays the ones after it, so this is best suited for short handlers.
+    """
+    process = "process"
+    """The handler runs in the client's ``worker_pool`` (usually a
+    :class:`~concurrent.futures.ProcessPoolExecutor`), keeping CPU-heavy handlers
+    from blocking the event loop.
+
+    Handlers using this mode must be regular (non-coroutine) functions defined at
+    the top level of a module, so they can be used in another process.
+    Instead of the event's objects, they receive picklable snapshots, such as
+    :class:`WorkerMessage` or :class:`WorkerUser`, and may return one or more
+    :class:`WorkerAction` instances (e.g. :class:`SendMessage`),
+    which are executed by the client.
+
+    This can only be used for individual listeners, not as the client's default mode.
+    """
+
+
+class EventOverflowPolicy(Enum):
+    """Specifies what happens when the queue of an :class:`EventLimit` is full.
+
+    .. versionadded:: |vnext|
+    """
+
+    drop_oldest = "drop_oldest"
+    """Discard the oldest queued event to make room for the new one."""
+    drop_newest = "drop_newest"
+    """Discard the new event."""
+    block = "block"
+    """Queue the new event, and stop reading from the gateway until there is room in the queue again.
+    Note that the connection may be considered dead and get resumed if reading
+    is blocked for longer than the ``heartbeat_timeout`` of the client.
+    """
+
+
 class ApplicationRoleConnectionMetadataType(Enum):
     """Represents the type of a role connection metadata value.
 
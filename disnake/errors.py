@@ -23,6 +23,7 @@ __all__ = (
     "Forbidden",
     "NotFound",
     "DiscordServerError",
+    "RateLimited",
     "InvalidData",
     "WebhookTokenMissing",
     "LoginFailure",
@@ -162,6 +163,28 @@ class DiscordServerError(HTTPException):
     pass
 
 
+class RateLimited(DiscordException):
+    """Exception that's raised when a request is given up on because waiting
+    for a rate limit would exceed the deadline of its :class:`RetryPolicy`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    retry_after: :class:`float` | :data:`None`
+        The number of seconds until the rate limit resets, or :data:`None`
+        if the deadline was exceeded while waiting for another request in the same bucket.
+    """
+
+    def __init__(self, retry_after: float | None) -> None:
+        self.retry_after: float | None = retry_after
+        if retry_after is None:
+            message = "Request deadline exceeded while waiting for a rate limit."
+        else:
+            message = f"Too many requests. Retry in {retry_after:.2f} seconds."
+        super().__init__(message)
+
+
 class InvalidData(ClientException):
     """Exception that's raised when the library encounters unknown
     or invalid data from Discord.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import disnake
@@ -12,12 +12,15 @@ from .interaction_bot_base import InteractionBotBase
 
 if TYPE_CHECKING:
     import asyncio
+    from concurrent.futures import Executor
 
     import aiohttp
     from typing_extensions import Self
 
     from disnake.activity import BaseActivity
-    from disnake.enums import Status
+    from disnake.cdn import CDNCache
+    from disnake.client import EventLimit, ListenerProfiling
+    from disnake.enums import Event, EventDispatchMode, Status
     from disnake.flags import (
         ApplicationInstallTypes,
         Intents,
@@ -25,9 +28,12 @@ if TYPE_CHECKING:
         MemberCacheFlags,
     )
     from disnake.gateway import GatewayParams
+    from disnake.http import RetryPolicy
     from disnake.i18n import LocalizationProtocol
     from disnake.mentions import AllowedMentions
     from disnake.message import Message
+    from disnake.monitor import LoopMonitor
+    from disnake.ratelimit import RateLimitStore
 
     from ._types import MaybeCoro
     from .bot_base import PrefixType
@@ -241,6 +247,17 @@ class Bot(BotBase, InteractionBotBase, disnake.Client):
             connector: aiohttp.BaseConnector | None = None,
             proxy: str | None = None,
             proxy_auth: aiohttp.BasicAuth | None = None,
+            http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+            ratelimit_store: RateLimitStore | None = None,
+            cdn_cache: CDNCache | None = None,
+            cdn_connections_per_host: int = 10,
+            retry_policy: RetryPolicy | None = None,
+            route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+            event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+            event_limits: Mapping[str | Event, EventLimit] | None = None,
+            listener_profiling: ListenerProfiling | None = None,
+            loop_monitor: LoopMonitor | None = None,
+            worker_pool: Executor | None = None,
             assume_unsync_clock: bool = True,
             max_messages: int | None = 1000,
             application_id: int | None = None,
@@ -291,6 +308,17 @@ class AutoShardedBot(BotBase, InteractionBotBase, disnake.AutoShardedClient):
             connector: aiohttp.BaseConnector | None = None,
             proxy: str | None = None,
             proxy_auth: aiohttp.BasicAuth | None = None,
+            http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+            ratelimit_store: RateLimitStore | None = None,
+            cdn_cache: CDNCache | None = None,
+            cdn_connections_per_host: int = 10,
+            retry_policy: RetryPolicy | None = None,
+            route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+            event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+            event_limits: Mapping[str | Event, EventLimit] | None = None,
+            listener_profiling: ListenerProfiling | None = None,
+            loop_monitor: LoopMonitor | None = None,
+            worker_pool: Executor | None = None,
             assume_unsync_clock: bool = True,
             max_messages: int | None = 1000,
             application_id: int | None = None,
@@ -427,6 +455,17 @@ class InteractionBot(InteractionBotBase, disnake.Client):
             connector: aiohttp.BaseConnector | None = None,
             proxy: str | None = None,
             proxy_auth: aiohttp.BasicAuth | None = None,
+            http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+            ratelimit_store: RateLimitStore | None = None,
+            cdn_cache: CDNCache | None = None,
+            cdn_connections_per_host: int = 10,
+            retry_policy: RetryPolicy | None = None,
+            route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+            event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+            event_limits: Mapping[str | Event, EventLimit] | None = None,
+            listener_profiling: ListenerProfiling | None = None,
+            loop_monitor: LoopMonitor | None = None,
+            worker_pool: Executor | None = None,
             assume_unsync_clock: bool = True,
             max_messages: int | None = 1000,
             application_id: int | None = None,
@@ -470,6 +509,17 @@ class AutoShardedInteractionBot(InteractionBotBase, disnake.AutoShardedClient):
             connector: aiohttp.BaseConnector | None = None,
             proxy: str | None = None,
             proxy_auth: aiohttp.BasicAuth | None = None,
+            http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+            ratelimit_store: RateLimitStore | None = None,
+            cdn_cache: CDNCache | None = None,
+            cdn_connections_per_host: int = 10,
+            retry_policy: RetryPolicy | None = None,
+            route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+            event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+            event_limits: Mapping[str | Event, EventLimit] | None = None,
+            listener_profiling: ListenerProfiling | None = None,
+            loop_monitor: LoopMonitor | None = None,
+            worker_pool: Executor | None = None,
             assume_unsync_clock: bool = True,
             max_messages: int | None = 1000,
             application_id: int | None = None,
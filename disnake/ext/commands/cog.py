@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import inspect
 import logging
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Hashable, Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,7 +14,7 @@ from typing import (
 
 import disnake
 import disnake.utils
-from disnake.enums import Event
+from disnake.enums import Event, EventDispatchMode
 
 from ._types import _BaseCommand
 from .base_core import InvokableApplicationCommand
@@ -385,8 +385,19 @@ class Cog(metaclass=CogMeta):
         return getattr(method.__func__, "__cog_special_method__", method)
 
     @classmethod
-    def listener(cls, name: str | Event = MISSING) -> Callable[[FuncT], FuncT]:
-        """A decorator that marks a function as a listener.
+    def listener(
+        cls,
+        name: str | Event = MISSING,
+        *,
+        guild_ids: Iterable[int] | None = None,
+        channel_ids: Iterable[int] | None = None,
+        ignore_bots: bool = False,
+        check: Callable[..., bool] | None = None,
+        dispatch_mode: EventDispatchMode | None = None,
+        coalesce: float | None = None,
+        coalesce_key: Callable[..., Hashable] | None = None,
+    ) -> Callable[[FuncT], FuncT]:
+        r"""A decorator that marks a function as a listener.
 
         This is the cog equivalent of :meth:`.Bot.listen`.
 
@@ -395,6 +406,47 @@ class Cog(metaclass=CogMeta):
         name: :class:`str` | :class:`.Event`
             The name of the event being listened to. If not provided, it
             defaults to the function's name.
+        guild_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these guilds.
+            See :meth:`.Bot.listen` for details.
+
+            .. versionadded:: |vnext|
+        channel_ids: :class:`~collections.abc.Iterable`\[:class:`int`] | :data:`None`
+            Only call the listener for events in one of these channels.
+
+            .. versionadded:: |vnext|
+        ignore_bots: :class:`bool`
+            Whether to ignore events by bots. Defaults to ``False``.
+
+            .. versionadded:: |vnext|
+        check: :class:`~collections.abc.Callable`\[..., :class:`bool`] | :data:`None`
+            A predicate called with the event's arguments, the listener is only
+            called if it returns ``True``.
+
+            .. versionadded:: |vnext|
+        dispatch_mode: :class:`.EventDispatchMode` | :data:`None`
+            How to run the listener when the event is dispatched.
+            Defaults to the client's ``event_dispatch_mode``.
+
+            .. versionadded:: |vnext|
+        coalesce: :class:`float` | :data:`None`
+            If set, events arriving within this many seconds of each other are coalesced
+            into a single call of the listener, per key returned by ``coalesce_key``.
+            The listener is called once the window (starting with the first event) is over,
+            with the arguments of the latest event; for events with ``before`` and ``after``
+            arguments, ``before`` is taken from the first event instead.
+            The cache is still updated for every event.
+
+            This is useful for high-churn events where only the final state matters,
+            e.g. :func:`on_presence_update` or :func:`on_voice_state_update`.
+
+            .. versionadded:: |vnext|
+        coalesce_key: :class:`~collections.abc.Callable`\[..., :class:`~collections.abc.Hashable`] | :data:`None`
+            A function called with the event's arguments, returning the key that events
+            are coalesced by. Defaults to the ID of the entity the event is about
+            (e.g. the member or channel) along with its guild.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -423,6 +475,19 @@ class Cog(metaclass=CogMeta):
                 actual.__cog_listener_names__.append(to_assign)
             except AttributeError:
                 actual.__cog_listener_names__ = [to_assign]
+            filters = {
+                "guild_ids": guild_ids,
+                "channel_ids": channel_ids,
+                "ignore_bots": ignore_bots,
+                "check": check,
+                "dispatch_mode": dispatch_mode,
+                "coalesce": coalesce,
+                "coalesce_key": coalesce_key,
+            }
+            try:
+                actual.__cog_listener_options__[to_assign] = filters
+            except AttributeError:
+                actual.__cog_listener_options__ = {to_assign: filters}
             # we have to return `func` instead of `actual` because
             # we need the type to be `staticmethod` for the metaclass
             # to pick it up but the metaclass unfurls the function and
@@ -814,7 +879,9 @@ class Cog(metaclass=CogMeta):
         # already, thus this should never raise.
         # Outside of, memory errors and the like...
         for name, method_name in self.__cog_listeners__:
-            bot.add_listener(getattr(self, method_name), name)
+            listener = getattr(self, method_name)
+            filters = getattr(listener, "__cog_listener_options__", {}).get(name, {})
+            bot.add_listener(listener, name, **filters)
 
         try:
             if bot._command_sync_flags.sync_on_cog_actions:
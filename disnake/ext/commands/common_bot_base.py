@@ -21,6 +21,8 @@ from . import errors
 from .cog import Cog
 
 if TYPE_CHECKING:
+    from disnake.client import _ListenerIndex, _ListenerOptions
+
     from ._types import CoroFunc
     from .help import HelpCommand
 
@@ -40,6 +42,8 @@ def _is_submodule(parent: str, child: str) -> bool:
 class CommonBotBase(Generic[CogT]):
     if TYPE_CHECKING:
         extra_events: dict[str, list[CoroFunc]]
+        _listener_options: dict[str, dict[CoroFunc, _ListenerOptions]]
+        _listener_indexes: dict[str, _ListenerIndex]
 
     def __init__(
         self,
@@ -283,6 +287,14 @@ class CommonBotBase(Generic[CogT]):
 
             for index in reversed(remove):
                 del event_list[index]
+        for filters in self._listener_options.values():
+            for listener in [
+                listener
+                for listener in filters
+                if listener.__module__ and _is_submodule(name, listener.__module__)
+            ]:
+                del filters[listener]
+        self._listener_indexes.clear()
 
     def _call_module_finalizers(self, lib: types.ModuleType, key: str) -> None:
         try:
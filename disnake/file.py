@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import os
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 __all__ = ("File",)
 
+_CHUNK_SIZE = 2**16
+
+
+class _StreamPlaceholder:
+    # the `fp` of files created from a stream factory, which is the only source of their streams
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        msg = "Stream factory files must be read using their factory"
+        raise RuntimeError(msg)
+
 
 class File:
-    """A parameter object used for sending file objects.
+    r"""A parameter object used for sending file objects.
 
     .. note::
 
@@ -20,7 +34,7 @@ class File:
 
     Attributes
     ----------
-    fp: :class:`os.PathLike` | :class:`io.BufferedIOBase`
+    fp: :class:`os.PathLike` | :class:`io.BufferedIOBase` | :class:`~collections.abc.AsyncIterable`\[:class:`bytes`]
         A file-like object opened in binary mode and read mode
         or a filename representing a file in the hard drive to
         open.
@@ -32,6 +46,14 @@ class File:
 
             To pass binary data, consider usage of ``io.BytesIO``.
 
+        An asynchronous iterable of :class:`bytes` chunks (e.g. an async generator) may
+        also be passed, which allows uploading data without holding all of it in memory.
+        Since such streams can only be consumed once, requests uploading them
+        are not retried.
+
+        .. versionchanged:: |vnext|
+            Support asynchronous iterables.
+
     filename: :class:`str` | :data:`None`
         The filename to display when uploading to Discord.
         If this is not given then it defaults to ``fp.name`` or if ``fp`` is
@@ -42,25 +64,60 @@ class File:
         The file's description.
 
         .. versionadded:: 2.3
+    progress: :class:`~collections.abc.Callable`\[[:class:`int`, :class:`int` | :data:`None`], Any] | :data:`None`
+        A function called while the file is being uploaded, with the number of bytes
+        sent so far and the total size of the file (or :data:`None` if unknown, e.g. for streams).
+        It is called again from the start if the upload is retried.
+
+        .. versionadded:: |vnext|
     """
 
-    __slots__ = ("fp", "filename", "spoiler", "description", "_original_pos", "_owner", "_closer")
+    __slots__ = (
+        "fp",
+        "filename",
+        "spoiler",
+        "description",
+        "progress",
+        "_original_pos",
+        "_owner",
+        "_closer",
+        "_size",
+        "_stream_factory",
+        "_stream_consumed",
+    )
 
     if TYPE_CHECKING:
-        fp: io.BufferedIOBase
+        fp: io.BufferedIOBase | AsyncIterable[bytes]
         filename: str | None
         spoiler: bool
         description: str | None
+        progress: Callable[[int, int | None], Any] | None
 
     def __init__(
         self,
-        fp: str | bytes | os.PathLike[str] | os.PathLike[bytes] | io.BufferedIOBase,
+        fp: str
+        | bytes
+        | os.PathLike[str]
+        | os.PathLike[bytes]
+        | io.BufferedIOBase
+        | AsyncIterable[bytes],
         filename: str | None = None,
         *,
         spoiler: bool = False,
         description: str | None = None,
+        progress: Callable[[int, int | None], Any] | None = None,
     ) -> None:
-        if isinstance(fp, io.IOBase):
+        self.progress = progress
+        self._size: int | None = None
+        self._stream_factory: Callable[[], AsyncIterable[bytes]] | None = None
+        self._stream_consumed: bool = False
+
+        if isinstance(fp, AsyncIterable):
+            self.fp = fp
+            self._original_pos = 0
+            self._owner = False
+            self._closer = None
+        elif isinstance(fp, io.IOBase):
             if not (fp.seekable() and fp.readable()):
                 msg = f"File buffer {fp!r} must be seekable and readable"
                 raise ValueError(msg)
@@ -72,12 +129,13 @@ class File:
             self._original_pos = 0
             self._owner = True
 
-        # aiohttp only uses two methods from IOBase
-        # read and close, since I want to control when the files
-        # close, I need to stub it so it doesn't close unless
-        # I tell it to
-        self._closer = self.fp.close
-        self.fp.close = lambda: None
+        if isinstance(self.fp, io.IOBase):
+            # aiohttp only uses two methods from IOBase
+            # read and close, since I want to control when the files
+            # close, I need to stub it so it doesn't close unless
+            # I tell it to
+            self._closer = self.fp.close
+            self.fp.close = lambda: None
 
         if filename is None:
             if isinstance(fp, str):
@@ -95,6 +153,23 @@ class File:
         )
         self.description = description
 
+    @classmethod
+    def _from_stream_factory(
+        cls,
+        factory: Callable[[], AsyncIterable[bytes]],
+        filename: str | None = None,
+        *,
+        size: int | None = None,
+        spoiler: bool = False,
+        description: str | None = None,
+    ) -> Self:
+        # creates a stream file which can be uploaded multiple times,
+        # by calling `factory` to get a new stream for every attempt
+        self = cls(_StreamPlaceholder(), filename, spoiler=spoiler, description=description)
+        self._stream_factory = factory
+        self._size = size
+        return self
+
     def reset(self, *, seek: int | bool = True) -> None:
         # The `seek` parameter is needed because
         # the retry-loop is iterated over multiple times
@@ -104,10 +179,12 @@ class File:
         # is 0, and thus false, then this prevents an
         # unnecessary seek since it's the first request
         # done.
-        if seek:
+        if seek and isinstance(self.fp, io.IOBase):
             self.fp.seek(self._original_pos)
 
     def close(self) -> None:
+        if not isinstance(self.fp, io.IOBase):
+            return
         self.fp.close = self._closer
         if self._owner:
             self._closer()
@@ -117,9 +194,12 @@ class File:
         """:class:`bool`: Whether the file is closed.
 
         This is a shorthand for ``File.fp.closed``.
+        Always ``False`` for asynchronous iterables.
 
         .. versionadded:: 2.8
         """
+        if not isinstance(self.fp, io.IOBase):
+            return False
         return self.fp.closed
 
     @property
@@ -127,8 +207,70 @@ class File:
         """:class:`int`: The bytes length of the :attr:`~File.fp` object.
 
         .. versionadded:: 2.8
+
+        Raises
+        ------
+        TypeError
+            The length of the file is unknown, as it is an asynchronous iterable.
         """
+        if not isinstance(self.fp, io.IOBase):
+            if self._size is None:
+                msg = "The length of a stream file is unknown"
+                raise TypeError(msg)
+            return self._size
+
         current_position = self.fp.tell()
         bytes_length = self.fp.seek(0, io.SEEK_END)
         self.fp.seek(current_position)
         return bytes_length - current_position
+
+    @property
+    def _replayable(self) -> bool:
+        # whether the file can be uploaded (again), i.e. it isn't an already consumed stream
+        return (
+            isinstance(self.fp, io.IOBase)
+            or self._stream_factory is not None
+            or not self._stream_consumed
+        )
+
+    def _get_upload_value(self) -> io.BufferedIOBase | AsyncIterator[bytes]:
+        # returns the value to pass to aiohttp for a single upload attempt
+        if isinstance(self.fp, io.IOBase) and self.progress is None:
+            return self.fp
+        return self._iter_chunks()
+
+    async def _iter_chunks(self) -> AsyncIterator[bytes]:
+        progress = self.progress
+        sent = 0
+
+        if isinstance(self.fp, io.IOBase):
+            fp = self.fp
+            total = self.bytes_length
+            # avoid blocking the event loop on disk reads, in-memory buffers can be read directly
+            loop = None if isinstance(fp, io.BytesIO) else asyncio.get_running_loop()
+            while True:
+                if loop is None:
+                    chunk = fp.read(_CHUNK_SIZE)
+                else:
+                    chunk = await loop.run_in_executor(None, fp.read, _CHUNK_SIZE)
+                if not chunk:
+                    return
+                sent += len(chunk)
+                if progress is not None:
+                    progress(sent, total)
+                yield chunk
+
+        if self._stream_factory is not None:
+            stream = self._stream_factory()
+        else:
+            if self._stream_consumed:
+                msg = "Stream files can only be uploaded once"
+                raise RuntimeError(msg)
+            stream = self.fp
+        self._stream_consumed = True
+
+        async for chunk in stream:
+            sent += len(chunk)
+            if progress is not None:
+                progress(sent, self._size)
+            yield chunk
@@ -5,7 +5,7 @@ from __future__ import annotations
 import copy
 import datetime
 import unicodedata
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -59,7 +59,14 @@ from .flags import SystemChannelFlags
 from .guild_scheduled_event import GuildScheduledEvent, GuildScheduledEventMetadata
 from .integrations import Integration, _integration_factory
 from .invite import Invite
-from .iterators import AuditLogIterator, BanIterator, MemberIterator
+from .iterators import (
+    AuditLogIterator,
+    AuditLogTail,
+    BanIterator,
+    BulkMemberEditIterator,
+    HistoryScanner,
+    MemberIterator,
+)
 from .member import Member, VoiceState
 from .mixins import Hashable
 from .object import Object
@@ -2904,7 +2911,7 @@ class Guild(Hashable):
 
     # TODO: Remove Optional typing here when async iterators are refactored
     def fetch_members(
-        self, *, limit: int | None = 1000, after: SnowflakeTime | None = None
+        self, *, limit: int | None = 1000, after: SnowflakeTime | None = None, prefetch: int = 0
     ) -> MemberIterator:
         """Retrieves an :class:`.AsyncIterator` that enables receiving the guild's members.
 
@@ -2931,6 +2938,13 @@ class Guild(Hashable):
             Retrieve members after this date or object.
             If a datetime is provided, it is recommended to use a UTC aware datetime.
             If the datetime is naive, it is assumed to be local time.
+        prefetch: :class:`int`
+            The number of pages to request in advance while the current page is being processed,
+            which reduces the time spent waiting for responses when retrieving many members.
+            Use :meth:`.AsyncIterator.aclose` to cancel pending requests if the iterator is not exhausted.
+            Defaults to ``0``.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -2963,7 +2977,7 @@ class Guild(Hashable):
                 msg = "The `members` intent must be enabled in the Developer Portal to be able to use this method."
                 raise ClientException(msg)
 
-        return MemberIterator(self, limit=limit, after=after)
+        return MemberIterator(self, limit=limit, after=after, prefetch=prefetch)
 
     async def fetch_member(self, member_id: int, /) -> Member:
         """|coro|
@@ -3084,6 +3098,7 @@ class Guild(Hashable):
         limit: int | None = 1000,
         before: Snowflake | None = None,
         after: Snowflake | None = None,
+        prefetch: int = 0,
     ) -> BanIterator:
         """Returns an :class:`~disnake.AsyncIterator` that enables receiving the destination's bans.
 
@@ -3119,6 +3134,14 @@ class Guild(Hashable):
             Retrieve bans before this user.
         after: :class:`~disnake.abc.Snowflake` | :data:`None`
             Retrieve bans after this user.
+        prefetch: :class:`int`
+            The number of pages to request in advance while the current page is being processed,
+            which reduces the time spent waiting for responses when retrieving many bans.
+            Use :meth:`~disnake.AsyncIterator.aclose` to cancel pending requests if the iterator is not exhausted.
+            Defaults to ``0``.
+
+            .. versionadded:: |vnext|
+
 
         Raises
         ------
@@ -3132,7 +3155,110 @@ class Guild(Hashable):
         :class:`~disnake.BanEntry`
             The ban with the ban data parsed.
         """
-        return BanIterator(self, limit=limit, before=before, after=after)
+        return BanIterator(self, limit=limit, before=before, after=after, prefetch=prefetch)
+
+    def scan_history(
+        self,
+        channels: Iterable[GuildMessageable] | None = None,
+        *,
+        limit: int | None = 100,
+        before: SnowflakeTime | None = None,
+        after: SnowflakeTime | None = None,
+        oldest_first: bool | None = None,
+        concurrency: int = 5,
+        ordered: bool = False,
+        cursors: Mapping[int, dict[str, Any]] | None = None,
+        prefetch: int = 0,
+    ) -> HistoryScanner:
+        """Returns an :class:`~disnake.AsyncIterator` that enables receiving the message history
+        of multiple channels and threads at the same time.
+
+        Channels are scanned concurrently, as each channel has its own rate limit bucket.
+        Messages are either yielded as soon as they are received, or merged across
+        all channels in the order of their IDs if ``ordered`` is ``True``.
+
+        The progress of every channel is tracked in :attr:`~disnake.AsyncIterator.cursors`,
+        which can be passed to a later call as ``cursors`` to resume an interrupted scan.
+
+        .. versionadded:: |vnext|
+
+        Examples
+        --------
+        Usage ::
+
+            scanner = guild.scan_history(limit=None, after=last_week)
+            try:
+                async for message in scanner:
+                    index(message)
+            finally:
+                save(scanner.cursors)
+
+        Parameters
+        ----------
+        channels: Iterable[:class:`TextChannel` | :class:`Thread` | :class:`VoiceChannel` | :class:`StageChannel`] | :data:`None`
+            The channels and threads to scan.
+            If :data:`None`, defaults to all cached channels and threads of the guild
+            in which the bot has the :attr:`~Permissions.read_message_history` permission.
+        limit: :class:`int` | :data:`None`
+            The number of messages to retrieve per channel.
+            If :data:`None`, retrieves every message in each channel.
+        before: :class:`~disnake.abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+            Retrieve messages before this date or message.
+        after: :class:`~disnake.abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+            Retrieve messages after this date or message.
+        oldest_first: :class:`bool` | :data:`None`
+            If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
+            ``after`` is specified, otherwise ``False``.
+        concurrency: :class:`int`
+            The maximum number of channels to request messages from at the same time.
+            Defaults to ``5``.
+        ordered: :class:`bool`
+            Whether to yield messages of all channels in the order of their IDs,
+            as determined by ``oldest_first``. This requires the next message of every
+            channel to be known before a message can be yielded.
+            Defaults to ``False``.
+        cursors: Mapping[:class:`int`, :class:`dict`] | :data:`None`
+            The cursors of a previous scan to resume from, as returned by
+            :attr:`~disnake.AsyncIterator.cursors`.
+        prefetch: :class:`int`
+            The number of pages to request in advance per channel.
+            Defaults to ``0``.
+
+        Raises
+        ------
+        ValueError
+            ``concurrency`` is less than 1.
+        ~disnake.Forbidden
+            You do not have permissions to get channel message history.
+        ~disnake.HTTPException
+            The request to get message history failed.
+
+        Yields
+        ------
+        :class:`~disnake.Message`
+            The message with the message data parsed.
+        """
+        if channels is None:
+            channels = [
+                *self.text_channels,
+                *self.voice_channels,
+                *self.stage_channels,
+                *self.threads,
+            ]
+            if (me := self.me) is not None:
+                channels = [c for c in channels if c.permissions_for(me).read_message_history]
+
+        return HistoryScanner(
+            channels,
+            limit=limit,
+            before=before,
+            after=after,
+            oldest_first=oldest_first,
+            concurrency=concurrency,
+            ordered=ordered,
+            cursors=cursors,
+            prefetch=prefetch,
+        )
 
     async def prune_members(
         self,
@@ -4334,6 +4460,107 @@ class Guild(Hashable):
             [Object(u) for u in (data.get("failed_users") or [])],
         )
 
+    def bulk_edit_members(
+        self,
+        members: Iterable[Snowflake],
+        *,
+        add_roles: Sequence[Snowflake] = (),
+        remove_roles: Sequence[Snowflake] = (),
+        nick: str | None = MISSING,
+        timeout: float | datetime.timedelta | datetime.datetime | None = MISSING,
+        reason: str | None = None,
+        concurrency: int = 3,
+    ) -> BulkMemberEditIterator:
+        r"""Returns an :class:`~disnake.AsyncIterator` that applies the same changes to multiple members,
+        yielding a :class:`BulkMemberEditResult` for each member once it was edited.
+
+        Members are edited concurrently and with low priority, so that other requests
+        (e.g. interaction responses) aren't delayed; rate limits are handled per route.
+        Changes that are already reflected in the member cache are skipped without sending any requests.
+        Roles are added and removed individually, like :meth:`Member.add_roles` and
+        :meth:`Member.remove_roles` with ``atomic=True``.
+
+        Failing to edit a member does not stop the iterator, the error is returned in
+        :attr:`BulkMemberEditResult.error` instead. To stop early, stop iterating and
+        call :meth:`~disnake.AsyncIterator.aclose`; the members that were not processed yet are available
+        through :attr:`~disnake.AsyncIterator.remaining`, and can be passed to another call to continue.
+
+        You must have the permissions required for the respective changes,
+        see :meth:`Member.edit`.
+
+        .. versionadded:: |vnext|
+
+        Examples
+        --------
+        Usage ::
+
+            async for result in guild.bulk_edit_members(raiders, timeout=3600, add_roles=[quarantine]):
+                if result.error is not None:
+                    print(f"failed to edit {result.member.id}: {result.error}")
+
+        Parameters
+        ----------
+        members: :class:`~collections.abc.Iterable`\[:class:`abc.Snowflake`]
+            The members to edit. Duplicates are ignored.
+        add_roles: :class:`~collections.abc.Sequence`\[:class:`abc.Snowflake`]
+            The roles to add to the members.
+        remove_roles: :class:`~collections.abc.Sequence`\[:class:`abc.Snowflake`]
+            The roles to remove from the members.
+        nick: :class:`str` | :data:`None`
+            The members' new nickname. Use :data:`None` to remove the nickname.
+        timeout: :class:`float` | :class:`datetime.timedelta` | :class:`datetime.datetime` | :data:`None`
+            The duration (seconds or timedelta) or the expiry date/time of the members' timeout.
+            Durations are relative to the time this method is called, so all members
+            are timed out until the same point in time; members whose current timeout
+            expires within a few seconds of that are skipped.
+            Use :data:`None` to remove the timeout.
+        reason: :class:`str` | :data:`None`
+            The reason for editing the members. Shows up on the audit log.
+        concurrency: :class:`int`
+            The maximum number of members to edit at the same time.
+            Defaults to ``3``.
+
+        Raises
+        ------
+        ValueError
+            No changes were provided, a role is both added and removed,
+            or ``concurrency`` is less than 1.
+
+        Yields
+        ------
+        :class:`BulkMemberEditResult`
+            The result of editing a member.
+        """
+        add_role_ids = {r.id for r in add_roles}
+        remove_role_ids = {r.id for r in remove_roles}
+        if add_role_ids & remove_role_ids:
+            msg = "Roles cannot be added and removed at the same time"
+            raise ValueError(msg)
+
+        fields: dict[str, Any] = {}
+        if nick is not MISSING:
+            fields["nick"] = nick or None
+        if timeout is not MISSING:
+            if isinstance(timeout, (int, float)):
+                timeout = datetime.timedelta(seconds=timeout)
+            if isinstance(timeout, datetime.timedelta):
+                timeout = utils.utcnow() + timeout
+            fields["communication_disabled_until"] = timeout
+
+        if not (add_role_ids or remove_role_ids or fields):
+            msg = "At least one change must be provided"
+            raise ValueError(msg)
+
+        return BulkMemberEditIterator(
+            self,
+            members,
+            add_roles=add_role_ids,
+            remove_roles=remove_role_ids,
+            fields=fields,
+            reason=reason,
+            concurrency=concurrency,
+        )
+
     async def vanity_invite(self, *, use_cached: bool = False) -> Invite | None:
         """|coro|
 
@@ -4405,6 +4632,7 @@ class Guild(Hashable):
         user: Snowflake | None = None,
         action: AuditLogAction | None = None,
         oldest_first: bool = False,
+        prefetch: int = 0,
     ) -> AuditLogIterator:
         """Returns an :class:`AsyncIterator` that enables receiving the guild's audit logs.
 
@@ -4451,6 +4679,14 @@ class Guild(Hashable):
 
             .. versionadded:: 2.9
 
+        prefetch: :class:`int`
+            The number of pages to request in advance while the current page is being processed,
+            which reduces the time spent waiting for responses when retrieving many entries.
+            Use :meth:`AsyncIterator.aclose` to cancel pending requests if the iterator is not exhausted.
+            Defaults to ``0``.
+
+            .. versionadded:: |vnext|
+
         Raises
         ------
         Forbidden
@@ -4476,6 +4712,71 @@ class Guild(Hashable):
             user_id=user_id,
             action_type=action.value if action is not None else None,
             oldest_first=oldest_first,
+            prefetch=prefetch,
+        )
+
+    def tail_audit_logs(
+        self,
+        *,
+        after: SnowflakeTime | None = None,
+        user: Snowflake | None = None,
+        action: AuditLogAction | None = None,
+    ) -> AuditLogTail:
+        """Returns an :class:`AsyncIterator` that waits for new audit log entries of the guild,
+        yielding them in order from oldest to newest as they are created.
+
+        Entries are received through :func:`on_audit_log_entry_create` events, which requires
+        :attr:`Intents.moderation`. Entries that may have been missed are retrieved from
+        :meth:`audit_logs`, but only when needed, i.e. initially if ``after`` is given,
+        and when the client connects using a new gateway session (events that occur
+        while reconnecting are otherwise replayed by Discord). Each entry is only returned once;
+        entries received after newer ones were already returned are returned late instead of being dropped.
+
+        The iterator does not end on its own; stop it using :meth:`AsyncIterator.aclose`.
+        To continue later (for instance after a restart), pass the iterator's
+        :attr:`~AsyncIterator.last_id`, wrapped in an :class:`Object`, as ``after``.
+
+        You must have :attr:`~Permissions.view_audit_log` permission to use this.
+
+        .. versionadded:: |vnext|
+
+        Examples
+        --------
+        Usage ::
+
+            async for entry in guild.tail_audit_logs(after=disnake.Object(last_seen_id)):
+                await log_channel.send(f"{entry.user} did {entry.action}")
+                last_seen_id = entry.id
+
+        Parameters
+        ----------
+        after: :class:`abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+            Return entries after this date or entry, including ones that were created
+            before calling this method.
+            If :data:`None`, only entries created afterwards are returned.
+        user: :class:`abc.Snowflake` | :data:`None`
+            The moderator to filter entries from.
+        action: :class:`AuditLogAction` | :data:`None`
+            The action to filter with.
+
+        Raises
+        ------
+        Forbidden
+            You are not allowed to fetch audit logs.
+        HTTPException
+            An error occurred while fetching missed audit log entries.
+            Iterating can be continued afterwards to retry.
+
+        Yields
+        ------
+        :class:`AuditLogEntry`
+            The audit log entry.
+        """
+        return AuditLogTail(
+            self,
+            after=after,
+            user_id=user.id if user is not None else None,
+            action_type=action.value if action is not None else None,
         )
 
     async def widget(self) -> Widget:
@@ -3,11 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import io
+import itertools
 import logging
+import random
 import re
 import sys
 import weakref
-from collections.abc import Coroutine, Iterable, Mapping, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
 from errno import ECONNRESET
 from typing import (
     TYPE_CHECKING,
@@ -32,8 +49,11 @@ from .errors import (
     HTTPException,
     LoginFailure,
     NotFound,
+    RateLimited,
 )
+from .file import File
 from .gateway import DiscordClientWebSocketResponse, GatewayParams
+from .ratelimit import RateLimitStore
 from .utils import MISSING
 
 _log = logging.getLogger(__name__)
@@ -43,8 +63,8 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self
 
+    from .cdn import CDNCache
     from .enums import InteractionResponseType
-    from .file import File
     from .message import Attachment
     from .types import (
         appinfo,
@@ -108,15 +128,16 @@ USER_AGENT: Final[str] = (  # noqa: UP032
 
 
 async def json_or_text(response: aiohttp.ClientResponse) -> dict[str, Any] | str:
-    text = await response.text(encoding="utf-8")
+    # JSON is parsed from the raw body directly, without decoding it to a `str` first
+    body = await response.read()
     try:
         if response.headers["content-type"] == "application/json":
-            return utils._from_json(text)
+            return utils._from_json(body)
     except KeyError:
         # Thanks Cloudflare
         pass
 
-    return text
+    return body.decode("utf-8")
 
 
 def set_attachments(payload: dict[str, Any], files: Sequence[File]) -> None:
@@ -148,7 +169,7 @@ def to_multipart(payload: Mapping[str, Any], files: Sequence[File]) -> list[dict
         multipart.append(
             {
                 "name": f"files[{index}]",
-                "value": file.fp,
+                "value": file,
                 "filename": file.filename,
                 "content_type": "application/octet-stream",
             }
@@ -169,6 +190,179 @@ def to_multipart_with_attachments(
     return to_multipart(payload, files)
 
 
+def prepare_form(form: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Escapes the field names of a multipart form.
+
+    This only needs to happen once per request, the returned fields
+    can then be passed to ``build_form_data`` for every attempt.
+    """
+    prepared: list[dict[str, Any]] = []
+    for p in form:
+        # manually escape chars, just in case
+        name = re.sub(r"[^\x21\x23-\x5b\x5d-\x7e]", lambda m: f"\\{m.group(0)}", p["name"])
+        prepared.append({**p, "name": name})
+    return prepared
+
+
+def build_form_data(form: Iterable[dict[str, Any]]) -> aiohttp.FormData:
+    """Creates the form data for a single attempt of a request from prepared fields.
+
+    ``aiohttp.FormData`` can only be sent once, so this has to be called for every attempt.
+    :class:`File` values are resolved here, which streams them if required.
+    """
+    # NOTE: for `quote_fields`, see https://github.com/aio-libs/aiohttp/issues/4012
+    form_data = aiohttp.FormData(quote_fields=False)
+    for p in form:
+        value = p["value"]
+        if isinstance(value, File):
+            value = value._get_upload_value()
+        form_data.add_field(**{**p, "value": value})
+    return form_data
+
+
+def can_retry_upload(files: Sequence[File] | None) -> bool:
+    """Whether a request uploading the given files can be sent again,
+    i.e. none of the files is an already consumed stream.
+    """
+    return not files or all(f._replayable for f in files)
+
+
+class RequestPriority(IntEnum):
+    """The scheduling priority of a request, lower values are sent first."""
+
+    high = 0
+    normal = 1
+    low = 2
+
+
+_request_priority: ContextVar[RequestPriority | None] = ContextVar(
+    "_request_priority", default=None
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority) -> Generator[None]:
+    """Overrides the priority of all requests made within this context."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RetryPolicy:
+    """Controls how often and for how long a REST request is retried.
+
+    A policy can be set for all requests of a client using the ``retry_policy`` parameter
+    of :class:`Client`, for specific routes using ``route_retry_policies``,
+    or for all requests made within a block of code using :func:`retry_policy`.
+
+    Interaction responses and followups use a policy with a :attr:`deadline`
+    of 10 seconds by default, since they are useless once the interaction expired.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    tries: :class:`int`
+        The maximum number of attempts, including the first one. Defaults to ``5``.
+    backoff: :class:`float`
+        The number of seconds to wait before the first retry after a server error
+        or a reset connection. Defaults to ``1``.
+    backoff_step: :class:`float`
+        The number of seconds added to the wait time for every further retry. Defaults to ``2``.
+    jitter: :class:`float`
+        The fraction by which wait times are randomly varied in both directions,
+        between ``0`` and ``1``. This avoids many clients retrying at the same time.
+        Defaults to ``0``.
+    deadline: :class:`float` | :data:`None`
+        The maximum number of seconds a request may spend waiting for rate limits
+        and between retries. If a wait would exceed the deadline, the request fails
+        immediately with :exc:`RateLimited` (or the last error received) instead of
+        waiting. Defaults to :data:`None`, i.e. no deadline.
+    """
+
+    tries: int = 5
+    backoff: float = 1.0
+    backoff_step: float = 2.0
+    jitter: float = 0.0
+    deadline: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.tries < 1:
+            msg = "tries must be at least 1"
+            raise ValueError(msg)
+        if self.backoff < 0 or self.backoff_step < 0:
+            msg = "backoff and backoff_step must not be negative"
+            raise ValueError(msg)
+        if not 0 <= self.jitter <= 1:
+            msg = "jitter must be between 0 and 1"
+            raise ValueError(msg)
+        if self.deadline is not None and self.deadline <= 0:
+            msg = "deadline must be greater than 0"
+            raise ValueError(msg)
+
+    def _backoff_delay(self, retry: int) -> float:
+        delay = self.backoff + self.backoff_step * retry
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return delay
+
+
+_DEFAULT_RETRY_POLICY: Final[RetryPolicy] = RetryPolicy()
+_INTERACTION_RETRY_POLICY: Final[RetryPolicy] = RetryPolicy(deadline=10.0)
+
+_retry_policy: ContextVar[RetryPolicy | None] = ContextVar("_retry_policy", default=None)
+
+
+@contextmanager
+def retry_policy(policy: RetryPolicy) -> Generator[None]:
+    """Overrides the :class:`RetryPolicy` of all REST requests made within this context,
+    including requests of webhooks and interactions.
+
+    .. versionadded:: |vnext|
+
+    Example
+    -------
+    .. code-block:: python3
+
+        with disnake.retry_policy(disnake.RetryPolicy(tries=1, deadline=5)):
+            await channel.send("hello")
+
+    Parameters
+    ----------
+    policy: :class:`RetryPolicy`
+        The policy to use.
+    """
+    token = _retry_policy.set(policy)
+    try:
+        yield
+    finally:
+        _retry_policy.reset(token)
+
+
+class _Deadline:
+    """Tracks the remaining time of a request's :attr:`RetryPolicy.deadline`."""
+
+    __slots__ = ("_loop", "_when")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, timeout: float | None) -> None:
+        self._loop = loop
+        self._when: float | None = None if timeout is None else loop.time() + timeout
+
+    def allows(self, delay: float) -> bool:
+        return self._when is None or self._loop.time() + delay <= self._when
+
+    async def wait(self, aw: Awaitable[T]) -> T:
+        if self._when is None:
+            return await aw
+        try:
+            return await asyncio.wait_for(aw, max(0.0, self._when - self._loop.time()))
+        except asyncio.TimeoutError:
+            raise RateLimited(None) from None
+
+
 class Route:
     BASE: ClassVar[str] = "https://discord.com/api/v10"
 
@@ -192,6 +386,15 @@ class Route:
         self.webhook_id: Snowflake | None = parameters.get("webhook_id")
         self.webhook_token: str | None = parameters.get("webhook_token")
 
+        # interaction callbacks and followups have to arrive within a few seconds,
+        # so they are scheduled ahead of everything else
+        interaction = "interaction_token" in parameters or path.startswith("/interactions/")
+        self.priority: RequestPriority = (
+            RequestPriority.high if interaction else RequestPriority.normal
+        )
+        # for the same reason, there's no point in retrying them for long
+        self.retry_policy: RetryPolicy | None = _INTERACTION_RETRY_POLICY if interaction else None
+
     @property
     def bucket(self) -> str:
         # the bucket is just method + path w/ major parameters
@@ -219,6 +422,135 @@ class MaybeUnlock:
             self.lock.release()
 
 
+@dataclass(kw_only=True, slots=True)
+class RequestMetrics:
+    """Timing and outcome information about a single REST request, including all of its retries.
+
+    These are passed to the listeners registered using :meth:`Client.add_http_metrics_listener`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    method: :class:`str`
+        The HTTP method of the request.
+    route: :class:`str`
+        The route template of the request, without any parameters filled in,
+        e.g. ``/channels/{channel_id}/messages``.
+    bucket: :class:`str`
+        The rate limit bucket the request was handled under.
+    status: :class:`int` | :data:`None`
+        The status code of the last response, or :data:`None` if no response was received.
+    request_size: :class:`int` | :data:`None`
+        The size of the request body in bytes, or :data:`None` if the request
+        was a multipart request.
+    response_size: :class:`int`
+        The size of the last response body in bytes.
+    lock_wait: :class:`float`
+        The number of seconds spent waiting for the rate limit bucket.
+    global_wait: :class:`float`
+        The number of seconds spent waiting for the global rate limit or a free connection.
+    network_time: :class:`float`
+        The number of seconds spent sending requests and receiving responses.
+    total_time: :class:`float`
+        The total number of seconds the request took, including time spent sleeping between retries.
+    retries: :class:`int`
+        The number of times the request was retried.
+    ratelimited: :class:`int`
+        The number of ``429 Too Many Requests`` responses received.
+    exception: :class:`Exception` | :data:`None`
+        The exception the request failed with, if any.
+    """
+
+    method: str
+    route: str
+    bucket: str
+    status: int | None = None
+    request_size: int | None = None
+    response_size: int = 0
+    lock_wait: float = 0.0
+    global_wait: float = 0.0
+    network_time: float = 0.0
+    total_time: float = 0.0
+    retries: int = 0
+    ratelimited: int = 0
+    exception: Exception | None = None
+
+
+class PriorityLimiter:
+    """Limits the number of concurrently running requests.
+
+    Unlike :class:`asyncio.Semaphore`, free slots are handed out to the waiter
+    with the highest priority first, and FIFO within the same priority.
+    ``reserved`` slots can only be taken by high priority requests.
+    While paused (e.g. during a global rate limit), all acquirers are queued.
+    """
+
+    def __init__(self, limit: int, *, reserved: int = 0) -> None:
+        self.limit: int = limit
+        self.reserved: int = reserved
+        self._in_use: int = 0
+        self._paused: bool = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    def _has_capacity(self, priority: int) -> bool:
+        if self._paused:
+            return False
+        if priority <= RequestPriority.high:
+            return self._in_use < self.limit
+        return self._in_use < self.limit - self.reserved
+
+    async def acquire(self, priority: int = RequestPriority.normal) -> None:
+        if not self._waiters and self._has_capacity(priority):
+            self._in_use += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        # there may be capacity left if all previous waiters were cancelled
+        self._wake_up()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was already handed to us, pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._in_use -= 1
+        self._wake_up()
+
+    def pause(self) -> None:
+        self._paused = True
+
+    def resume(self) -> None:
+        self._paused = False
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        waiters = self._waiters
+        while waiters:
+            priority, _, future = waiters[0]
+            if future.done():
+                heapq.heappop(waiters)
+                continue
+            if not self._has_capacity(priority):
+                break
+            heapq.heappop(waiters)
+            self._in_use += 1
+            future.set_result(None)
+
+
+# The sessions created by HTTP clients, mapped to their client.
+# Requests made through the webhook adapter on such a session (e.g. interaction responses
+# and followups) use the client's limiter, since they share its connections.
+_session_clients: weakref.WeakKeyDictionary[aiohttp.ClientSession, HTTPClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 # For some reason, the Discord voice websocket expects this header to be
 # completely lowercase while aiohttp respects spec and does it as case-insensitive
 aiohttp.hdrs.WEBSOCKET = "websocket"  # pyright: ignore[reportAttributeAccessIssue]
@@ -235,32 +567,161 @@ class HTTPClient:
         proxy: str | None = None,
         proxy_auth: aiohttp.BasicAuth | None = None,
         unsync_clock: bool = True,
+        trace_configs: Sequence[aiohttp.TraceConfig] | None = None,
+        ratelimit_store: RateLimitStore | None = None,
+        cdn_cache: CDNCache | None = None,
+        cdn_connections_per_host: int = 10,
+        retry_policy: RetryPolicy | None = None,
+        route_retry_policies: Mapping[str, RetryPolicy] | None = None,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = loop
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
+        # CDN downloads use a separate connection pool, so that large or slow
+        # downloads don't compete with API requests for connections
+        self.__cdn_session: aiohttp.ClientSession | None = None
+        self.cdn_cache: CDNCache | None = cdn_cache
+        self.cdn_connections_per_host: int = cdn_connections_per_host
         self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
+        # loop times at which the locks of exhausted buckets and the global rate limit are released,
+        # so that requests can fail right away if they can't wait that long
+        self._bucket_resets: dict[str, float] = {}
+        self._global_reset: float | None = None
+        self._global_reset_handle: asyncio.TimerHandle | None = None
+        # aiohttp's default connector allows 100 simultaneous connections;
+        # keep at most that many requests in flight and queue the rest by priority.
+        # Interaction responses sent through the webhook adapter on the same session
+        # take slots from this limiter as well, a few of which are reserved for them.
+        connector_limit = getattr(connector, "limit", 100) or sys.maxsize
+        self._limiter: PriorityLimiter = PriorityLimiter(
+            connector_limit, reserved=min(connector_limit // 10, 10)
+        )
         self.token: str | None = None
         self.bot_token: bool = False
         self.proxy: str | None = proxy
         self.proxy_auth: aiohttp.BasicAuth | None = proxy_auth
         self.use_clock: bool = not unsync_clock
+        self.trace_configs: list[aiohttp.TraceConfig] | None = (
+            list(trace_configs) if trace_configs else None
+        )
+        self._metrics_listeners: list[Callable[[RequestMetrics], Any]] = []
+        self.ratelimit_store: RateLimitStore | None = ratelimit_store
+        self.retry_policy: RetryPolicy = retry_policy or _DEFAULT_RETRY_POLICY
+        self.route_retry_policies: dict[str, RetryPolicy] = dict(route_retry_policies or {})
 
         # n.b. if this is changed after the ClientSession is created,
         # the new user agent will not be used until the session is recreated
         self.user_agent: str = USER_AGENT
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        session = aiohttp.ClientSession(
+            connector=self.connector,
+            ws_response_class=DiscordClientWebSocketResponse,
+            headers={
+                "User-Agent": self.user_agent,
+            },
+            trace_configs=self.trace_configs,
+        )
+        _session_clients[session] = self
+        return session
+
     def recreate(self) -> None:
         if self.__session.closed:
-            self.__session = aiohttp.ClientSession(
-                connector=self.connector,
-                ws_response_class=DiscordClientWebSocketResponse,
+            self.__session = self._create_session()
+
+    def _get_cdn_session(self) -> aiohttp.ClientSession:
+        if self.__cdn_session is None or self.__cdn_session.closed:
+            self.__cdn_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.cdn_connections_per_host),
                 headers={
                     "User-Agent": self.user_agent,
                 },
+                trace_configs=self.trace_configs,
             )
+        return self.__cdn_session
+
+    def add_metrics_listener(self, func: Callable[[RequestMetrics], Any]) -> None:
+        self._metrics_listeners.append(func)
+
+    def remove_metrics_listener(self, func: Callable[[RequestMetrics], Any]) -> None:
+        try:
+            self._metrics_listeners.remove(func)
+        except ValueError:
+            pass
+
+    def _get_retry_policy(self, route: Route) -> RetryPolicy:
+        if (policy := _retry_policy.get()) is not None:
+            return policy
+        if self.route_retry_policies:
+            policy = self.route_retry_policies.get(
+                f"{route.method} {route.path}"
+            ) or self.route_retry_policies.get(route.path)
+            if policy is not None:
+                return policy
+        return route.retry_policy or self.retry_policy
+
+    def _start_global_ratelimit(self, retry_after: float) -> None:
+        # the rate limit is lifted by a timer instead of the request that ran into it,
+        # so that it doesn't stay in place if that request is cancelled or fails
+        if self._global_reset_handle is not None:
+            self._global_reset_handle.cancel()
+        self._global_over.clear()
+        self._global_reset = self.loop.time() + retry_after
+        self._limiter.pause()
+        self._global_reset_handle = self.loop.call_later(retry_after, self._end_global_ratelimit)
+
+    def _end_global_ratelimit(self) -> None:
+        # release the global lock now that the
+        # global rate limit has passed
+        self._global_reset = None
+        self._global_reset_handle = None
+        self._global_over.set()
+        self._limiter.resume()
+        _log.debug("Global rate limit is now over.")
+
+    def _unlock_later(
+        self, bucket: str, lock: asyncio.Lock, maybe_lock: MaybeUnlock, delay: float
+    ) -> None:
+        maybe_lock.defer()
+        self._bucket_resets[bucket] = self.loop.time() + delay
+
+        def release() -> None:
+            self._bucket_resets.pop(bucket, None)
+            lock.release()
+
+        self.loop.call_later(delay, release)
+
+    def _check_reset(self, reset: float | None, deadline: _Deadline) -> None:
+        # fail right away instead of waiting until the deadline if a rate limit
+        # is known to outlast it
+        if reset is not None and not deadline.allows(delay := reset - self.loop.time()):
+            raise RateLimited(delay)
+
+    async def _wait_for_shared_ratelimits(self, bucket: str, deadline: _Deadline) -> None:
+        store = self.ratelimit_store
+        assert store is not None
+        while True:
+            # reserves one request of the budget shared with other clients, if available
+            delay = await store.reserve(bucket)
+            if delay <= 0:
+                return
+            if not deadline.allows(delay):
+                raise RateLimited(delay)
+            _log.debug(
+                "Waiting %.2f seconds for a rate limit shared with other clients (bucket: %s).",
+                delay,
+                bucket,
+            )
+            await asyncio.sleep(delay)
+
+    def _emit_metrics(self, metrics: RequestMetrics) -> None:
+        for listener in self._metrics_listeners:
+            try:
+                listener(metrics)
+            except Exception:
+                _log.exception("Ignoring exception in HTTP metrics listener %r", listener)
 
     async def ws_connect(self, url: str, *, compress: int = 0) -> aiohttp.ClientWebSocketResponse:
         timeout = cast(
@@ -293,10 +754,36 @@ class HTTPClient:
         files: Sequence[File] | None = None,
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
+    ) -> Any:
+        metrics = RequestMetrics(method=route.method, route=route.path, bucket=route.bucket)
+        start = self.loop.time()
+        try:
+            return await self._request(route, metrics, files=files, form=form, **kwargs)
+        except Exception as e:
+            metrics.exception = e
+            raise
+        finally:
+            if self._metrics_listeners:
+                metrics.total_time = self.loop.time() - start
+                self._emit_metrics(metrics)
+
+    async def _request(
+        self,
+        route: Route,
+        metrics: RequestMetrics,
+        *,
+        files: Sequence[File] | None = None,
+        form: Iterable[dict[str, Any]] | None = None,
+        **kwargs: Any,
     ) -> Any:
         bucket = route.bucket
         method = route.method
         url = route.url
+        priority = _request_priority.get()
+        if priority is None:
+            priority = route.priority
+        policy = self._get_retry_policy(route)
+        deadline = _Deadline(self.loop, policy.deadline)
 
         lock = self._locks.get(bucket)
         if lock is None:
@@ -311,7 +798,7 @@ class HTTPClient:
         # some checking if it's a JSON request
         if "json" in kwargs:
             headers["Content-Type"] = "application/json"
-            kwargs["data"] = utils._to_json(kwargs.pop("json"))
+            kwargs["data"] = utils._to_json_bytes(kwargs.pop("json"))
 
         try:
             reason = kwargs.pop("reason")
@@ -329,117 +816,159 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
+        # allows `aiohttp.TraceConfig` callbacks to group requests by route and bucket
+        kwargs["trace_request_ctx"] = metrics
+
+        if form:
+            form = prepare_form(form)
+        else:
+            body = kwargs.get("data")
+            metrics.request_size = len(body) if isinstance(body, (str, bytes)) else 0
 
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
-        await lock.acquire()
+        waiting_since = self.loop.time()
+        if lock.locked():
+            self._check_reset(self._bucket_resets.get(bucket), deadline)
+        await deadline.wait(lock.acquire())
+        metrics.lock_wait = self.loop.time() - waiting_since
         with MaybeUnlock(lock) as maybe_lock:
-            for tries in range(5):
+            for tries in range(policy.tries):
+                if tries and not can_retry_upload(files):
+                    # a stream was consumed by the previous attempt and can't be sent again
+                    break
+
+                metrics.retries = tries
                 if files:
                     for f in files:
                         f.reset(seek=tries)
 
                 if form:
-                    # NOTE: for `quote_fields`, see https://github.com/aio-libs/aiohttp/issues/4012
-                    form_data = aiohttp.FormData(quote_fields=False)
-                    for p in form:
-                        # manually escape chars, just in case
-                        name = re.sub(
-                            r"[^\x21\x23-\x5b\x5d-\x7e]", lambda m: f"\\{m.group(0)}", p["name"]
-                        )
-                        form_data.add_field(
-                            name=name, **{k: v for k, v in p.items() if k != "name"}
-                        )
-                    kwargs["data"] = form_data
+                    kwargs["data"] = build_form_data(form)
 
                 try:
-                    async with self.__session.request(method, url, **kwargs) as response:
+                    waiting_since = self.loop.time()
+                    if self.ratelimit_store is not None:
+                        await self._wait_for_shared_ratelimits(bucket, deadline)
+                    # this also waits for the global rate limit to be over, if any;
+                    # waiting requests are then sent in order of their priority
+                    if not self._global_over.is_set():
+                        self._check_reset(self._global_reset, deadline)
+                    await deadline.wait(self._limiter.acquire(priority))
+                    sent_at = self.loop.time()
+                    metrics.global_wait += sent_at - waiting_since
+                    try:
+                        async with self.__session.request(method, url, **kwargs) as response:
+                            # even errors have text involved in them so this is safe to call
+                            data = await json_or_text(response)
+                            # the body is cached at this point, this doesn't read it again
+                            metrics.response_size = len(await response.read())
+                    finally:
+                        self._limiter.release()
+                        metrics.network_time += self.loop.time() - sent_at
+
+                    metrics.status = response.status
+                    _log.debug(
+                        "%s %s has returned %s (%d bytes)",
+                        method,
+                        url,
+                        response.status,
+                        metrics.response_size,
+                    )
+
+                    # check if we have rate limit header information
+                    remaining = response.headers.get("X-Ratelimit-Remaining")
+                    if remaining == "0" and response.status != 429:
+                        # we've depleted our current bucket
+                        delta = utils._parse_ratelimit_header(response, use_clock=self.use_clock)
                         _log.debug(
-                            "%s %s with %s has returned %s",
-                            method,
-                            url,
-                            kwargs.get("data"),
-                            response.status,
+                            "A rate limit bucket has been exhausted (bucket: %s, retry: %s).",
+                            bucket,
+                            delta,
+                        )
+                        self._unlock_later(bucket, lock, maybe_lock, delta)
+
+                    if (
+                        self.ratelimit_store is not None
+                        and remaining is not None
+                        and response.status != 429
+                    ):
+                        await self.ratelimit_store.update(
+                            bucket,
+                            int(remaining),
+                            utils._parse_ratelimit_header(response, use_clock=self.use_clock),
                         )
 
-                        # even errors have text involved in them so this is safe to call
-                        data = await json_or_text(response)
+                    # the request was successful so just return the text/json
+                    if 300 > response.status >= 200:
+                        return data
+
+                    # we are being rate limited
+                    if response.status == 429:
+                        if not response.headers.get("Via") or isinstance(data, str):
+                            # Banned by Cloudflare more than likely.
+                            raise HTTPException(response, data)
 
-                        # check if we have rate limit header information
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            # we've depleted our current bucket
-                            delta = utils._parse_ratelimit_header(
-                                response, use_clock=self.use_clock
+                        metrics.ratelimited += 1
+                        fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
+
+                        # sleep a bit
+                        retry_after: float = data["retry_after"]
+                        _log.warning(fmt, retry_after, bucket)
+
+                        # check if it's a global rate limit
+                        is_global = data.get("global", False)
+                        if is_global:
+                            _log.warning(
+                                "Global rate limit has been hit. Retrying in %.2f seconds.",
+                                retry_after,
                             )
-                            _log.debug(
-                                "A rate limit bucket has been exhausted (bucket: %s, retry: %s).",
-                                bucket,
-                                delta,
+                            self._start_global_ratelimit(retry_after)
+
+                        if self.ratelimit_store is not None:
+                            await self.ratelimit_store.set_delay(
+                                self.ratelimit_store.GLOBAL if is_global else bucket, retry_after
                             )
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
-
-                        # the request was successful so just return the text/json
-                        if 300 > response.status >= 200:
-                            _log.debug("%s %s has received %s", method, url, data)
-                            return data
-
-                        # we are being rate limited
-                        if response.status == 429:
-                            if not response.headers.get("Via") or isinstance(data, str):
-                                # Banned by Cloudflare more than likely.
-                                raise HTTPException(response, data)
-
-                            fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
-
-                            # sleep a bit
-                            retry_after: float = data["retry_after"]
-                            _log.warning(fmt, retry_after, bucket)
-
-                            # check if it's a global rate limit
-                            is_global = data.get("global", False)
-                            if is_global:
-                                _log.warning(
-                                    "Global rate limit has been hit. Retrying in %.2f seconds.",
-                                    retry_after,
-                                )
-                                self._global_over.clear()
-
-                            await asyncio.sleep(retry_after)
-                            _log.debug("Done sleeping for the rate limit. Retrying...")
-
-                            # release the global lock now that the
-                            # global rate limit has passed
-                            if is_global:
-                                self._global_over.set()
-                                _log.debug("Global rate limit is now over.")
 
-                            continue
+                        if not deadline.allows(retry_after):
+                            # give up right away, but keep other requests from
+                            # running into the same rate limit in the meantime
+                            if not is_global:
+                                self._unlock_later(bucket, lock, maybe_lock, retry_after)
+                            raise RateLimited(retry_after)
 
-                        # we've received a 500, 502, or 504, unconditional retry
-                        if response.status in {500, 502, 504}:
-                            await asyncio.sleep(1 + tries * 2)
-                            continue
+                        await asyncio.sleep(retry_after)
+                        _log.debug("Done sleeping for the rate limit. Retrying...")
+                        continue
 
-                        # the usual error cases
-                        if response.status == 403:
-                            raise Forbidden(response, data)
-                        elif response.status == 404:
-                            raise NotFound(response, data)
-                        elif response.status >= 500:
-                            raise DiscordServerError(response, data)
-                        else:
-                            raise HTTPException(response, data)
+                    # we've received a 500, 502, or 504, retry with backoff
+                    if response.status in {500, 502, 504}:
+                        delay = policy._backoff_delay(tries)
+                        if tries < policy.tries - 1 and deadline.allows(delay):
+                            await asyncio.sleep(delay)
+                            continue
+                        raise DiscordServerError(response, data)
+
+                    # the usual error cases
+                    if response.status == 403:
+                        raise Forbidden(response, data)
+                    elif response.status == 404:
+                        raise NotFound(response, data)
+                    elif response.status >= 500:
+                        raise DiscordServerError(response, data)
+                    else:
+                        raise HTTPException(response, data)
 
                 # This is handling exceptions from the request
                 except OSError as e:
                     # Connection reset by peer
-                    if tries < 4 and e.errno == ECONNRESET:
-                        await asyncio.sleep(1 + tries * 2)
+                    if (
+                        e.errno == ECONNRESET
+                        and tries < policy.tries - 1
+                        and can_retry_upload(files)
+                        and deadline.allows(delay := policy._backoff_delay(tries))
+                    ):
+                        await asyncio.sleep(delay)
                         continue
                     raise
 
@@ -453,34 +982,75 @@ class HTTPClient:
             msg = "Unreachable code in HTTP handling"
             raise RuntimeError(msg)
 
+    @staticmethod
+    def _check_cdn_response(resp: aiohttp.ClientResponse) -> None:
+        if resp.status == 200:
+            return
+        elif resp.status == 404:
+            raise NotFound(resp, "asset not found")
+        elif resp.status == 403:
+            raise Forbidden(resp, "cannot retrieve asset")
+        else:
+            raise HTTPException(resp, "failed to get asset")
+
     async def get_from_cdn(self, url: str) -> bytes:
-        async with self.__session.get(url) as resp:
-            if resp.status == 200:
-                return await resp.read()
-            elif resp.status == 404:
-                raise NotFound(resp, "asset not found")
-            elif resp.status == 403:
-                raise Forbidden(resp, "cannot retrieve asset")
-            else:
-                raise HTTPException(resp, "failed to get asset")
+        cache = self.cdn_cache
+        if cache is not None:
+            data = await self.loop.run_in_executor(None, cache.get, url)
+            if data is not None:
+                return data
+
+        session = self._get_cdn_session()
+        async with session.get(url, proxy=self.proxy, proxy_auth=self.proxy_auth) as resp:
+            self._check_cdn_response(resp)
+            data = await resp.read()
+
+        if cache is not None:
+            await self.loop.run_in_executor(None, cache.put, url, data)
+        return data
+
+    async def stream_from_cdn(self, url: str, *, chunk_size: int = 2**16) -> AsyncIterator[bytes]:
+        cache = self.cdn_cache
+        run = self.loop.run_in_executor
+        if cache is not None and (fp := await run(None, cache.open, url)) is not None:
+            with fp:
+                while chunk := await run(None, fp.read, chunk_size):
+                    yield chunk
+            return
+
+        session = self._get_cdn_session()
+        async with session.get(url, proxy=self.proxy, proxy_auth=self.proxy_auth) as resp:
+            self._check_cdn_response(resp)
+            if cache is None:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    yield chunk
+                return
+
+            # the file is only added to the cache if it was downloaded completely,
+            # i.e. not if the download failed or the iterator was closed early
+            writer = await run(None, cache.writer, url)
+            try:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    await run(None, writer.write, chunk)
+                    yield chunk
+            except BaseException:
+                await run(None, writer.abort)
+                raise
+            await run(None, writer.commit)
 
     # state management
 
     async def close(self) -> None:
         if self.__session:
             await self.__session.close()
+        if self.__cdn_session is not None:
+            await self.__cdn_session.close()
 
     # login management
 
     async def static_login(self, token: str) -> user.User:
         # Necessary to get aiohttp to stop complaining about session creation
-        self.__session = aiohttp.ClientSession(
-            connector=self.connector,
-            ws_response_class=DiscordClientWebSocketResponse,
-            headers={
-                "User-Agent": self.user_agent,
-            },
-        )
+        self.__session = self._create_session()
         old_token = self.token
         self.token = token
 
@@ -1653,6 +2223,10 @@ class HTTPClient:
         *,
         reason: str | None = None,
     ) -> Response[sticker.GuildSticker]:
+        if not isinstance(file.fp, io.IOBase):
+            msg = "Sticker files cannot be streamed"
+            raise TypeError(msg)
+
         initial_bytes = file.fp.read(16)
 
         try:
@@ -1668,7 +2242,7 @@ class HTTPClient:
         form: list[dict[str, Any]] = [
             {
                 "name": "file",
-                "value": file.fp,
+                "value": file,
                 "filename": file.filename,
                 "content_type": mime_type,
             }
@@ -4,15 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from collections.abc import AsyncIterator, Awaitable, Callable, Generator
+import heapq
+import itertools
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterable, Mapping
 from typing import (
     TYPE_CHECKING,
     Any,
+    Generic,
     TypeVar,
     Union,
     cast,
 )
 
+from typing_extensions import ParamSpec, Self
+
 from disnake import utils
 
 from .app_commands import application_command_factory
@@ -20,6 +27,7 @@ from .audit_logs import AuditLogEntry
 from .automod import AutoModRule
 from .bans import BanEntry
 from .entitlement import Entitlement
+from .enums import try_enum_to_int
 from .errors import NoMoreItems
 from .guild_scheduled_event import GuildScheduledEvent
 from .integrations import PartialIntegration
@@ -31,10 +39,13 @@ from .utils import maybe_coroutine, parse_time, snowflake_time, time_snowflake
 __all__ = (
     "ReactionIterator",
     "HistoryIterator",
+    "HistoryScanner",
     "BanIterator",
     "AuditLogIterator",
+    "AuditLogTail",
     "GuildIterator",
     "MemberIterator",
+    "BulkMemberEditIterator",
     "GuildScheduledEventUserIterator",
     "EntitlementIterator",
     "SubscriptionIterator",
@@ -46,7 +57,7 @@ if TYPE_CHECKING:
     from .app_commands import APIApplicationCommand
     from .client import Client
     from .guild import Guild
-    from .member import Member
+    from .member import BulkMemberEditResult, Member
     from .message import Message
     from .state import ConnectionState
     from .types.audit_log import (
@@ -68,11 +79,86 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 OT = TypeVar("OT")
+PT = TypeVar("PT")
+P = ParamSpec("P")
 _Func = Callable[[T], OT | Awaitable[OT]]
 
 OLDEST_OBJECT = Object(id=0)
 
 
+def _background(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Wraps an HTTP method, sending its requests with low priority so that
+    long-running pagination doesn't delay interaction responses and other requests.
+    """
+    from .http import RequestPriority, request_priority
+
+    async def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
+        with request_priority(RequestPriority.low):
+            return await func(*args, **kwargs)
+
+    return wrapped
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    # marks the exception as retrieved, to avoid warnings for prefetched pages that are never used
+    if not task.cancelled():
+        task.exception()
+
+
+def _cancel_tasks(tasks: Iterable[asyncio.Task[Any]]) -> None:
+    for task in tasks:
+        task.cancel()
+
+
+class _PageFetcher(Generic[T]):
+    """Fetches the pages of a paginated endpoint one after another,
+    optionally requesting up to ``depth`` pages in advance in the background.
+
+    ``fetch`` must update the pagination parameters before returning,
+    so that the next page can be requested right away.
+    Since each page depends on the previous one, only one request
+    is in flight at a time, which keeps the bucket rate limit intact.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[T]], depth: int = 0) -> None:
+        if depth < 0:
+            msg = "prefetch must be greater than or equal to 0."
+            raise ValueError(msg)
+
+        self.fetch = fetch
+        self.depth = depth
+        self._pending: deque[asyncio.Task[T]] = deque()
+        self._last: asyncio.Task[T] | None = None
+
+    async def next_page(self) -> T:
+        if not self.depth:
+            return await self.fetch()
+
+        if not self._pending:
+            self._schedule()
+        task = self._pending.popleft()
+        while len(self._pending) < self.depth:
+            self._schedule()
+        return await task
+
+    def _schedule(self) -> None:
+        task = asyncio.create_task(self._fetch_after(self._last))
+        task.add_done_callback(_retrieve_exception)
+        self._pending.append(task)
+        self._last = task
+
+    async def _fetch_after(self, previous: asyncio.Task[T] | None) -> T:
+        if previous is not None:
+            # wait for the previous page, which updates the pagination parameters;
+            # this also propagates its errors
+            await previous
+        return await self.fetch()
+
+    def cancel(self) -> None:
+        while self._pending:
+            self._pending.popleft().cancel()
+
+
 class _AsyncIterator(AsyncIterator[T]):
     __slots__ = ()
 
@@ -119,6 +205,9 @@ class _AsyncIterator(AsyncIterator[T]):
     async def flatten(self) -> list[T]:
         return [element async for element in self]
 
+    async def aclose(self) -> None:
+        pass
+
     async def __anext__(self) -> T:
         try:
             return await self.next()
@@ -131,6 +220,9 @@ class _ChunkedAsyncIterator(_AsyncIterator[list[T]]):
         self.iterator = iterator
         self.max_size = max_size
 
+    async def aclose(self) -> None:
+        await self.iterator.aclose()
+
     async def next(self) -> list[T]:
         ret: list[T] = []
         n = 0
@@ -152,6 +244,9 @@ class _MappedAsyncIterator(_AsyncIterator[OT]):
         self.iterator = iterator
         self.func = func
 
+    async def aclose(self) -> None:
+        await self.iterator.aclose()
+
     async def next(self) -> OT:
         # this raises NoMoreItems and will propagate appropriately
         item = await self.iterator.next()
@@ -167,6 +262,9 @@ class _FilteredAsyncIterator(_AsyncIterator[T]):
 
         self.predicate: _Func[T, bool] = predicate
 
+    async def aclose(self) -> None:
+        await self.iterator.aclose()
+
     async def next(self) -> T:
         getter = self.iterator.next
         pred = self.predicate
@@ -178,13 +276,127 @@ class _FilteredAsyncIterator(_AsyncIterator[T]):
                 return item
 
 
+class _PaginatedIterator(_AsyncIterator[T], Generic[T, PT]):
+    # iterators fetching pages using a `_PageFetcher`, which also support
+    # yielding raw payloads instead of models, and resuming from a cursor
+    _pages: _PageFetcher[tuple[Any, dict[str, Any]]]
+    _queue: asyncio.Queue[Any]
+    _raw: bool = False
+    # the name of the attribute advanced by the pagination strategy
+    _cursor_key: str
+    # the cursors before and after the page currently being consumed
+    _page_start: dict[str, Any] | None = None
+    _page_end: dict[str, Any] | None = None
+    # the last item taken from the current page, and the number of items taken from it
+    _last_item: Any = None
+    _taken: int = 0
+
+    def _create_page_fetcher(
+        self, queue: asyncio.Queue[Any], fetch: Callable[[], Awaitable[Any]], prefetch: int
+    ) -> _PageFetcher[tuple[Any, dict[str, Any]]]:
+        self._queue = queue
+        # the fetcher's background tasks only reference this iterator weakly, so that pending
+        # prefetches can be cancelled once it is garbage collected, e.g. after `break`ing out
+        # of an `async for` loop without calling `aclose()`
+        fetch_ref = weakref.WeakMethod(fetch)
+        self_ref = weakref.ref(self)
+
+        async def fetch_with_cursor() -> tuple[Any, dict[str, Any]]:
+            fetch = fetch_ref()
+            if fetch is None:
+                raise asyncio.CancelledError
+            data = await fetch()
+            # pagination parameters were updated by `fetch`
+            # (`fetch` is still referenced here, so the iterator is too)
+            iterator = self_ref()
+            assert iterator is not None
+            return data, iterator._snapshot()
+
+        pages = _PageFetcher(fetch_with_cursor, prefetch)
+        weakref.finalize(self, pages.cancel)
+        return pages
+
+    async def _next_page(self) -> Any:
+        if self._page_end is None:
+            self._page_end = self._snapshot()
+        data, cursor = await self._pages.next_page()
+        self._page_start, self._page_end = self._page_end, cursor
+        self._last_item, self._taken = None, 0
+        return data
+
+    def _take(self) -> Any:
+        # takes the next item of the current page, raising `asyncio.QueueEmpty` if there is none
+        item = self._queue.get_nowait()
+        self._last_item = item
+        self._taken += 1
+        return item
+
+    def _item_id(self, item: Any) -> int:
+        return int(item["id"]) if self._raw else item.id
+
+    def _ordered_pages(self) -> bool:
+        # whether the items of each page are yielded in the direction of pagination,
+        # i.e. whether the last yielded item can be used as the cursor position
+        return True
+
+    def _snapshot(self) -> dict[str, Any]:
+        position: Snowflake | None = getattr(self, self._cursor_key)
+        return {
+            "strategy": self._cursor_key,
+            "position": position.id if position is not None else None,
+            "limit": self.limit,  # pyright: ignore[reportAttributeAccessIssue]
+        }
+
+    @property
+    def cursor(self) -> dict[str, Any]:
+        if self._page_end is None:
+            # nothing was fetched yet
+            return self._snapshot()
+        if self._queue.empty() or self._page_start is None:
+            return self._page_end
+        if self._last_item is None or not self._ordered_pages():
+            # the current page has to be fetched again
+            return self._page_start
+
+        # continue right after the last item that was yielded
+        limit = self._page_start["limit"]
+        return {
+            "strategy": self._cursor_key,
+            "position": self._item_id(self._last_item),
+            "limit": limit - self._taken if limit is not None else None,
+        }
+
+    def resume(self, cursor: dict[str, Any]) -> Self:
+        if self._page_end is not None:
+            msg = "Cannot resume an iterator that has already been started."
+            raise RuntimeError(msg)
+        if cursor["strategy"] != self._cursor_key:
+            msg = (
+                f"Cursor was created by an iterator using {cursor['strategy']!r} pagination, "
+                f"but this iterator uses {self._cursor_key!r} pagination."
+            )
+            raise ValueError(msg)
+
+        position = cursor["position"]
+        setattr(self, self._cursor_key, Object(id=position) if position is not None else None)
+        self.limit = cursor["limit"]
+        return self
+
+    async def aclose(self) -> None:
+        self._pages.cancel()
+
+    def raw(self) -> _AsyncIterator[PT]:
+        self._raw = True
+        return cast("_AsyncIterator[PT]", self)
+
+
 class ReactionIterator(_AsyncIterator[Union["User", "Member"]]):
     def __init__(self, message, emoji, limit: int = 100, after=None) -> None:
         self.message = message
         self.limit = limit
         self.after = after
         state = message._state
-        self.getter = state.http.get_reaction_users
+        self.getter = _background(state.http.get_reaction_users)
         self.state = state
         self.emoji = emoji
         self.guild = message.guild
@@ -225,7 +437,7 @@ class ReactionIterator(_AsyncIterator[Union["User", "Member"]]):
                         await self.users.put(self.state.create_user(data=element))
 
 
-class HistoryIterator(_AsyncIterator["Message"]):
+class HistoryIterator(_PaginatedIterator["Message", "MessagePayload"]):
     """Iterator for receiving a channel's message history.
 
     The messages endpoint has two behaviours we care about here:
@@ -257,6 +469,8 @@ class HistoryIterator(_AsyncIterator["Message"]):
     oldest_first: :class:`bool` | :data:`None`
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if `after` is specified, otherwise ``False``.
+    prefetch: :class:`int`
+        The number of pages to request in advance.
     """
 
     def __init__(
@@ -267,6 +481,7 @@ class HistoryIterator(_AsyncIterator["Message"]):
         after: Snowflake | datetime.datetime | None = None,
         around: Snowflake | datetime.datetime | None = None,
         oldest_first: bool | None = None,
+        prefetch: int = 0,
     ) -> None:
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -289,8 +504,9 @@ class HistoryIterator(_AsyncIterator["Message"]):
         self._filter: Callable[[MessagePayload], bool] | None = None
 
         self.state = self.messageable._state
-        self.logs_from = self.state.http.logs_from
+        self.logs_from = _background(self.state.http.logs_from)
         self.messages = asyncio.Queue()
+        self._pages = self._create_page_fetcher(self.messages, self._fetch_messages, prefetch)
 
         if self.around:
             if self.limit is None:
@@ -303,6 +519,7 @@ class HistoryIterator(_AsyncIterator["Message"]):
                 self.limit = 100  # Thanks Discord
 
             self._retrieve_messages = self._retrieve_messages_around_strategy
+            self._cursor_key = "around"
             if before and self.after:
                 self._filter = lambda m: self.after.id < int(m["id"]) < before.id
             elif before:
@@ -312,10 +529,12 @@ class HistoryIterator(_AsyncIterator["Message"]):
         else:
             if self.reverse:
                 self._retrieve_messages = self._retrieve_messages_after_strategy
+                self._cursor_key = "after"
                 if before:
                     self._filter = lambda m: int(m["id"]) < before.id
             else:
                 self._retrieve_messages = self._retrieve_messages_before_strategy
+                self._cursor_key = "before"
                 if self.after and self.after != OLDEST_OBJECT:
                     self._filter = lambda m: int(m["id"]) > self.after.id
 
@@ -324,7 +543,7 @@ class HistoryIterator(_AsyncIterator["Message"]):
             await self.fill_messages()
 
         try:
-            return self.messages.get_nowait()
+            return self._take()
         except asyncio.QueueEmpty:
             raise NoMoreItems from None
 
@@ -337,22 +556,36 @@ class HistoryIterator(_AsyncIterator["Message"]):
         self.retrieve = retrieve
         return retrieve > 0
 
-    async def fill_messages(self) -> None:
+    def _ordered_pages(self) -> bool:
+        return self._cursor_key != "around"
+
+    async def _fetch_messages(self) -> list[MessagePayload]:
         if not hasattr(self, "channel"):
             # do the required set up
             channel = await self.messageable._get_channel()
             self.channel = channel
 
-        if self._get_retrieve():
-            data = await self._retrieve_messages(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0  # terminate the infinite loop
+        if not self._get_retrieve():
+            return []
 
+        data = await self._retrieve_messages(self.retrieve)
+        if len(data) < 100:
+            self.limit = 0  # terminate the infinite loop
+        return data
+
+    async def fill_messages(self) -> None:
+        data = await self._next_page()
+        if data:
             if self.reverse:
                 data = reversed(data)
             if self._filter:
                 data = filter(self._filter, data)
 
+            if self._raw:
+                for element in data:
+                    await self.messages.put(element)
+                return
+
             channel = self.channel
             for element in data:
                 await self.messages.put(self.state.create_message(channel=channel, data=element))
@@ -393,7 +626,243 @@ class HistoryIterator(_AsyncIterator["Message"]):
         return []
 
 
-class BanIterator(_AsyncIterator["BanEntry"]):
+class HistoryScanner(_AsyncIterator["Message"]):
+    """Iterator for receiving the message history of multiple channels concurrently.
+
+    Each channel is iterated using a :class:`HistoryIterator`. Since channels
+    have separate rate limit buckets, multiple channels can be fetched at the same time.
+
+    If ``ordered`` is ``False``, up to ``concurrency`` channels are scanned at once,
+    and messages are yielded as soon as they are received, in no particular order
+    across channels. Otherwise, the history of all channels is merged, and messages
+    are yielded in the order of their IDs, with up to ``concurrency`` pages being
+    requested at once.
+
+    Parameters
+    ----------
+    channels: Iterable[:class:`abc.Messageable`]
+        The channels to retrieve message history from.
+    limit: :class:`int` | :data:`None`
+        Maximum number of messages to retrieve per channel.
+    before: :class:`abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+        Message before which all messages must be.
+    after: :class:`abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+        Message after which all messages must be.
+    oldest_first: :class:`bool` | :data:`None`
+        If set to ``True``, return messages in oldest->newest order. Defaults to
+        ``True`` if `after` is specified, otherwise ``False``.
+    concurrency: :class:`int`
+        Maximum number of channels to retrieve messages from at the same time.
+    ordered: :class:`bool`
+        Whether to merge messages from all channels by ID.
+    cursors: Mapping[:class:`int`, :class:`dict`] | :data:`None`
+        Cursors of channels to resume, keyed by channel ID.
+    prefetch: :class:`int`
+        The number of pages to request in advance per channel.
+    """
+
+    def __init__(
+        self,
+        channels: Iterable[Messageable],
+        *,
+        limit: int | None = None,
+        before: Snowflake | datetime.datetime | None = None,
+        after: Snowflake | datetime.datetime | None = None,
+        oldest_first: bool | None = None,
+        concurrency: int = 5,
+        ordered: bool = False,
+        cursors: Mapping[int, dict[str, Any]] | None = None,
+        prefetch: int = 0,
+    ) -> None:
+        if concurrency <= 0:
+            msg = "concurrency must be greater than 0."
+            raise ValueError(msg)
+
+        self.channels: list[Messageable] = list(channels)
+        self.limit = limit
+        self.before = before
+        self.after = after
+        self.oldest_first = oldest_first
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.prefetch = prefetch
+
+        self.reverse = oldest_first if oldest_first is not None else after is not None
+        self._cursors: dict[int, dict[str, Any]] = dict(cursors or {})
+        self._started = False
+
+        # unordered mode; items are `(channel id, message or None if done, cursor)`,
+        # or exceptions raised by a worker, or `None` once a worker is done
+        self._queue: asyncio.Queue[tuple[int, Message | None, dict[str, Any]] | Exception | None]
+        self._queue = asyncio.Queue(maxsize=concurrency * 100)
+        self._workers: list[asyncio.Task[None]] = []
+        self._active_workers = 0
+
+        # ordered mode; heap items are `(sort key, index, message, cursor)`
+        self._iterators: list[tuple[int, HistoryIterator]] = []
+        self._heap: list[tuple[int, int, Message, dict[str, Any]]] = []
+        self._advance_index: int | None = None
+        # pending requests for the next message of each channel, keyed by index
+        self._fetches: dict[int, asyncio.Task[Message]] = {}
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        # background tasks only reference the scanner weakly, so that they can be cancelled
+        # once it is garbage collected, e.g. after `break`ing out of an `async for` loop
+        # without calling `aclose()`
+        weakref.finalize(self, _cancel_tasks, self._workers)
+        weakref.finalize(self, _cancel_tasks, self._fetches.values())
+
+    @property
+    def cursors(self) -> dict[int, dict[str, Any]]:
+        """Dict[:class:`int`, :class:`dict`]: The cursors of all channels that have been
+        started, keyed by channel ID. These can be passed as ``cursors`` to a new scanner
+        to resume scanning.
+        """
+        return self._cursors.copy()
+
+    def _create_iterator(self, channel: Messageable) -> tuple[int, HistoryIterator]:
+        channel_id: int = channel.id  # pyright: ignore[reportAttributeAccessIssue]
+        iterator = HistoryIterator(
+            channel,
+            limit=self.limit,
+            before=self.before,
+            after=self.after,
+            oldest_first=self.oldest_first,
+            prefetch=self.prefetch,
+        )
+        if (cursor := self._cursors.get(channel_id)) is not None:
+            iterator.resume(cursor)
+        return channel_id, iterator
+
+    async def next(self) -> Message:
+        if not self._started:
+            self._started = True
+            if self.ordered:
+                await self._start_ordered()
+            else:
+                self._start_unordered()
+
+        if self.ordered:
+            return await self._next_ordered()
+        return await self._next_unordered()
+
+    async def aclose(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        for fetch in self._fetches.values():
+            fetch.cancel()
+        self._fetches.clear()
+        for _, iterator in self._iterators:
+            await iterator.aclose()
+
+    # unordered mode
+
+    def _start_unordered(self) -> None:
+        channels = deque(self.channels)
+        self._active_workers = min(self.concurrency, len(channels))
+        create_iterator = weakref.WeakMethod(self._create_iterator)
+        self._workers.extend(
+            asyncio.create_task(self._worker(self._queue, channels, create_iterator))
+            for _ in range(self._active_workers)
+        )
+
+    @staticmethod
+    async def _worker(
+        queue: asyncio.Queue[tuple[int, Message | None, dict[str, Any]] | Exception | None],
+        channels: deque[Messageable],
+        create_iterator_ref: weakref.WeakMethod[
+            Callable[[Messageable], tuple[int, HistoryIterator]]
+        ],
+    ) -> None:
+        try:
+            while channels:
+                create_iterator = create_iterator_ref()
+                if create_iterator is None:
+                    return
+                channel_id, iterator = create_iterator(channels.popleft())
+                del create_iterator
+                try:
+                    while True:
+                        try:
+                            message = await iterator.next()
+                        except NoMoreItems:
+                            break
+                        await queue.put((channel_id, message, iterator.cursor))
+                    await queue.put((channel_id, None, iterator.cursor))
+                finally:
+                    await iterator.aclose()
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    async def _next_unordered(self) -> Message:
+        while self._active_workers:
+            item = await self._queue.get()
+            if item is None:
+                self._active_workers -= 1
+                continue
+            if isinstance(item, Exception):
+                await self.aclose()
+                raise item
+
+            channel_id, message, cursor = item
+            # only update the cursor once the message is consumed
+            self._cursors[channel_id] = cursor
+            if message is not None:
+                return message
+
+        raise NoMoreItems
+
+    # ordered mode
+
+    async def _start_ordered(self) -> None:
+        self._iterators = [self._create_iterator(channel) for channel in self.channels]
+        await asyncio.gather(*(self._advance(index) for index in range(len(self._iterators))))
+
+    @staticmethod
+    async def _fetch(iterator: HistoryIterator, semaphore: asyncio.Semaphore) -> Message:
+        if not iterator._queue.empty():
+            return await iterator.next()
+        # a new page has to be requested; limit the number of requests in flight
+        async with semaphore:
+            return await iterator.next()
+
+    async def _advance(self, index: int) -> None:
+        channel_id, iterator = self._iterators[index]
+        fetch = self._fetches.pop(index, None)
+        try:
+            message = await (fetch if fetch is not None else self._fetch(iterator, self._semaphore))
+        except NoMoreItems:
+            self._cursors[channel_id] = iterator.cursor
+            await iterator.aclose()
+            return
+
+        key = message.id if self.reverse else -message.id
+        heapq.heappush(self._heap, (key, index, message, iterator.cursor))
+        if iterator._queue.empty():
+            # the channel's current page is used up; request the next one right away
+            # instead of once this message is returned, so that pages of multiple
+            # channels are fetched concurrently
+            self._fetches[index] = asyncio.create_task(self._fetch(iterator, self._semaphore))
+
+    async def _next_ordered(self) -> Message:
+        # the channel of the previously returned message is advanced lazily,
+        # to not delay returning it
+        if self._advance_index is not None:
+            index, self._advance_index = self._advance_index, None
+            await self._advance(index)
+
+        if not self._heap:
+            raise NoMoreItems
+
+        _, index, message, cursor = heapq.heappop(self._heap)
+        self._cursors[self._iterators[index][0]] = cursor
+        self._advance_index = index
+        return message
+
+
+class BanIterator(_PaginatedIterator["BanEntry", "BanPayload"]):
     """Iterator for receiving a guild's bans.
 
     The bans endpoint has two behaviours we care about here:
@@ -417,6 +886,8 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         Object before which all bans must be.
     after: :class:`abc.Snowflake` | :data:`None`
         Object after which all bans must be.
+    prefetch: :class:`int`
+        The number of pages to request in advance.
     """
 
     def __init__(
@@ -425,6 +896,7 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         limit: int | None = None,
         before: Snowflake | None = None,
         after: Snowflake | None = None,
+        prefetch: int = 0,
     ) -> None:
         self.guild = guild
         self.limit = limit
@@ -432,24 +904,27 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         self.after = after or OLDEST_OBJECT
 
         self.state = self.guild._state
-        self.get_bans = self.state.http.get_bans
+        self.get_bans = _background(self.state.http.get_bans)
         self.bans = asyncio.Queue()
+        self._pages = self._create_page_fetcher(self.bans, self._fetch_bans, prefetch)
 
         self._filter: Callable[[BanPayload], bool] | None = None
 
         if self.before:
             self._retrieve_bans = self._retrieve_bans_before_strategy
+            self._cursor_key = "before"
             if self.after != OLDEST_OBJECT:
                 self._filter = lambda b: int(b["user"]["id"]) > self.after.id
         else:
             self._retrieve_bans = self._retrieve_bans_after_strategy
+            self._cursor_key = "after"
 
     async def next(self) -> BanEntry:
         if self.bans.empty():
             await self.fill_bans()
 
         try:
-            return self.bans.get_nowait()
+            return self._take()
         except asyncio.QueueEmpty:
             raise NoMoreItems from None
 
@@ -457,15 +932,34 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         self.retrieve = min(self.limit, 1000) if self.limit is not None else 1000
         return self.retrieve > 0
 
-    async def fill_bans(self) -> None:
-        if self._get_retrieve():
-            data = await self._retrieve_bans(self.retrieve)
-            if len(data) < 1000:
-                self.limit = 0  # terminate the infinite loop
+    def _item_id(self, item: Any) -> int:
+        return int(item["user"]["id"]) if self._raw else item.user.id
 
+    def _ordered_pages(self) -> bool:
+        # pages are requested in descending order when using `before`,
+        # but the bans within each page are ascending
+        return self._cursor_key == "after"
+
+    async def _fetch_bans(self) -> list[BanPayload]:
+        if not self._get_retrieve():
+            return []
+
+        data = await self._retrieve_bans(self.retrieve)
+        if len(data) < 1000:
+            self.limit = 0  # terminate the infinite loop
+        return data
+
+    async def fill_bans(self) -> None:
+        data = await self._next_page()
+        if data:
             if self._filter:
                 data = filter(self._filter, data)
 
+            if self._raw:
+                for element in data:
+                    await self.bans.put(element)
+                return
+
             for element in data:
                 await self.bans.put(
                     BanEntry(
@@ -495,7 +989,7 @@ class BanIterator(_AsyncIterator["BanEntry"]):
         return data
 
 
-class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
+class AuditLogIterator(_PaginatedIterator["AuditLogEntry", "AuditLogEntryPayload"]):
     def __init__(
         self,
         guild: Guild,
@@ -505,6 +999,7 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
         user_id: int | None = None,
         action_type: AuditLogEvent | None = None,
         oldest_first: bool = False,
+        prefetch: int = 0,
     ) -> None:
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -519,17 +1014,20 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
 
         self.guild = guild
         self._state = guild._state
-        self.request = guild._state.http.get_audit_logs
+        self.request = _background(guild._state.http.get_audit_logs)
 
-        self.entries: asyncio.Queue[AuditLogEntry] = asyncio.Queue()
+        self.entries = asyncio.Queue()
+        self._pages = self._create_page_fetcher(self.entries, self._fetch, prefetch)
 
         self._filter: Callable[[AuditLogEntryPayload], bool] | None = None
         if oldest_first:
             self._strategy = self._after_strategy
+            self._cursor_key = "after"
             if before:
                 self._filter = lambda m: int(m["id"]) < before.id
         else:
             self._strategy = self._before_strategy
+            self._cursor_key = "before"
             if self.after and self.after != OLDEST_OBJECT:
                 self._filter = lambda m: int(m["id"]) > self.after.id
 
@@ -574,7 +1072,7 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
             await self._fill()
 
         try:
-            return self.entries.get_nowait()
+            return self._take()
         except asyncio.QueueEmpty:
             raise NoMoreItems from None
 
@@ -587,15 +1085,28 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
         self.retrieve = retrieve
         return retrieve > 0
 
+    async def _fetch(self) -> AuditLogPayload | None:
+        if not self._get_retrieve():
+            return None
+
+        log_data = await self._strategy(self.retrieve)
+        if len(log_data.get("audit_log_entries")) < 100:
+            self.limit = 0  # terminate the infinite loop
+        return log_data
+
     async def _fill(self) -> None:
-        if self._get_retrieve():
-            log_data = await self._strategy(self.retrieve)
+        log_data = await self._next_page()
+        if log_data is not None:
             entries = log_data.get("audit_log_entries")
-            if len(entries) < 100:
-                self.limit = 0  # terminate the infinite loop
-
             if self._filter:
                 entries = filter(self._filter, entries)
+            # https://github.com/discord/discord-api-docs/issues/5055#issuecomment-1266363766
+            entries = [e for e in entries if e["action_type"] is not None]  # pyright: ignore[reportUnnecessaryComparison]
+
+            if self._raw:
+                for element in entries:
+                    await self.entries.put(element)
+                return
 
             state = self._state
 
@@ -635,10 +1146,6 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
             }
 
             for element in entries:
-                # https://github.com/discord/discord-api-docs/issues/5055#issuecomment-1266363766
-                if element["action_type"] is None:  # pyright: ignore[reportUnnecessaryComparison]
-                    continue
-
                 await self.entries.put(
                     AuditLogEntry(
                         data=element,
@@ -654,7 +1161,141 @@ class AuditLogIterator(_AsyncIterator["AuditLogEntry"]):
                 )
 
 
-class GuildIterator(_AsyncIterator["Guild"]):
+class AuditLogTail(_AsyncIterator["AuditLogEntry"]):
+    """Iterator for receiving new audit log entries of a guild as they are created.
+
+    Entries are received through the :func:`on_audit_log_entry_create` event. Entries
+    that may have been missed (i.e. before the first entry, or when a new gateway
+    session was started) are retrieved using an :class:`AuditLogIterator`.
+
+    Parameters
+    ----------
+    guild: :class:`Guild`
+        The guild to receive audit log entries for.
+    after: :class:`abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
+        The entry after which to start. If :data:`None`, only entries created
+        after this iterator are returned.
+    user_id: :class:`int` | :data:`None`
+        Only return entries of actions performed by this user.
+    action_type: :class:`int` | :data:`None`
+        Only return entries of this action type.
+    """
+
+    # the number of returned entry IDs to remember for deduplication
+    _MAX_RETURNED = 1000
+
+    def __init__(
+        self,
+        guild: Guild,
+        *,
+        after: Snowflake | datetime.datetime | None = None,
+        user_id: int | None = None,
+        action_type: AuditLogEvent | None = None,
+    ) -> None:
+        self.guild = guild
+        self.state = guild._state
+        self.user_id = user_id
+        self.action_type = action_type
+
+        if after is None:
+            self._last_id = time_snowflake(utils.utcnow())
+            self._gap = False
+        else:
+            if isinstance(after, datetime.datetime):
+                after = Object(id=time_snowflake(after, high=True))
+            self._last_id = after.id
+            self._gap = True
+        self._after = self._last_id
+
+        # live entries, ordered by ID; the counter avoids comparing entries with equal IDs
+        self._live: list[tuple[int, int, AuditLogEntry]] = []
+        self._counter = itertools.count()
+        self._catch_up: AuditLogIterator | None = None
+        self._wakeup = asyncio.Event()
+        # IDs of recently returned entries; entries aren't necessarily received in order,
+        # so this is used instead of `_last_id` to avoid returning entries twice
+        self._returned: set[int] = set()
+        self._returned_order: deque[int] = deque()
+
+        # register right away, to not miss entries or new sessions before the first `next()`
+        self.state._audit_log_tails.setdefault(self.guild.id, weakref.WeakSet()).add(self)
+        self._registered = True
+
+    @property
+    def last_id(self) -> int:
+        """:class:`int`: The highest ID of the returned entries, or the ID the iterator started after.
+        This can be passed as ``after`` to a new iterator to continue from this point.
+        """
+        return self._last_id
+
+    def _matches(self, entry: AuditLogEntry) -> bool:
+        if self.action_type is not None and try_enum_to_int(entry.action) != self.action_type:
+            return False
+        return self.user_id is None or (entry.user is not None and entry.user.id == self.user_id)
+
+    def _push(self, entry: AuditLogEntry) -> None:
+        if entry.id > self._after and entry.id not in self._returned and self._matches(entry):
+            heapq.heappush(self._live, (entry.id, next(self._counter), entry))
+            self._wakeup.set()
+
+    def _mark_gap(self) -> None:
+        self._gap = True
+        self._wakeup.set()
+
+    def _mark_returned(self, entry_id: int) -> None:
+        self._returned.add(entry_id)
+        self._returned_order.append(entry_id)
+        if len(self._returned_order) > self._MAX_RETURNED:
+            self._returned.discard(self._returned_order.popleft())
+        self._last_id = max(self._last_id, entry_id)
+
+    async def next(self) -> AuditLogEntry:
+        while True:
+            if self._catch_up is not None:
+                try:
+                    entry = await self._catch_up.next()
+                except NoMoreItems:
+                    self._catch_up = None
+                    continue
+                except Exception:
+                    # retry from the last returned entry next time
+                    self._catch_up = None
+                    self._gap = True
+                    raise
+            elif self._gap:
+                self._gap = False
+                # the guild object is replaced when reconnecting
+                guild = self.state._get_guild(self.guild.id) or self.guild
+                self._catch_up = AuditLogIterator(
+                    guild,
+                    limit=None,
+                    after=Object(id=self._last_id),
+                    user_id=self.user_id,
+                    action_type=self.action_type,
+                    oldest_first=True,
+                )
+                continue
+            elif self._live:
+                _, _, entry = heapq.heappop(self._live)
+            else:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            # entries received both live and while catching up are only returned once
+            if entry.id not in self._returned:
+                self._mark_returned(entry.id)
+                return entry
+
+    async def aclose(self) -> None:
+        if self._registered:
+            self._registered = False
+            tails = self.state._audit_log_tails.get(self.guild.id)
+            if tails is not None:
+                tails.discard(self)
+
+
+class GuildIterator(_PaginatedIterator["Guild", "GuildPayload"]):
     """Iterator for receiving the client's guilds.
 
     The guilds endpoint has the same two behaviours as described
@@ -681,6 +1322,8 @@ class GuildIterator(_AsyncIterator["Guild"]):
         Object before which all guilds must be.
     after: :class:`abc.Snowflake` | :class:`datetime.datetime` | :data:`None`
         Object after which all guilds must be.
+    prefetch: :class:`int`
+        The number of pages to request in advance.
     """
 
     def __init__(
@@ -690,6 +1333,7 @@ class GuildIterator(_AsyncIterator["Guild"]):
         before: Snowflake | datetime.datetime | None = None,
         after: Snowflake | datetime.datetime | None = None,
         with_counts: bool = True,
+        prefetch: int = 0,
     ) -> None:
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -705,24 +1349,27 @@ class GuildIterator(_AsyncIterator["Guild"]):
         self._filter: Callable[[GuildPayload], bool] | None = None
 
         self.state = self.bot._connection
-        self.get_guilds = self.bot.http.get_guilds
-        self.guilds: asyncio.Queue[Guild] = asyncio.Queue()
+        self.get_guilds = _background(self.bot.http.get_guilds)
+        self.guilds = asyncio.Queue()
+        self._pages = self._create_page_fetcher(self.guilds, self._fetch_guilds, prefetch)
 
         if self.before:
             self.reverse = True
             self._retrieve_guilds = self._retrieve_guilds_before_strategy
+            self._cursor_key = "before"
             if after:
                 self._filter = lambda m: int(m["id"]) > after.id
         else:
             self.reverse = False
             self._retrieve_guilds = self._retrieve_guilds_after_strategy
+            self._cursor_key = "after"
 
     async def next(self) -> Guild:
         if self.guilds.empty():
             await self.fill_guilds()
 
         try:
-            return self.guilds.get_nowait()
+            return self._take()
         except asyncio.QueueEmpty:
             raise NoMoreItems from None
 
@@ -740,19 +1387,25 @@ class GuildIterator(_AsyncIterator["Guild"]):
 
         return Guild(state=self.state, data=data)
 
-    async def fill_guilds(self) -> None:
-        if self._get_retrieve():
-            data = await self._retrieve_guilds(self.retrieve)
-            if len(data) < 200:
-                self.limit = 0
+    async def _fetch_guilds(self) -> list[GuildPayload]:
+        if not self._get_retrieve():
+            return []
 
+        data = await self._retrieve_guilds(self.retrieve)
+        if len(data) < 200:
+            self.limit = 0
+        return data
+
+    async def fill_guilds(self) -> None:
+        data = await self._next_page()
+        if data:
             if self.reverse:
                 data = reversed(data)
             if self._filter:
                 data = filter(self._filter, data)
 
             for element in data:
-                await self.guilds.put(self.create_guild(element))
+                await self.guilds.put(element if self._raw else self.create_guild(element))
 
     async def _retrieve_guilds(self, retrieve: int) -> list[GuildPayload]:
         """Retrieve guilds and update next parameters."""
@@ -783,12 +1436,15 @@ class GuildIterator(_AsyncIterator["Guild"]):
         return data
 
 
-class MemberIterator(_AsyncIterator["Member"]):
+class MemberIterator(_PaginatedIterator["Member", "MemberWithUserPayload"]):
+    _cursor_key = "after"
+
     def __init__(
         self,
         guild: Guild,
         limit: int | None = 1000,
         after: Snowflake | datetime.datetime | None = None,
+        prefetch: int = 0,
     ) -> None:
         if isinstance(after, datetime.datetime):
             after = Object(id=time_snowflake(after, high=True))
@@ -798,15 +1454,16 @@ class MemberIterator(_AsyncIterator["Member"]):
         self.after = after or OLDEST_OBJECT
 
         self.state = self.guild._state
-        self.get_members = self.state.http.get_members
+        self.get_members = _background(self.state.http.get_members)
         self.members = asyncio.Queue()
+        self._pages = self._create_page_fetcher(self.members, self._fetch_members, prefetch)
 
     async def next(self) -> Member:
         if self.members.empty():
             await self.fill_members()
 
         try:
-            return self.members.get_nowait()
+            return self._take()
         except asyncio.QueueEmpty:
             raise NoMoreItems from None
 
@@ -819,23 +1476,33 @@ class MemberIterator(_AsyncIterator["Member"]):
         self.retrieve = retrieve
         return retrieve > 0
 
-    async def fill_members(self) -> None:
-        if self._get_retrieve():
-            after = self.after.id if self.after else None
-            data = await self.get_members(self.guild.id, self.retrieve, after)
-            if not data:
-                # no data, terminate
-                return
+    async def _fetch_members(self) -> list[MemberWithUserPayload]:
+        if not self._get_retrieve():
+            return []
 
-            if self.limit is not None:
-                self.limit -= self.retrieve
-            if len(data) < 1000:
-                self.limit = 0  # terminate loop
+        after = self.after.id if self.after else None
+        data = await self.get_members(self.guild.id, self.retrieve, after)
+        if not data:
+            # no data, terminate
+            self.limit = 0
+            return data
 
-            self.after = Object(id=int(data[-1]["user"]["id"]))
+        if self.limit is not None:
+            self.limit -= self.retrieve
+        if len(data) < 1000:
+            self.limit = 0  # terminate loop
 
-            for element in reversed(data):
-                await self.members.put(self.create_member(element))
+        self.after = Object(id=int(data[-1]["user"]["id"]))
+        return data
+
+    def _ordered_pages(self) -> bool:
+        # pages are requested in ascending order, but the members within each page are reversed
+        return False
+
+    async def fill_members(self) -> None:
+        data = await self._next_page()
+        for element in reversed(data):
+            await self.members.put(element if self._raw else self.create_member(element))
 
     def create_member(self, data: MemberWithUserPayload) -> Member:
         from .member import Member
@@ -881,12 +1548,12 @@ class ArchivedThreadIterator(_AsyncIterator["Thread"]):
         self.update_before: Callable[[ThreadPayload], str] = self.get_archive_timestamp
 
         if joined:
-            self.endpoint = self.http.get_joined_private_archived_threads
+            self.endpoint = _background(self.http.get_joined_private_archived_threads)
             self.update_before = self.get_thread_id
         elif private:
-            self.endpoint = self.http.get_private_archived_threads
+            self.endpoint = _background(self.http.get_private_archived_threads)
         else:
-            self.endpoint = self.http.get_public_archived_threads
+            self.endpoint = _background(self.http.get_public_archived_threads)
 
         self.queue: asyncio.Queue[Thread] = asyncio.Queue()
         self.has_more: bool = True
@@ -940,6 +1607,208 @@ class ArchivedThreadIterator(_AsyncIterator["Thread"]):
         return Thread(guild=self.guild, state=self.guild._state, data=data)
 
 
+class _MemberEditor:
+    """Applies the changes of a :class:`BulkMemberEditIterator` to single members.
+
+    This is separate from the iterator, so that its workers don't keep it alive.
+    """
+
+    # timeouts closer than this to the member's current timeout are considered unchanged
+    _TIMEOUT_TOLERANCE = datetime.timedelta(seconds=5)
+
+    def __init__(
+        self,
+        guild: Guild,
+        add_roles: frozenset[int],
+        remove_roles: frozenset[int],
+        fields: dict[str, Any],
+        reason: str | None,
+    ) -> None:
+        self.guild = guild
+        self.state = guild._state
+        self.add_roles = add_roles
+        self.remove_roles = remove_roles
+        self.fields = fields
+        self.reason = reason
+
+        self.edit_member = _background(self.state.http.edit_member)
+        self.add_role = _background(self.state.http.add_role)
+        self.remove_role = _background(self.state.http.remove_role)
+
+    def _changed_fields(self, member: Member | None) -> dict[str, Any]:
+        if member is None:
+            return self.fields.copy()
+
+        fields = self.fields.copy()
+        if "nick" in fields and fields["nick"] == member.nick:
+            del fields["nick"]
+        if "communication_disabled_until" in fields:
+            timeout = fields["communication_disabled_until"]
+            current_timeout = member.current_timeout
+            # timeouts given as a duration are relative to the time the edit was requested,
+            # so they never exactly match an existing timeout set the same way
+            if timeout is None or current_timeout is None:
+                unchanged = timeout is current_timeout
+            else:
+                unchanged = abs(current_timeout - timeout) < self._TIMEOUT_TOLERANCE
+            if unchanged:
+                del fields["communication_disabled_until"]
+        return fields
+
+    async def edit(self, target: Snowflake) -> BulkMemberEditResult:
+        from .member import BulkMemberEditResult, Member
+
+        member = target if isinstance(target, Member) else self.guild.get_member(target.id)
+        result_member = member if member is not None else target
+        add_roles = self.add_roles
+        remove_roles = self.remove_roles
+        if member is not None:
+            # skip changes that are already reflected in the cache
+            add_roles = {r for r in add_roles if not member._roles.has(r)}
+            remove_roles = {r for r in remove_roles if member._roles.has(r)}
+        fields = self._changed_fields(member)
+
+        if not (add_roles or remove_roles or fields):
+            return BulkMemberEditResult(result_member, True, None)
+
+        # roles are changed individually, to not overwrite changes
+        # made in the meantime based on a possibly outdated role list
+        for role_id in add_roles:
+            await self.add_role(self.guild.id, target.id, role_id, reason=self.reason)
+        for role_id in remove_roles:
+            await self.remove_role(self.guild.id, target.id, role_id, reason=self.reason)
+
+        if not fields:
+            return BulkMemberEditResult(result_member, False, None)
+
+        if "communication_disabled_until" in fields:
+            fields["communication_disabled_until"] = utils.isoformat_utc(
+                fields["communication_disabled_until"]
+            )
+        data = await self.edit_member(self.guild.id, target.id, reason=self.reason, **fields)
+        return BulkMemberEditResult(
+            Member(data=data, guild=self.guild, state=self.state), False, None
+        )
+
+
+class BulkMemberEditIterator(_AsyncIterator["BulkMemberEditResult"]):
+    """Iterator for applying the same changes to multiple members.
+
+    Up to ``concurrency`` members are edited at the same time, and results
+    are yielded in the order in which the edits finish.
+
+    Parameters
+    ----------
+    guild: :class:`Guild`
+        The guild to edit members in.
+    members: Iterable[:class:`abc.Snowflake`]
+        The members to edit.
+    add_roles: Iterable[:class:`int`]
+        The IDs of the roles to add.
+    remove_roles: Iterable[:class:`int`]
+        The IDs of the roles to remove.
+    fields: Dict[:class:`str`, Any]
+        Other fields to set, with their (non-serialized) values.
+    reason: :class:`str` | :data:`None`
+        The reason shown in the audit log.
+    concurrency: :class:`int`
+        Maximum number of members to edit at the same time.
+    """
+
+    def __init__(
+        self,
+        guild: Guild,
+        members: Iterable[Snowflake],
+        *,
+        add_roles: Iterable[int] = (),
+        remove_roles: Iterable[int] = (),
+        fields: dict[str, Any] | None = None,
+        reason: str | None = None,
+        concurrency: int = 3,
+    ) -> None:
+        if concurrency <= 0:
+            msg = "concurrency must be greater than 0."
+            raise ValueError(msg)
+
+        self.guild = guild
+        self.state = guild._state
+        self.add_roles = frozenset(add_roles)
+        self.remove_roles = frozenset(remove_roles)
+        self.fields = fields or {}
+        self.reason = reason
+        self.concurrency = concurrency
+
+        # keyed by ID to remove duplicates, in original order
+        self._remaining: dict[int, Snowflake] = {m.id: m for m in members}
+        self._targets: deque[Snowflake] = deque(self._remaining.values())
+
+        self._editor = _MemberEditor(
+            guild, self.add_roles, self.remove_roles, self.fields, self.reason
+        )
+        self._results: asyncio.Queue[BulkMemberEditResult | Exception | None] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._active_workers = 0
+        self._started = False
+        # workers don't reference the iterator, so that they can be cancelled once it is
+        # garbage collected, e.g. after `break`ing out of an `async for` loop
+        # without calling `aclose()`
+        weakref.finalize(self, _cancel_tasks, self._workers)
+
+    @property
+    def remaining(self) -> list[Snowflake]:
+        """List[:class:`abc.Snowflake`]: The members whose results haven't been yielded yet."""
+        return list(self._remaining.values())
+
+    async def next(self) -> BulkMemberEditResult:
+        if not self._started:
+            self._started = True
+            self._active_workers = min(self.concurrency, len(self._targets))
+            self._workers.extend(
+                asyncio.create_task(self._worker(self._targets, self._results, self._editor))
+                for _ in range(self._active_workers)
+            )
+
+        while self._active_workers:
+            item = await self._results.get()
+            if item is None:
+                self._active_workers -= 1
+                continue
+            if isinstance(item, Exception):
+                await self.aclose()
+                raise item
+
+            del self._remaining[item.member.id]
+            return item
+
+        raise NoMoreItems
+
+    async def aclose(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+    @staticmethod
+    async def _worker(
+        targets: deque[Snowflake],
+        results: asyncio.Queue[BulkMemberEditResult | Exception | None],
+        editor: _MemberEditor,
+    ) -> None:
+        from .errors import HTTPException
+        from .member import BulkMemberEditResult
+
+        try:
+            while targets:
+                target = targets.popleft()
+                try:
+                    result = await editor.edit(target)
+                except HTTPException as e:
+                    result = BulkMemberEditResult(target, False, e)
+                await results.put(result)
+        except Exception as e:
+            await results.put(e)
+        else:
+            await results.put(None)
+
+
 class GuildScheduledEventUserIterator(_AsyncIterator[Union["User", "Member"]]):
     def __init__(
         self,
@@ -956,7 +1825,7 @@ class GuildScheduledEventUserIterator(_AsyncIterator[Union["User", "Member"]]):
         self.after: Snowflake | None = after
 
         self.state: ConnectionState = event._state
-        self.get_event_users = self.state.http.get_guild_scheduled_event_users
+        self.get_event_users = _background(self.state.http.get_guild_scheduled_event_users)
         self.users = asyncio.Queue()
 
         self._filter: Callable[[GuildScheduledEventUserPayload], bool] | None = None
@@ -1086,7 +1955,7 @@ class EntitlementIterator(_AsyncIterator["Entitlement"]):
         self.exclude_deleted: bool = exclude_deleted
 
         self.state: ConnectionState = state
-        self.request = state.http.get_entitlements
+        self.request = _background(state.http.get_entitlements)
 
         self.entitlements: asyncio.Queue[Entitlement] = asyncio.Queue()
 
@@ -1193,7 +2062,7 @@ class SubscriptionIterator(_AsyncIterator["Subscription"]):
         self.after: Snowflake = after or OLDEST_OBJECT
 
         self._state: ConnectionState = state
-        self.request = self._state.http.get_subscriptions
+        self.request = _background(self._state.http.get_subscriptions)
         self.subscriptions: asyncio.Queue[Subscription] = asyncio.Queue()
 
         self._filter: Callable[[SubscriptionPayload], bool] | None = None
@@ -1286,7 +2155,7 @@ class PollAnswerIterator(_AsyncIterator[Union["User", "Member"]]):
         self.limit: int | None = limit
         self.after: Snowflake | None = after
 
-        self.getter = message._state.http.get_poll_answer_voters
+        self.getter = _background(message._state.http.get_poll_answer_voters)
         self.users = asyncio.Queue()
 
     async def next(self) -> User | Member:
@@ -1353,7 +2222,7 @@ class ChannelPinsIterator(_AsyncIterator["Message"]):
         self.limit = limit
         self.before: str | None = before_
 
-        self.getter = self._state.http.get_pins
+        self.getter = _background(self._state.http.get_pins)
         self.messages: asyncio.Queue[Message] = asyncio.Queue()
 
     # defined to maintain backward compatibility with the old `pins` method
@@ -12,6 +12,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    NamedTuple,
     TypeAlias,
     cast,
     overload,
@@ -33,6 +34,7 @@ from .utils import MISSING, _assetbytes_to_base64_data
 __all__ = (
     "VoiceState",
     "Member",
+    "BulkMemberEditResult",
 )
 
 if TYPE_CHECKING:
@@ -40,6 +42,7 @@ if TYPE_CHECKING:
 
     from .abc import Snowflake
     from .channel import DMChannel, StageChannel, VoiceChannel
+    from .errors import HTTPException
     from .flags import PublicUserFlags
     from .guild import Guild
     from .message import Message
@@ -64,6 +67,28 @@ if TYPE_CHECKING:
     VocalGuildChannel: TypeAlias = VoiceChannel | StageChannel
 
 
+class BulkMemberEditResult(NamedTuple):
+    """The result of editing a member, yielded by :meth:`Guild.bulk_edit_members`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    member: :class:`Member` | :class:`abc.Snowflake`
+        The edited member. This is the updated :class:`Member` if the edit returned
+        one, otherwise the cached member or the given object.
+    skipped: :class:`bool`
+        Whether the member already matched the requested changes
+        according to the cache, and no requests were sent.
+    error: :class:`HTTPException` | :data:`None`
+        The error that occurred while editing the member, if any.
+    """
+
+    member: Member | Snowflake
+    skipped: bool
+    error: HTTPException | None
+
+
 class VoiceState:
     """Represents a Discord user's voice state.
 
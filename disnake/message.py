@@ -7,7 +7,7 @@ import datetime
 import io
 import re
 from base64 import b64decode, b64encode
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
@@ -337,6 +337,10 @@ class Attachment(Hashable):
 
         Saves this attachment into a file-like object.
 
+        .. versionchanged:: |vnext|
+            The attachment is now written in chunks while it is being downloaded,
+            instead of being loaded into memory first.
+
         Parameters
         ----------
         fp: :class:`io.BufferedIOBase` | :class:`os.PathLike`
@@ -366,15 +370,9 @@ class Attachment(Hashable):
         :class:`int`
             The number of bytes written.
         """
-        data = await self.read(use_cached=use_cached)
-        if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data)
-            if seek_begin:
-                fp.seek(0)
-            return written
-        else:
-            with open(fp, "wb") as f:  # noqa: ASYNC230
-                return f.write(data)
+        return await utils._save_stream(
+            self.stream(use_cached=use_cached), fp, seek_begin=seek_begin
+        )
 
     async def read(self, *, use_cached: bool = False) -> bytes:
         """|coro|
@@ -410,12 +408,44 @@ class Attachment(Hashable):
         url = self.proxy_url if use_cached else self.url
         return await self._http.get_from_cdn(url)
 
+    def stream(self, *, use_cached: bool = False, chunk_size: int = 2**16) -> AsyncIterator[bytes]:
+        """Returns an :term:`asynchronous iterator` over the content of this attachment,
+        without loading all of it into memory.
+
+        .. versionadded:: |vnext|
+
+        Parameters
+        ----------
+        use_cached: :class:`bool`
+            Whether to use :attr:`proxy_url` rather than :attr:`url` when downloading
+            the attachment. See :meth:`read` for details.
+        chunk_size: :class:`int`
+            The maximum size of each chunk, in bytes.
+
+        Raises
+        ------
+        HTTPException
+            Downloading the attachment failed.
+        Forbidden
+            You do not have permissions to access this attachment
+        NotFound
+            The attachment was deleted.
+
+        Yields
+        ------
+        :class:`bytes`
+            A chunk of the attachment's content.
+        """
+        url = self.proxy_url if use_cached else self.url
+        return self._http.stream_from_cdn(url, chunk_size=chunk_size)
+
     async def to_file(
         self,
         *,
         use_cached: bool = False,
         spoiler: bool = False,
         description: str | None = MISSING,
+        stream: bool = False,
     ) -> File:
         """|coro|
 
@@ -447,6 +477,17 @@ class Attachment(Hashable):
 
             .. versionadded:: 2.3
 
+        stream: :class:`bool`
+            Whether to stream the attachment directly from the CDN into the upload
+            when sending the file, instead of downloading it into memory here.
+            If the upload has to be retried, the attachment is downloaded again.
+
+            .. note::
+                Since nothing is downloaded upfront, errors when downloading the attachment
+                are only raised when sending the file, as :exc:`aiohttp.ClientConnectionError`.
+
+            .. versionadded:: |vnext|
+
         Raises
         ------
         HTTPException
@@ -463,6 +504,15 @@ class Attachment(Hashable):
         """
         if description is MISSING:
             description = self.description
+        if stream:
+            return File._from_stream_factory(
+                lambda: self.stream(use_cached=use_cached),
+                filename=self.filename,
+                size=self.size,
+                spoiler=spoiler,
+                description=description,
+            )
+
         data = await self.read(use_cached=use_cached)
         return File(
             io.BytesIO(data), filename=self.filename, spoiler=spoiler, description=description
@@ -0,0 +1,336 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from . import utils
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+    from .client import Client
+
+__all__ = (
+    "LoopMonitor",
+    "LoopStats",
+    "LagSpike",
+)
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LagSpike:
+    r"""A moment in which the event loop lagged behind, recorded by a :class:`LoopMonitor`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    time: :class:`datetime.datetime`
+        When the spike was detected, in UTC.
+    lag: :class:`float`
+        How long callbacks were delayed beyond their scheduled time, in seconds.
+    pending_tasks: :class:`int`
+        The number of tasks that were not done yet when the spike was detected.
+    events: :class:`dict`\[:class:`str`, :class:`int`]
+        The events dispatched since the previous sample, and how often, e.g. ``{"message": 3}``.
+    """
+
+    time: datetime
+    lag: float
+    pending_tasks: int
+    events: dict[str, int]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class LoopStats:
+    r"""A snapshot of the event loop's health, returned by :meth:`LoopMonitor.snapshot`.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    samples: :class:`int`
+        The number of lag samples the percentiles are based on.
+    lag_p50: :class:`float`
+        The median scheduling delay of recent samples, in seconds.
+    lag_p95: :class:`float`
+        The 95th percentile of the scheduling delay of recent samples, in seconds.
+    lag_p99: :class:`float`
+        The 99th percentile of the scheduling delay of recent samples, in seconds.
+    lag_max: :class:`float`
+        The highest scheduling delay since the monitor was started, in seconds.
+    pending_tasks: :class:`int`
+        The number of tasks that are not done yet.
+    spikes: :class:`list`\[:class:`LagSpike`]
+        The most recent lag spikes, oldest first.
+    """
+
+    samples: int
+    lag_p50: float
+    lag_p95: float
+    lag_p99: float
+    lag_max: float
+    pending_tasks: int
+    spikes: list[LagSpike]
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    # `values` must be sorted
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+def _finite(value: float) -> float | None:
+    return value if math.isfinite(value) else None
+
+
+class LoopMonitor:
+    r"""Measures how far the event loop lags behind, to detect starvation (e.g. caused by blocking
+    code or a flood of events) before it leads to missed heartbeats and disconnects.
+
+    The monitor periodically schedules a callback and records how much later than
+    scheduled it ran. Lag spikes are logged, along with the events that were
+    dispatched in the meantime.
+
+    This can be passed to :class:`Client` using the ``loop_monitor`` parameter,
+    which starts it when connecting, and stops it when the client is closed.
+    Optionally, a small HTTP server exposing the client's health can be started
+    as well, for use by orchestration systems:
+
+    - ``GET /health`` returns a JSON summary with status ``200`` if the client is ready
+      and the 99th percentile of the loop lag is below ``unhealthy_lag``, ``503`` otherwise.
+    - ``GET /metrics`` returns metrics in the Prometheus text format.
+
+    .. versionadded:: |vnext|
+
+    Parameters
+    ----------
+    interval: :class:`float`
+        How often to sample the loop lag, in seconds. Defaults to ``0.5``.
+    spike_threshold: :class:`float`
+        The lag above which a sample is recorded as a :class:`LagSpike`, in seconds.
+        Defaults to ``0.25``.
+    samples: :class:`int`
+        The number of recent samples to keep for calculating percentiles.
+        Defaults to ``1000``.
+    max_spikes: :class:`int`
+        The number of recent lag spikes to keep. Defaults to ``100``.
+    unhealthy_lag: :class:`float`
+        The 99th percentile lag above which the health endpoint reports the client
+        as unhealthy, in seconds. Defaults to ``1.0``.
+    health_host: :class:`str`
+        The address to bind the health endpoint to. Defaults to ``127.0.0.1``.
+    health_port: :class:`int` | :data:`None`
+        The port to serve the health endpoint on, or :data:`None` to not start it.
+        Defaults to :data:`None`.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.5,
+        spike_threshold: float = 0.25,
+        samples: int = 1000,
+        max_spikes: int = 100,
+        unhealthy_lag: float = 1.0,
+        health_host: str = "127.0.0.1",
+        health_port: int | None = None,
+    ) -> None:
+        if interval <= 0:
+            msg = "interval must be greater than 0"
+            raise ValueError(msg)
+        if samples < 1:
+            msg = "samples must be at least 1"
+            raise ValueError(msg)
+
+        self.interval: float = interval
+        self.spike_threshold: float = spike_threshold
+        self.unhealthy_lag: float = unhealthy_lag
+        self.health_host: str = health_host
+        self.health_port: int | None = health_port
+
+        self._lags: deque[float] = deque(maxlen=samples)
+        self._lag_max: float = 0.0
+        self._spikes: deque[LagSpike] = deque(maxlen=max_spikes)
+        self._spike_count: int = 0
+        self._events: Counter[str] = Counter()
+        self._client: Client | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._runner: web.AppRunner | None = None
+
+    def __repr__(self) -> str:
+        return f"<LoopMonitor interval={self.interval} health_port={self.health_port}>"
+
+    @property
+    def health_addresses(self) -> list[Any]:
+        """:class:`list`: The socket addresses the health endpoint is listening on.
+        Empty if it isn't running.
+        """
+        return self._runner.addresses if self._runner is not None else []
+
+    def snapshot(self) -> LoopStats:
+        """Returns the current statistics of the event loop.
+
+        Returns
+        -------
+        :class:`LoopStats`
+            The statistics.
+        """
+        lags = sorted(self._lags)
+        try:
+            pending_tasks = len(asyncio.all_tasks())
+        except RuntimeError:
+            # no running loop
+            pending_tasks = 0
+        return LoopStats(
+            samples=len(lags),
+            lag_p50=_percentile(lags, 0.5),
+            lag_p95=_percentile(lags, 0.95),
+            lag_p99=_percentile(lags, 0.99),
+            lag_max=self._lag_max,
+            pending_tasks=pending_tasks,
+            spikes=list(self._spikes),
+        )
+
+    def _record_event(self, event: str) -> None:
+        self._events[event] += 1
+
+    def _record_lag(self, lag: float) -> None:
+        self._lags.append(lag)
+        if lag > self._lag_max:
+            self._lag_max = lag
+
+        events, self._events = self._events, Counter()
+        if lag < self.spike_threshold:
+            return
+
+        spike = LagSpike(
+            time=utils.utcnow(),
+            lag=lag,
+            pending_tasks=len(asyncio.all_tasks()),
+            events=dict(events),
+        )
+        self._spikes.append(spike)
+        self._spike_count += 1
+        _log.warning(
+            "The event loop lagged %.3f seconds behind, with %d pending tasks. "
+            "Events dispatched meanwhile: %s",
+            lag,
+            spike.pending_tasks,
+            ", ".join(f"{name} ({count})" for name, count in events.most_common(10)) or "none",
+        )
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.interval
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            self._record_lag(max(0.0, loop.time() - start - interval))
+
+    async def _start(self, client: Client) -> None:
+        self._client = client
+        if self._task is None:
+            self._task = asyncio.create_task(self._sample(), name="disnake: loop monitor")
+        if self.health_port is not None and self._runner is None:
+            await self._start_server()
+
+    async def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._runner is not None:
+            runner, self._runner = self._runner, None
+            await runner.cleanup()
+
+    async def _start_server(self) -> None:
+        # imported here, as most clients don't need the server
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/health", self._handle_health)
+        app.router.add_get("/metrics", self._handle_metrics)
+
+        runner = web.AppRunner(app, handle_signals=False, access_log=None)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, self.health_host, self.health_port)
+            await site.start()
+        except BaseException:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        _log.info("Serving health endpoint on %s", runner.addresses)
+
+    def _latencies(self) -> list[tuple[int, float]]:
+        client = self._client
+        if client is None:
+            return []
+        latencies: list[tuple[int, float]] | None = getattr(client, "latencies", None)
+        if latencies is None:
+            latencies = [(client.shard_id or 0, client.latency)]
+        return latencies
+
+    def _health(self) -> tuple[bool, dict[str, Any]]:
+        stats = self.snapshot()
+        client = self._client
+        ready = client is not None and client.is_ready() and not client.is_closed()
+        healthy = ready and stats.lag_p99 < self.unhealthy_lag
+        return healthy, {
+            "status": "ok" if healthy else "unhealthy",
+            "ready": ready,
+            "lag": {
+                "p50": stats.lag_p50,
+                "p95": stats.lag_p95,
+                "p99": stats.lag_p99,
+                "max": stats.lag_max,
+            },
+            "pending_tasks": stats.pending_tasks,
+            "spikes": self._spike_count,
+            "latencies": {str(shard_id): _finite(lat) for shard_id, lat in self._latencies()},
+        }
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        from aiohttp import web
+
+        healthy, data = self._health()
+        return web.Response(
+            body=json.dumps(data).encode(),
+            status=200 if healthy else 503,
+            content_type="application/json",
+        )
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        from aiohttp import web
+
+        stats = self.snapshot()
+        lines = [
+            "# TYPE disnake_loop_lag_seconds summary",
+            f'disnake_loop_lag_seconds{{quantile="0.5"}} {stats.lag_p50}',
+            f'disnake_loop_lag_seconds{{quantile="0.95"}} {stats.lag_p95}',
+            f'disnake_loop_lag_seconds{{quantile="0.99"}} {stats.lag_p99}',
+            "# TYPE disnake_loop_lag_max_seconds gauge",
+            f"disnake_loop_lag_max_seconds {stats.lag_max}",
+            "# TYPE disnake_loop_lag_spikes_total counter",
+            f"disnake_loop_lag_spikes_total {self._spike_count}",
+            "# TYPE disnake_pending_tasks gauge",
+            f"disnake_pending_tasks {stats.pending_tasks}",
+            "# TYPE disnake_gateway_latency_seconds gauge",
+        ]
+        lines.extend(
+            f'disnake_gateway_latency_seconds{{shard="{shard_id}"}} {latency}'
+            for shard_id, latency in self._latencies()
+            if math.isfinite(latency)
+        )
+        return web.Response(text="\n".join(lines) + "\n", content_type="text/plain")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 from . import utils
@@ -249,6 +250,13 @@ class PartialEmoji(_EmojiTag, AssetMixin):
 
         return await super().read()
 
+    def stream(self, *, chunk_size: int = 2**16) -> AsyncIterator[bytes]:
+        if self.is_unicode_emoji():
+            msg = "PartialEmoji is not a custom emoji"
+            raise TypeError(msg)
+
+        return super().stream(chunk_size=chunk_size)
+
     # utility method for unusual emoji model in forums
     # (e.g. default reaction, tag emoji)
     @staticmethod
@@ -0,0 +1,294 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+
+__all__ = (
+    "RateLimitStore",
+    "SharedMemoryRateLimitStore",
+)
+
+# for buckets: (rate limited until, end of the current window, requests remaining in the window)
+# for the global rate limit: (rate limited until, start of the current window, requests sent in it)
+_SLOT = struct.Struct("3d")
+# how long to wait before trying to lock the file again, if another process holds the lock
+_LOCK_RETRY = 0.001
+
+
+class RateLimitStore(ABC):
+    """Stores REST rate limit state, allowing it to be shared between multiple clients.
+
+    By default, each :class:`Client` only keeps track of rate limits it encountered itself.
+    When several processes use the same bot token (e.g. one process per shard cluster),
+    they share the same global and per-route rate limits on Discord's side.
+    Passing the same store to all of them using the ``ratelimit_store`` parameter
+    makes every client respect rate limits hit by any of the others.
+
+    This is an abstract class, a concrete implementation for processes on the same machine
+    is provided as :class:`SharedMemoryRateLimitStore`.
+
+    Keys are the library's rate limit bucket identifiers, as well as :attr:`GLOBAL`
+    for the global rate limit.
+
+    Stores only need to implement :meth:`get_delay` and :meth:`set_delay`, which share
+    the reset times of exhausted buckets and rate limits that were hit. To also share
+    the remaining budget of buckets, so that clients don't exceed it together,
+    implement :meth:`reserve` and :meth:`update` as well.
+
+    Stores are not closed by clients using them, since one store may be used by
+    several clients; call :meth:`close` once it isn't needed anymore.
+
+    .. versionadded:: |vnext|
+    """
+
+    GLOBAL: str = "global"
+    """The key used for the global rate limit."""
+
+    @abstractmethod
+    async def get_delay(self, key: str) -> float:
+        """|coro|
+
+        Returns the number of seconds until requests for the given key may be sent again.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The rate limit key.
+
+        Returns
+        -------
+        :class:`float`
+            The remaining delay in seconds, or ``0`` if the key is not currently rate limited.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_delay(self, key: str, delay: float) -> None:
+        """|coro|
+
+        Marks the given key as rate limited for the given number of seconds.
+
+        Implementations must not shorten an existing, longer delay for the same key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The rate limit key.
+        delay: :class:`float`
+            The number of seconds after which requests for the key may be sent again.
+        """
+        raise NotImplementedError
+
+    async def reserve(self, key: str) -> float:
+        """|coro|
+
+        Called before sending a request for the given key, to reserve one request
+        of the key's (and the global) budget.
+
+        The default implementation only checks the delays set using :meth:`set_delay`.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The rate limit key.
+
+        Returns
+        -------
+        :class:`float`
+            ``0`` if the request was reserved and may be sent right away,
+            otherwise the number of seconds to wait before trying again.
+        """
+        return max(await self.get_delay(self.GLOBAL), await self.get_delay(key))
+
+    async def update(self, key: str, remaining: int, reset_after: float) -> None:
+        """|coro|
+
+        Called with the rate limit information of each response for the given key.
+
+        The default implementation calls :meth:`set_delay` if the bucket is exhausted.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The rate limit key.
+        remaining: :class:`int`
+            The number of requests remaining in the current window.
+        reset_after: :class:`float`
+            The number of seconds until the current window ends.
+        """
+        if remaining <= 0:
+            await self.set_delay(key, reset_after)
+
+    # subtypes don't have to implement this
+    async def close(self) -> None:  # noqa: B027
+        """|coro|
+
+        Releases any resources held by the store.
+        """
+        pass
+
+
+class SharedMemoryRateLimitStore(RateLimitStore):
+    """A :class:`RateLimitStore` shared between processes on the same machine,
+    using a memory-mapped file.
+
+    Every process should create its own instance pointing to the same file.
+    The file is created if it doesn't exist yet.
+
+    Keys are hashed into a fixed number of slots, each storing the time until
+    which the key is rate limited, and the remaining budget of its current window.
+    Before each request, one request of the bucket's budget is reserved, and the number
+    of requests sent in the current second is counted towards ``global_limit``, so that
+    all processes together stay within Discord's limits.
+
+    Updates are serialized using an advisory file lock where supported (i.e. not on Windows);
+    the lock is never waited for in a blocking way.
+    Hash collisions only cause unrelated routes to wait longer than necessary.
+
+    .. versionadded:: |vnext|
+
+    Parameters
+    ----------
+    path: :class:`str` | :class:`os.PathLike`
+        The path of the file to store the rate limit state in.
+    slots: :class:`int`
+        The number of slots to hash keys into. All processes must use the same value.
+        Defaults to ``4096``.
+    global_limit: :class:`int`
+        The number of requests all processes may send per second together.
+        Defaults to ``50``, Discord's global rate limit for most bots.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, slots: int = 4096, global_limit: int = 50
+    ) -> None:
+        if slots < 2:
+            msg = "slots must be at least 2"
+            raise ValueError(msg)
+        if global_limit < 1:
+            msg = "global_limit must be at least 1"
+            raise ValueError(msg)
+
+        self.path: str = os.fspath(path)
+        self.slots: int = slots
+        self.global_limit: int = global_limit
+
+        size = slots * _SLOT.size
+        self._fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self._map: mmap.mmap = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _offset(self, key: str) -> int:
+        # slot 0 is reserved for the global rate limit
+        if key == self.GLOBAL:
+            return 0
+        index = 1 + zlib.crc32(key.encode()) % (self.slots - 1)
+        return index * _SLOT.size
+
+    def _read(self, offset: int) -> tuple[float, float, float]:
+        return _SLOT.unpack_from(self._map, offset)
+
+    def _write(self, offset: int, a: float, b: float, c: float) -> None:
+        _SLOT.pack_into(self._map, offset, a, b, c)
+
+    async def _lock(self) -> None:
+        if fcntl is None:
+            return
+        # critical sections are short and never await, so poll instead of blocking the loop
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                await asyncio.sleep(_LOCK_RETRY)
+            else:
+                return
+
+    def _unlock(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _bucket_delay(self, offset: int, now: float) -> float:
+        until, reset_at, remaining = self._read(offset)
+        if reset_at > now and remaining == 0:
+            until = max(until, reset_at)
+        return max(0.0, until - now)
+
+    async def get_delay(self, key: str) -> float:
+        # wall clock time is used since monotonic clocks aren't comparable across processes
+        now = time.time()
+        if key == self.GLOBAL:
+            return max(0.0, self._read(0)[0] - now)
+        return self._bucket_delay(self._offset(key), now)
+
+    async def set_delay(self, key: str, delay: float) -> None:
+        offset = self._offset(key)
+        await self._lock()
+        try:
+            until, b, c = self._read(offset)
+            new_until = time.time() + delay
+            if new_until > until:
+                self._write(offset, new_until, b, c)
+        finally:
+            self._unlock()
+
+    async def reserve(self, key: str) -> float:
+        offset = self._offset(key)
+        await self._lock()
+        try:
+            now = time.time()
+            global_until, window_start, sent = self._read(0)
+            if global_until > now:
+                return global_until - now
+            if now - window_start >= 1.0:
+                window_start, sent = now, 0.0
+            elif sent >= self.global_limit:
+                return window_start + 1.0 - now
+
+            delay = self._bucket_delay(offset, now)
+            if delay > 0:
+                return delay
+            until, reset_at, remaining = self._read(offset)
+            if reset_at > now and remaining > 0:
+                self._write(offset, until, reset_at, remaining - 1)
+
+            self._write(0, global_until, window_start, sent + 1)
+            return 0.0
+        finally:
+            self._unlock()
+
+    async def update(self, key: str, remaining: int, reset_after: float) -> None:
+        offset = self._offset(key)
+        await self._lock()
+        try:
+            now = time.time()
+            until, reset_at, stored = self._read(offset)
+            if reset_at > now:
+                # responses to requests sent earlier in the same window may arrive late,
+                # and other processes may have reserved requests meanwhile
+                self._write(offset, until, reset_at, min(stored, remaining))
+            else:
+                self._write(offset, until, now + reset_after, remaining)
+        finally:
+            self._unlock()
+
+    async def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
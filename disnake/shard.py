@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine, Mapping
 from errno import ECONNRESET
 from typing import (
     TYPE_CHECKING,
@@ -17,8 +17,8 @@ from typing import (
 import aiohttp
 
 from .backoff import ExponentialBackoff
-from .client import Client, SessionStartLimit
-from .enums import Status
+from .client import Client, EventLimit, ListenerProfiling, SessionStartLimit
+from .enums import Event, EventDispatchMode, Status
 from .errors import (
     ClientException,
     ConnectionClosed,
@@ -31,12 +31,19 @@ from .gateway import DiscordWebSocket, GatewayParams, ReconnectWebSocket
 from .state import AutoShardedConnectionState
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from typing_extensions import Self
 
     from .activity import BaseActivity
+    from .cdn import CDNCache
+    from .cluster import ClusterIPC
     from .flags import Intents, MemberCacheFlags
+    from .http import RetryPolicy
     from .i18n import LocalizationProtocol
     from .mentions import AllowedMentions
+    from .monitor import LoopMonitor
+    from .ratelimit import RateLimitStore
 
 __all__ = (
     "AutoShardedClient",
@@ -45,6 +52,36 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+# discord allows `max_concurrency` IDENTIFYs per 5 seconds
+_IDENTIFY_INTERVAL = 5.0
+
+
+class _IdentifyLimiter:
+    # spaces out IDENTIFYs of shards in the same rate limit bucket (`shard_id % max_concurrency`),
+    # while shards in different buckets may IDENTIFY at the same time
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max_concurrency
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._next: dict[int, float] = {}
+        self._buckets: dict[int, asyncio.Lock] = {}
+
+    def bucket(self, shard_id: int) -> asyncio.Lock:
+        # held while a shard connects, so that shards in the same bucket connect one after
+        # another, and waiting for the bucket doesn't count towards the connection timeout
+        key = shard_id % self.max_concurrency
+        return self._buckets.setdefault(key, asyncio.Lock())
+
+    async def acquire(self, shard_id: int) -> None:
+        key = shard_id % self.max_concurrency
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next.get(key, 0.0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next[key] = loop.time() + _IDENTIFY_INTERVAL
+
 
 class EventType:
     close = 0
@@ -157,6 +194,7 @@ class Shard:
     async def worker(self) -> None:
         while not self._client.is_closed():
             try:
+                await self._client._wait_for_gateway_reads()
                 await self.ws.poll_event()
             except ReconnectWebSocket as e:
                 etype = EventType.resume if e.resume else EventType.identify
@@ -329,10 +367,25 @@ class AutoShardedClient(Client):
     if this is used. By default, when omitted, the client will launch shards from
     0 to ``shard_count - 1``.
 
+    Shards in different rate limit buckets (``shard_id % max_concurrency``, see
+    :attr:`SessionStartLimit.max_concurrency`) are identified concurrently, both when
+    launching and when re-identifying after a disconnect, while IDENTIFYs within
+    the same bucket are spaced out by 5 seconds.
+
+    .. versionchanged:: |vnext|
+        Shards are identified concurrently according to ``max_concurrency``,
+        instead of one after another.
+
+    To run shards in multiple processes, see :class:`ClusterManager`.
+
     Attributes
     ----------
     shard_ids: :class:`list`\[:class:`int`] | :data:`None`
         An optional list of shard_ids to launch the shards with.
+    cluster: :class:`ClusterIPC` | :data:`None`
+        The connection to the other clusters, if this client was started by a :class:`ClusterManager`.
+
+        .. versionadded:: |vnext|
     """
 
     if TYPE_CHECKING:
@@ -352,6 +405,17 @@ class AutoShardedClient(Client):
         connector: aiohttp.BaseConnector | None = None,
         proxy: str | None = None,
         proxy_auth: aiohttp.BasicAuth | None = None,
+        http_trace_configs: list[aiohttp.TraceConfig] | None = None,
+        ratelimit_store: RateLimitStore | None = None,
+        cdn_cache: CDNCache | None = None,
+        cdn_connections_per_host: int = 10,
+        retry_policy: RetryPolicy | None = None,
+        route_retry_policies: Mapping[str, RetryPolicy] | None = None,
+        event_dispatch_mode: EventDispatchMode = EventDispatchMode.task,
+        event_limits: Mapping[str | Event, EventLimit] | None = None,
+        listener_profiling: ListenerProfiling | None = None,
+        loop_monitor: LoopMonitor | None = None,
+        worker_pool: Executor | None = None,
         assume_unsync_clock: bool = True,
         max_messages: int | None = 1000,
         application_id: int | None = None,
@@ -388,6 +452,9 @@ class AutoShardedClient(Client):
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
         self.__queue = asyncio.PriorityQueue()
+        self.__shard_tasks: set[asyncio.Task[None]] = set()
+        self._identify_limiter: _IdentifyLimiter = _IdentifyLimiter(1)
+        self.cluster: ClusterIPC | None = None
 
     def _get_websocket(
         self, guild_id: int | None = None, *, shard_id: int | None = None
@@ -399,6 +466,19 @@ class AutoShardedClient(Client):
             shard_id = (guild_id >> 22) % self.shard_count
         return self.__shards[shard_id].ws
 
+    async def _call_before_identify_hook(
+        self, shard_id: int | None, *, initial: bool = False
+    ) -> None:
+        # IDENTIFYs are spaced out per rate limit bucket (across all clusters,
+        # if started by a cluster manager), so the default hook's delay isn't needed
+        assert shard_id is not None
+        if self.cluster is None:
+            await self._identify_limiter.acquire(shard_id)
+        else:
+            await self.cluster._wait_for_identify(shard_id)
+        if type(self).before_identify_hook is not Client.before_identify_hook:
+            await self.before_identify_hook(shard_id, initial=initial)
+
     def _get_state(self, **options: Any) -> AutoShardedConnectionState:
         return AutoShardedConnectionState(
             dispatch=self.dispatch,
@@ -483,17 +563,44 @@ class AutoShardedClient(Client):
         if not ignore_session_start_limit and self.session_start_limit.remaining < self.shard_count:
             raise SessionStartLimitReached(self.session_start_limit, requested=self.shard_count)
 
-        # TODO: maybe take max_concurrency from session start limit into account?
-        for shard_id in shard_ids:
-            initial = shard_id == shard_ids[0]
-            await self.launch_shard(gateway, shard_id, initial=initial)
+        # shards in the same bucket are launched one after another,
+        # different buckets are launched concurrently
+        self._identify_limiter = _IdentifyLimiter(self.session_start_limit.max_concurrency)
+
+        async def launch(shard_id: int) -> None:
+            async with self._identify_limiter.bucket(shard_id):
+                await self.launch_shard(gateway, shard_id, initial=shard_id == shard_ids[0])
+
+        await asyncio.gather(*(launch(shard_id) for shard_id in shard_ids))
 
         self._connection.shards_launched.set()
 
+    def _run_shard_task(
+        self, shard: Shard, coro: Coroutine[Any, Any, None], *, identify: bool
+    ) -> None:
+        # waiting for the shard's bucket can take a while,
+        # so don't hold up other shards (or closing the client) meanwhile
+        async def run() -> None:
+            try:
+                if not identify:
+                    await coro
+                    return
+                async with self._identify_limiter.bucket(shard.id):
+                    await coro
+            finally:
+                # in case this was cancelled before the coroutine was started
+                coro.close()
+
+        task = asyncio.create_task(run())
+        self.__shard_tasks.add(task)
+        task.add_done_callback(self.__shard_tasks.discard)
+
     async def connect(
         self, *, reconnect: bool = True, ignore_session_start_limit: bool = False
     ) -> None:
         self._reconnect = reconnect
+        if self.loop_monitor is not None:
+            await self.loop_monitor._start(self)
         await self.launch_shards(ignore_session_start_limit=ignore_session_start_limit)
 
         while not self.is_closed():
@@ -507,9 +614,13 @@ class AutoShardedClient(Client):
                         raise item.error
                 return
             elif item.type in (EventType.identify, EventType.resume):
-                await item.shard.reidentify(item.error)
+                self._run_shard_task(
+                    item.shard,
+                    item.shard.reidentify(item.error),
+                    identify=item.type == EventType.identify,
+                )
             elif item.type == EventType.reconnect:
-                await item.shard.reconnect()
+                self._run_shard_task(item.shard, item.shard.reconnect(), identify=True)
             elif item.type == EventType.terminate:
                 await self.close()
                 raise item.error
@@ -532,12 +643,16 @@ class AutoShardedClient(Client):
             except Exception:
                 pass
 
+        for task in self.__shard_tasks:
+            task.cancel()
+
         to_close = [
             asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()
         ]
         if to_close:
             await asyncio.wait(to_close)
 
+        await self._close_event_handling()
         await self.http.close()
         self.__queue.put_nowait(EventItem(EventType.clean_close, None, None))
 
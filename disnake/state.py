@@ -98,6 +98,7 @@ if TYPE_CHECKING:
     from .gateway import DiscordWebSocket
     from .guild import GuildChannel, VocalGuildChannel
     from .http import HTTPClient
+    from .iterators import AuditLogTail
     from .types import gateway
     from .types.activity import Activity as ActivityPayload
     from .types.channel import DMChannel as DMChannelPayload
@@ -286,6 +287,9 @@ class ConnectionState:
         if not self._intents.members or member_cache_flags._empty:
             self.store_user = self.create_user
 
+        # tails are kept across reconnects, unlike the cache
+        self._audit_log_tails: dict[int, weakref.WeakSet[AuditLogTail]] = {}
+
         self.parsers = parsers = {}
         for attr, func in inspect.getmembers(self):
             if attr.startswith("parse_"):
@@ -773,6 +777,7 @@ class ConnectionState:
         for guild_data in data["guilds"]:
             self._add_guild_from_data(guild_data)
 
+        self._mark_audit_log_gaps()
         self.dispatch("connect")
         self.call_handlers("connect_internal")
         self._ready_task = asyncio.create_task(self._delay_ready())
@@ -780,6 +785,19 @@ class ConnectionState:
     def parse_resumed(self, data: gateway.ResumedEvent) -> None:
         self.dispatch("resumed")
 
+    def _mark_audit_log_gaps(self, shard_id: int | None = None) -> None:
+        # events sent while disconnected are only replayed when resuming a session,
+        # so tails have to catch up when a new session is started
+        for guild_id, tails in self._audit_log_tails.items():
+            if (
+                shard_id is not None
+                and self.shard_count
+                and (guild_id >> 22) % self.shard_count != shard_id
+            ):
+                continue
+            for tail in tails:
+                tail._mark_gap()
+
     def parse_application_command_permissions_update(
         self, data: gateway.ApplicationCommandPermissionsUpdateEvent
     ) -> None:
@@ -2050,6 +2068,9 @@ class ConnectionState:
         )
         self.dispatch("audit_log_entry_create", entry)
 
+        for tail in self._audit_log_tails.get(guild.id, ()):
+            tail._push(entry)
+
     def parse_entitlement_create(self, data: gateway.EntitlementCreate) -> None:
         entitlement = Entitlement(data=data, state=self)
         self.dispatch("entitlement_create", entitlement)
@@ -2643,6 +2664,7 @@ class AutoShardedConnectionState(ConnectionState):
         for guild_data in data["guilds"]:
             self._add_guild_from_data(guild_data)
 
+        self._mark_audit_log_gaps(data["__shard_id__"])  # pyright: ignore[reportGeneralTypeIssues]  # set in websocket receive
         self.dispatch("connect")
         self.dispatch("shard_connect", data["__shard_id__"])  # pyright: ignore[reportGeneralTypeIssues]  # set in websocket receive
         self.call_handlers("connect_internal")
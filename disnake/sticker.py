@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import unicodedata
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Literal
 
 from .asset import Asset, AssetMixin
@@ -160,6 +161,12 @@ class _StickerTag(Hashable, AssetMixin):
             raise TypeError(msg)
         return await super().read()
 
+    def stream(self, *, chunk_size: int = 2**16) -> AsyncIterator[bytes]:
+        if self.format is StickerFormatType.lottie:
+            msg = 'Cannot read stickers of format "lottie".'
+            raise TypeError(msg)
+        return super().stream(chunk_size=chunk_size)
+
 
 class StickerItem(_StickerTag):
     """Represents a sticker item.
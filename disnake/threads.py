@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
-import time
 from collections.abc import Callable, Iterable, Sequence
-from typing import TYPE_CHECKING, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
-from .abc import GuildChannel, Messageable
+from .abc import GuildChannel, Messageable, _purge_helper
 from .enums import ChannelType, ThreadArchiveDuration, try_enum, try_enum_to_int
 from .errors import ClientException
 from .flags import ChannelFlags
@@ -560,6 +558,7 @@ class Thread(Messageable, Hashable):
         around: SnowflakeTime | None = None,
         oldest_first: bool | None = False,
         bulk: bool = True,
+        progress: Callable[[int, int], Any] | None = None,
     ) -> list[Message]:
         r"""|coro|
 
@@ -567,11 +566,18 @@ class Thread(Messageable, Hashable):
         ``check``. If a ``check`` is not provided then all messages are deleted
         without discrimination.
 
+        Messages are deleted while the message history is still being retrieved.
+        Messages older than two weeks are deleted individually, concurrently with bulk deletes.
+        If the purge is cancelled, pending requests are cancelled as well.
+
         You must have the :attr:`~Permissions.manage_messages` permission to
         delete messages even if they are your own (unless you are a user
         account). The :attr:`~Permissions.read_message_history` permission is
         also needed to retrieve message history.
 
+        .. versionchanged:: |vnext|
+            Retrieving and deleting messages now happens concurrently.
+
         Examples
         --------
         Deleting bot's messages ::
@@ -602,6 +608,11 @@ class Thread(Messageable, Hashable):
             If ``True``, use bulk delete. Setting this to ``False`` is useful for mass-deleting
             a bot's own messages without :attr:`Permissions.manage_messages`. When ``True``, will
             fall back to single delete if messages are older than two weeks.
+        progress: :class:`~collections.abc.Callable`\[[:class:`int`, :class:`int`], Any] | :data:`None`
+            A function called whenever messages were deleted, with the total number of
+            messages deleted so far and the number of messages searched through so far.
+
+            .. versionadded:: |vnext|
 
         Raises
         ------
@@ -615,57 +626,17 @@ class Thread(Messageable, Hashable):
         :class:`list`\[:class:`.Message`]
             The list of messages that were deleted.
         """
-        if check is MISSING:
-            check = lambda m: True
-
-        iterator = self.history(
-            limit=limit, before=before, after=after, oldest_first=oldest_first, around=around
+        return await _purge_helper(
+            self,
+            limit=limit,
+            check=check,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            bulk=bulk,
+            progress=progress,
         )
-        ret: list[Message] = []
-        count = 0
-
-        minimum_time = int((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-
-        async def _single_delete_strategy(messages: Iterable[Message]) -> None:
-            for m in messages:
-                await m.delete()
-
-        strategy = self.delete_messages if bulk else _single_delete_strategy
-
-        async for message in iterator:
-            if count == 100:
-                to_delete = ret[-100:]
-                await strategy(to_delete)
-                count = 0
-                await asyncio.sleep(1)
-
-            if not check(message):
-                continue
-
-            if message.id < minimum_time:
-                # older than 14 days old
-                if count == 1:
-                    await ret[-1].delete()
-                elif count >= 2:
-                    to_delete = ret[-count:]
-                    await strategy(to_delete)
-
-                count = 0
-                strategy = _single_delete_strategy
-
-            count += 1
-            ret.append(message)
-
-        # SOme messages remaining to poll
-        if count >= 2:
-            # more than 2 messages -> bulk delete
-            to_delete = ret[-count:]
-            await strategy(to_delete)
-        elif count == 1:
-            # delete a single message
-            await ret[-1].delete()
-
-        return ret
 
     async def edit(
         self,
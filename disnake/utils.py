@@ -7,6 +7,7 @@ import asyncio
 import datetime
 import functools
 import inspect
+import io
 import json
 import os
 import pkgutil
@@ -14,6 +15,7 @@ import re
 import sys
 import types
 import unicodedata
+import uuid
 import warnings
 from base64 import b64encode
 from bisect import bisect_left
@@ -567,11 +569,49 @@ async def _assetbytes_to_base64_data(data: AssetBytes | None) -> str | None:
     return _bytes_to_base64_data(data)
 
 
+async def _save_stream(
+    stream: AsyncIterator[bytes],
+    fp: str | bytes | os.PathLike[str] | os.PathLike[bytes] | io.BufferedIOBase,
+    *,
+    seek_begin: bool,
+) -> int:
+    # wait for the first chunk before opening the file,
+    # to avoid creating an empty file if the download fails
+    chunk = await anext(stream, b"")
+    written = 0
+    if isinstance(fp, io.BufferedIOBase):
+        while chunk:
+            written += fp.write(chunk)
+            chunk = await anext(stream, b"")
+        if seek_begin:
+            fp.seek(0)
+    else:
+        path = os.fsdecode(fp)
+        # write to a file next to the target and move it into place once done,
+        # so that a failed download doesn't leave a truncated file behind
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:  # noqa: ASYNC230
+                while chunk:
+                    written += f.write(chunk)
+                    chunk = await anext(stream, b"")
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+    return written
+
+
 if HAS_ORJSON:
 
     def _to_json(obj: Any) -> str:
         return orjson.dumps(obj).decode("utf-8")  # pyright: ignore[reportPossiblyUnboundVariable]
 
+    _to_json_bytes = orjson.dumps  # pyright: ignore[reportPossiblyUnboundVariable]
+
     _from_json = orjson.loads  # pyright: ignore[reportPossiblyUnboundVariable]
 
 else:
@@ -579,6 +619,9 @@ else:
     def _to_json(obj: Any) -> str:
         return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
 
+    def _to_json_bytes(obj: Any) -> bytes:
+        return _to_json(obj).encode("utf-8")
+
     _from_json = json.loads
 
 
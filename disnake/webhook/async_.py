@@ -26,10 +26,33 @@ from .. import utils
 from ..asset import Asset
 from ..channel import PartialMessageable
 from ..enums import WebhookType, try_enum
-from ..errors import DiscordServerError, Forbidden, HTTPException, NotFound, WebhookTokenMissing
+from ..errors import (
+    DiscordServerError,
+    Forbidden,
+    HTTPException,
+    NotFound,
+    RateLimited,
+    WebhookTokenMissing,
+)
 from ..file import File
 from ..flags import MessageFlags
-from ..http import USER_AGENT, Route, set_attachments, to_multipart, to_multipart_with_attachments
+from ..http import (
+    _DEFAULT_RETRY_POLICY,
+    _INTERACTION_RETRY_POLICY,
+    USER_AGENT,
+    RequestPriority,
+    Route,
+    _Deadline,
+    _request_priority,
+    _retry_policy,
+    _session_clients,
+    build_form_data,
+    can_retry_upload,
+    prepare_form,
+    set_attachments,
+    to_multipart,
+    to_multipart_with_attachments,
+)
 from ..mentions import AllowedMentions
 from ..message import Message
 from ..mixins import Hashable
@@ -75,12 +98,24 @@ MISSING = utils.MISSING
 
 
 class AsyncDeferredLock:
-    def __init__(self, lock: asyncio.Lock) -> None:
+    def __init__(
+        self, lock: asyncio.Lock, deadline: _Deadline, resets: dict[Any, float], bucket: Any
+    ) -> None:
         self.lock = lock
+        self.deadline = deadline
+        # loop times at which deferred locks are released, keyed by bucket
+        self.resets = resets
+        self.bucket = bucket
         self.delta: float | None = None
 
     async def __aenter__(self) -> Self:
-        await self.lock.acquire()
+        reset = self.resets.get(self.bucket)
+        if self.lock.locked() and reset is not None:
+            delay = reset - asyncio.get_running_loop().time()
+            if not self.deadline.allows(delay):
+                # the rate limit is known to outlast the deadline, fail right away
+                raise RateLimited(delay)
+        await self.deadline.wait(self.lock.acquire())
         return self
 
     def delay_by(self, delta: float) -> None:
@@ -93,13 +128,23 @@ class AsyncDeferredLock:
         traceback: TracebackType | None,
     ) -> None:
         if self.delta:
-            await asyncio.sleep(self.delta)
-        self.lock.release()
+            # release the lock once the rate limit is over, without holding up the caller
+            loop = asyncio.get_running_loop()
+            self.resets[self.bucket] = loop.time() + self.delta
+
+            def release() -> None:
+                self.resets.pop(self.bucket, None)
+                self.lock.release()
+
+            loop.call_later(self.delta, release)
+        else:
+            self.lock.release()
 
 
 class AsyncWebhookAdapter:
     def __init__(self) -> None:
         self._locks: dict[Any, asyncio.Lock] = {}
+        self._resets: dict[Any, float] = {}
 
     async def request(
         self,
@@ -115,7 +160,7 @@ class AsyncWebhookAdapter:
     ) -> Any:
         headers: dict[str, str] = {}
         files = files or []
-        to_send: str | aiohttp.FormData | None = None
+        to_send: bytes | aiohttp.FormData | None = None
         bucket = (route.webhook_id, route.webhook_token)
 
         try:
@@ -128,7 +173,7 @@ class AsyncWebhookAdapter:
 
         if payload is not None:
             headers["Content-Type"] = "application/json"
-            to_send = utils._to_json(payload)
+            to_send = utils._to_json_bytes(payload)
 
         if auth_token is not None:
             headers["Authorization"] = f"Bot {auth_token}"
@@ -136,88 +181,119 @@ class AsyncWebhookAdapter:
         if reason is not None:
             headers["X-Audit-Log-Reason"] = urlquote(reason, safe="/ ")
 
+        if multipart:
+            multipart = prepare_form(multipart)
+
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
         method = route.method
         url = route.url
         webhook_id = route.webhook_id
+        # requests on a client's session share its connections, are scheduled by its limiter,
+        # and are retried according to its retry policies
+        owner = _session_clients.get(session)
+        limiter = owner._limiter if owner is not None else None
+        if owner is not None:
+            policy = owner._get_retry_policy(route)
+        else:
+            policy = _retry_policy.get() or route.retry_policy or _DEFAULT_RETRY_POLICY
+        deadline = _Deadline(asyncio.get_running_loop(), policy.deadline)
+        priority = _request_priority.get()
+        if priority is None:
+            priority = route.priority
+
+        async with AsyncDeferredLock(lock, deadline, self._resets, bucket) as lock:
+            for attempt in range(policy.tries):
+                if attempt and not can_retry_upload(files):
+                    # a stream was consumed by the previous attempt and can't be sent again
+                    break
 
-        async with AsyncDeferredLock(lock) as lock:
-            for attempt in range(5):
                 for file in files:
                     file.reset(seek=attempt)
 
                 if multipart:
-                    # NOTE: for `quote_fields`, see https://github.com/aio-libs/aiohttp/issues/4012
-                    form_data = aiohttp.FormData(quote_fields=False)
-                    for p in multipart:
-                        # manually escape chars, just in case
-                        name = re.sub(
-                            r"[^\x21\x23-\x5b\x5d-\x7e]", lambda m: f"\\{m.group(0)}", p["name"]
-                        )
-                        form_data.add_field(
-                            name=name, **{k: v for k, v in p.items() if k != "name"}
-                        )
-                    to_send = form_data
+                    to_send = build_form_data(multipart)
 
                 try:
-                    async with session.request(
-                        method, url, data=to_send, headers=headers, params=params
-                    ) as response:
+                    if limiter is not None:
+                        await deadline.wait(limiter.acquire(priority))
+                    try:
+                        async with session.request(
+                            method, url, data=to_send, headers=headers, params=params
+                        ) as response:
+                            body = await response.read()
+                    finally:
+                        if limiter is not None:
+                            limiter.release()
+
+                    _log.debug(
+                        "Webhook ID %s with %s %s with %s has returned status code %s",
+                        webhook_id,
+                        method,
+                        url,
+                        to_send,
+                        response.status,
+                    )
+                    data = None
+                    if body:
+                        if response.headers["Content-Type"] == "application/json":
+                            data = utils._from_json(body)
+                        else:
+                            data = body.decode("utf-8")
+
+                    remaining = response.headers.get("X-Ratelimit-Remaining")
+                    if remaining == "0" and response.status != 429:
+                        delta = utils._parse_ratelimit_header(response)
                         _log.debug(
-                            "Webhook ID %s with %s %s with %s has returned status code %s",
+                            "Webhook ID %s has been preemptively rate limited, waiting %.2f seconds",
                             webhook_id,
-                            method,
-                            url,
-                            to_send,
-                            response.status,
+                            delta,
                         )
-                        data = (await response.text(encoding="utf-8")) or None
-                        if data and response.headers["Content-Type"] == "application/json":
-                            data = utils._from_json(data)
-
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            delta = utils._parse_ratelimit_header(response)
-                            _log.debug(
-                                "Webhook ID %s has been preemptively rate limited, waiting %.2f seconds",
-                                webhook_id,
-                                delta,
-                            )
-                            lock.delay_by(delta)
-
-                        if 300 > response.status >= 200:
-                            _log.debug("%s %s has received %s", method, url, data)
-                            return data
-
-                        if response.status == 429:
-                            if not response.headers.get("Via"):
-                                raise HTTPException(response, data)
-
-                            assert isinstance(data, dict)
-                            retry_after: float = data["retry_after"]
-                            _log.warning(
-                                "Webhook ID %s is rate limited. Retrying in %.2f seconds",
-                                webhook_id,
-                                retry_after,
-                            )
-                            await asyncio.sleep(retry_after)
-                            continue
+                        lock.delay_by(delta)
 
-                        if response.status >= 500:
-                            await asyncio.sleep(1 + attempt * 2)
-                            continue
+                    if 300 > response.status >= 200:
+                        _log.debug("%s %s has received %s", method, url, data)
+                        return data
 
-                        if response.status == 403:
-                            raise Forbidden(response, data)
-                        elif response.status == 404:
-                            raise NotFound(response, data)
-                        else:
+                    if response.status == 429:
+                        if not response.headers.get("Via"):
                             raise HTTPException(response, data)
 
+                        assert isinstance(data, dict)
+                        retry_after: float = data["retry_after"]
+                        _log.warning(
+                            "Webhook ID %s is rate limited. Retrying in %.2f seconds",
+                            webhook_id,
+                            retry_after,
+                        )
+                        if not deadline.allows(retry_after):
+                            lock.delay_by(retry_after)
+                            raise RateLimited(retry_after)
+                        await asyncio.sleep(retry_after)
+                        continue
+
+                    if response.status >= 500:
+                        delay = policy._backoff_delay(attempt)
+                        if attempt < policy.tries - 1 and deadline.allows(delay):
+                            await asyncio.sleep(delay)
+                            continue
+                        raise DiscordServerError(response, data)
+
+                    if response.status == 403:
+                        raise Forbidden(response, data)
+                    elif response.status == 404:
+                        raise NotFound(response, data)
+                    else:
+                        raise HTTPException(response, data)
+
                 except OSError as e:
-                    if attempt < 4 and e.errno == ECONNRESET:
-                        await asyncio.sleep(1 + attempt * 2)
+                    if (
+                        e.errno == ECONNRESET
+                        and attempt < policy.tries - 1
+                        and can_retry_upload(files)
+                        and deadline.allows(delay := policy._backoff_delay(attempt))
+                    ):
+                        await asyncio.sleep(delay)
                         continue
                     raise
 
@@ -297,6 +373,7 @@ class AsyncWebhookAdapter:
         thread_id: int | None = None,
         wait: bool = False,
         with_components: bool = True,
+        interaction: bool = False,
     ) -> Response[MessagePayload | None]:
         params = {"wait": int(wait), "with_components": int(with_components)}
         if thread_id:
@@ -308,6 +385,9 @@ class AsyncWebhookAdapter:
             webhook_id=webhook_id,
             webhook_token=token,
         )
+        if interaction:
+            route.priority = RequestPriority.high
+            route.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(
             route, session, payload=payload, multipart=multipart, files=files, params=params
         )
@@ -320,6 +400,7 @@ class AsyncWebhookAdapter:
         *,
         session: aiohttp.ClientSession,
         thread_id: int | None = None,
+        interaction: bool = False,
     ) -> Response[MessagePayload]:
         params: dict[str, Any] = {}
         if thread_id is not None:
@@ -332,6 +413,9 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
+        if interaction:
+            route.priority = RequestPriority.high
+            route.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(route, session, params=params)
 
     def edit_webhook_message(
@@ -345,6 +429,7 @@ class AsyncWebhookAdapter:
         multipart: Sequence[dict[str, Any]] | None = None,
         files: Sequence[File] | None = None,
         thread_id: int | None = None,
+        interaction: bool = False,
     ) -> Response[MessagePayload]:
         params: dict[str, Any] = {}
         if thread_id is not None:
@@ -357,6 +442,9 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
+        if interaction:
+            route.priority = RequestPriority.high
+            route.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(
             route, session, payload=payload, multipart=multipart, files=files, params=params
         )
@@ -369,6 +457,7 @@ class AsyncWebhookAdapter:
         *,
         session: aiohttp.ClientSession,
         thread_id: int | None = None,
+        interaction: bool = False,
     ) -> Response[None]:
         params: dict[str, Any] = {}
         if thread_id is not None:
@@ -381,6 +470,9 @@ class AsyncWebhookAdapter:
             webhook_token=token,
             message_id=message_id,
         )
+        if interaction:
+            route.priority = RequestPriority.high
+            route.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(route, session, params=params)
 
     def fetch_webhook(
@@ -452,6 +544,8 @@ class AsyncWebhookAdapter:
             webhook_id=application_id,
             webhook_token=token,
         )
+        r.priority = RequestPriority.high
+        r.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(r, session=session)
 
     def edit_original_interaction_response(
@@ -470,6 +564,8 @@ class AsyncWebhookAdapter:
             webhook_id=application_id,
             webhook_token=token,
         )
+        r.priority = RequestPriority.high
+        r.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(r, session, payload=payload, multipart=multipart, files=files)
 
     def delete_original_interaction_response(
@@ -485,6 +581,8 @@ class AsyncWebhookAdapter:
             webhook_id=application_id,
             wehook_token=token,
         )
+        r.priority = RequestPriority.high
+        r.retry_policy = _INTERACTION_RETRY_POLICY
         return self.request(r, session=session)
 
 
@@ -1933,6 +2031,7 @@ class Webhook(BaseWebhook):
                 files=params.files,
                 thread_id=thread_id,
                 wait=wait,
+                interaction=self.type is WebhookType.application,
             )
 
         msg = None
@@ -1994,6 +2093,7 @@ class Webhook(BaseWebhook):
             id,
             session=self.session,
             thread_id=thread.id if thread else None,
+            interaction=self.type is WebhookType.application,
         )
         return self._create_message(data, thread=thread)
 
@@ -2168,6 +2268,7 @@ class Webhook(BaseWebhook):
                 payload=params.payload,
                 multipart=params.multipart,
                 files=params.files,
+                interaction=self.type is WebhookType.application,
             )
 
         message = self._create_message(data, thread=thread)
@@ -2217,4 +2318,5 @@ class Webhook(BaseWebhook):
             message_id,
             session=self.session,
             thread_id=thread.id if thread else None,
+            interaction=self.type is WebhookType.application,
         )
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
 import threading
@@ -25,6 +26,7 @@ from urllib.parse import quote as urlquote
 from .. import utils
 from ..channel import PartialMessageable
 from ..errors import DiscordServerError, Forbidden, HTTPException, NotFound, WebhookTokenMissing
+from ..file import File
 from ..flags import MessageFlags
 from ..http import Route
 from ..message import Message
@@ -45,7 +47,6 @@ if TYPE_CHECKING:
 
     from ..abc import Snowflake
     from ..embeds import Embed
-    from ..file import File
     from ..mentions import AllowedMentions
     from ..message import Attachment
     from ..types.message import Message as MessagePayload
@@ -137,7 +138,13 @@ class WebhookAdapter:
                         if name == "payload_json":
                             to_send = {"payload_json": p["value"]}
                         else:
-                            file_data[name] = (p["filename"], p["value"], p["content_type"])
+                            value = p["value"]
+                            if isinstance(value, File):
+                                if not isinstance(value.fp, io.IOBase):
+                                    msg = "Synchronous webhooks cannot upload stream files"
+                                    raise TypeError(msg)
+                                value = value.fp
+                            file_data[name] = (p["filename"], value, p["content_type"])
 
                 try:
                     with session.request(
@@ -0,0 +1,347 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from . import utils
+from .member import Member
+from .message import Message
+from .user import _UserTag
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .http import HTTPClient
+
+__all__ = (
+    "WorkerMessage",
+    "WorkerUser",
+    "WorkerObject",
+    "WorkerAction",
+    "SendMessage",
+    "DeleteMessage",
+    "AddReaction",
+    "TimeoutMember",
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WorkerMessage:
+    r"""A picklable snapshot of a :class:`Message`, passed to listeners running in a worker process.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The message ID.
+    channel_id: :class:`int`
+        The ID of the channel the message was sent in.
+    guild_id: :class:`int` | :data:`None`
+        The ID of the guild the message was sent in, if any.
+    author: :class:`WorkerUser`
+        The author of the message.
+    content: :class:`str`
+        The content of the message.
+    created_at: :class:`datetime.datetime`
+        When the message was sent, in UTC.
+    attachment_urls: :class:`tuple`\[:class:`str`, ...]
+        The URLs of the message's attachments.
+    mention_ids: :class:`tuple`\[:class:`int`, ...]
+        The IDs of the users mentioned in the message.
+    role_mention_ids: :class:`tuple`\[:class:`int`, ...]
+        The IDs of the roles mentioned in the message.
+    reference_id: :class:`int` | :data:`None`
+        The ID of the message this message references (e.g. replies to), if any.
+    """
+
+    id: int
+    channel_id: int
+    guild_id: int | None
+    author: WorkerUser
+    content: str
+    created_at: datetime
+    attachment_urls: tuple[str, ...]
+    mention_ids: tuple[int, ...]
+    role_mention_ids: tuple[int, ...]
+    reference_id: int | None
+
+    @classmethod
+    def from_message(cls, message: Message) -> WorkerMessage:
+        """Creates a snapshot of the given message."""
+        guild = message.guild
+        reference = message.reference
+        return cls(
+            id=message.id,
+            channel_id=message.channel.id,
+            guild_id=guild.id if guild is not None else None,
+            author=WorkerUser.from_user(message.author),
+            content=message.content,
+            created_at=message.created_at,
+            attachment_urls=tuple(a.url for a in message.attachments),
+            mention_ids=tuple(message.raw_mentions),
+            role_mention_ids=tuple(message.raw_role_mentions),
+            reference_id=reference.message_id if reference is not None else None,
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WorkerUser:
+    r"""A picklable snapshot of a :class:`User` or :class:`Member`, passed to
+    listeners running in a worker process.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    id: :class:`int`
+        The user ID.
+    name: :class:`str`
+        The user's username.
+    display_name: :class:`str`
+        The user's display name, i.e. their nickname or global name if set.
+    bot: :class:`bool`
+        Whether the user is a bot.
+    guild_id: :class:`int` | :data:`None`
+        The ID of the guild, if this is a member.
+    role_ids: :class:`tuple`\[:class:`int`, ...]
+        The IDs of the member's roles, empty if this isn't a member.
+    """
+
+    id: int
+    name: str
+    display_name: str
+    bot: bool
+    guild_id: int | None = None
+    role_ids: tuple[int, ...] = ()
+
+    @classmethod
+    def from_user(cls, user: _UserTag) -> WorkerUser:
+        """Creates a snapshot of the given user or member."""
+        is_member = isinstance(user, Member)
+        return cls(
+            id=user.id,
+            name=getattr(user, "name", ""),
+            display_name=getattr(user, "display_name", ""),
+            bot=getattr(user, "bot", False),
+            guild_id=user.guild.id if is_member else None,
+            role_ids=tuple(user._roles) if is_member else (),
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WorkerObject:
+    """A picklable reference to any other object passed to an event,
+    e.g. a channel or a guild, passed to listeners running in a worker process.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    type: :class:`str`
+        The name of the object's type, e.g. ``TextChannel``.
+    id: :class:`int` | :data:`None`
+        The object's ID, if it has one.
+    guild_id: :class:`int` | :data:`None`
+        The ID of the guild the object belongs to, if any.
+    channel_id: :class:`int` | :data:`None`
+        The ID of the channel the object belongs to, if any.
+    """
+
+    type: str
+    id: int | None = None
+    guild_id: int | None = None
+    channel_id: int | None = None
+
+
+def _snapshot(obj: Any) -> Any:
+    # converts event arguments into picklable values
+    if obj is None or isinstance(obj, (str, int, float, bytes, datetime, timedelta)):
+        return obj
+    if isinstance(obj, Message):
+        return WorkerMessage.from_message(obj)
+    if isinstance(obj, _UserTag):
+        return WorkerUser.from_user(obj)
+    if isinstance(obj, (list, tuple)):
+        return tuple(_snapshot(o) for o in obj)
+
+    # avoid circular import
+    from .client import _event_filter_value
+
+    args = (obj,)
+    return WorkerObject(
+        type=type(obj).__name__,
+        id=getattr(obj, "id", None),
+        guild_id=_event_filter_value("guild_id", args),
+        channel_id=_event_filter_value("channel_id", args),
+    )
+
+
+class WorkerAction:
+    """Base class for actions returned by listeners running in a worker process,
+    which are executed by the main process.
+
+    .. versionadded:: |vnext|
+    """
+
+    __slots__ = ()
+
+    async def _execute(self, http: HTTPClient) -> None:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class SendMessage(WorkerAction):
+    """Sends a message to a channel.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    channel_id: :class:`int`
+        The ID of the channel to send the message to.
+    content: :class:`str`
+        The content of the message.
+    reply_to: :class:`int` | :data:`None`
+        The ID of a message in the same channel to reply to.
+    """
+
+    channel_id: int
+    content: str
+    reply_to: int | None = None
+
+    async def _execute(self, http: HTTPClient) -> None:
+        reference = None
+        if self.reply_to is not None:
+            reference = {"message_id": self.reply_to, "fail_if_not_exists": False}
+        await http.send_message(
+            self.channel_id,
+            content=self.content,
+            message_reference=reference,
+            allowed_mentions={"parse": [], "replied_user": False},
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DeleteMessage(WorkerAction):
+    """Deletes a message.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    channel_id: :class:`int`
+        The ID of the channel the message is in.
+    message_id: :class:`int`
+        The ID of the message to delete.
+    reason: :class:`str` | :data:`None`
+        The reason for deleting the message, shown in the audit log.
+    """
+
+    channel_id: int
+    message_id: int
+    reason: str | None = None
+
+    async def _execute(self, http: HTTPClient) -> None:
+        await http.delete_message(self.channel_id, self.message_id, reason=self.reason)
+
+
+@dataclass(frozen=True, slots=True)
+class AddReaction(WorkerAction):
+    """Adds a reaction to a message.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    channel_id: :class:`int`
+        The ID of the channel the message is in.
+    message_id: :class:`int`
+        The ID of the message to react to.
+    emoji: :class:`str`
+        The emoji to react with, either a unicode emoji or ``name:id`` for custom emojis.
+    """
+
+    channel_id: int
+    message_id: int
+    emoji: str
+
+    async def _execute(self, http: HTTPClient) -> None:
+        await http.add_reaction(self.channel_id, self.message_id, self.emoji)
+
+
+@dataclass(frozen=True, slots=True)
+class TimeoutMember(WorkerAction):
+    """Times out a member.
+
+    .. versionadded:: |vnext|
+
+    Attributes
+    ----------
+    guild_id: :class:`int`
+        The ID of the guild.
+    user_id: :class:`int`
+        The ID of the member to time out.
+    duration: :class:`float`
+        The duration of the timeout in seconds, at most 28 days.
+    reason: :class:`str` | :data:`None`
+        The reason for the timeout, shown in the audit log.
+    """
+
+    guild_id: int
+    user_id: int
+    duration: float
+    reason: str | None = None
+
+    async def _execute(self, http: HTTPClient) -> None:
+        until = utils.utcnow() + timedelta(seconds=self.duration)
+        await http.edit_member(
+            self.guild_id,
+            self.user_id,
+            communication_disabled_until=until.isoformat(),
+            reason=self.reason,
+        )
+
+
+class _WorkerHandler:
+    """Runs a listener using :attr:`EventDispatchMode.process` in the client's worker pool,
+    and executes the returned actions.
+    """
+
+    def __init__(self, client: Client, func: Callable[..., Any]) -> None:
+        self.client = client
+        self.func = func
+        functools.update_wrapper(self, func)
+
+    # compare equal to other handlers of the same function, e.g. for per-listener statistics
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _WorkerHandler) and other.func == self.func
+
+    def __hash__(self) -> int:
+        return hash(self.func)
+
+    def __repr__(self) -> str:
+        return f"<_WorkerHandler func={self.func!r}>"
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        client = self.client
+        call = functools.partial(
+            self.func,
+            *(_snapshot(arg) for arg in args),
+            **{key: _snapshot(value) for key, value in kwargs.items()},
+        )
+        result = await asyncio.get_running_loop().run_in_executor(client.worker_pool, call)
+        if result is None:
+            return
+
+        actions: Sequence[Any] = result if isinstance(result, (list, tuple)) else (result,)
+        for action in actions:
+            if not isinstance(action, WorkerAction):
+                msg = f"Worker listeners must return WorkerAction instances, not {type(action).__name__!r}"
+                raise TypeError(msg)
+            await action._execute(client.http)
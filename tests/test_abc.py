@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: MIT
 
-from typing import cast
+import asyncio
+import datetime
+from collections.abc import AsyncIterator
+from typing import Any, cast
 from unittest import mock
 
 import pytest
 
 import disnake
-from disnake.abc import GuildChannel
+from disnake.abc import GuildChannel, _purge_helper
 from disnake.utils import MISSING
 
 
@@ -164,3 +167,87 @@ class TestUserProtocol:
         handle_abc_user(cast("disnake.User", ...))
         handle_abc_user(cast("disnake.ClientUser", ...))
         handle_abc_user(cast("disnake.Member", ...))
+
+
+@pytest.mark.asyncio
+class TestPurge:
+    @staticmethod
+    def make_channel(messages: list[mock.Mock]) -> mock.Mock:
+        async def history(**kwargs: Any) -> AsyncIterator[mock.Mock]:
+            for message in messages:
+                await asyncio.sleep(0)
+                yield message
+
+        channel = mock.Mock()
+        channel.history = lambda **kwargs: mock.Mock(
+            __aiter__=lambda _: history(**kwargs), aclose=mock.AsyncMock()
+        )
+        channel.delete_messages = mock.AsyncMock()
+        return channel
+
+    @staticmethod
+    def make_message(days_ago: int) -> mock.Mock:
+        created = disnake.utils.utcnow() - datetime.timedelta(days=days_ago)
+        return mock.Mock(id=disnake.utils.time_snowflake(created), delete=mock.AsyncMock())
+
+    async def purge(self, channel: mock.Mock, **kwargs: Any) -> list[disnake.Message]:
+        options: dict[str, Any] = {
+            "limit": None,
+            "check": MISSING,
+            "before": None,
+            "after": None,
+            "around": None,
+            "oldest_first": False,
+            "bulk": True,
+            "progress": None,
+        }
+        return await _purge_helper(channel, **{**options, **kwargs})
+
+    async def test_bulk(self) -> None:
+        new = [self.make_message(0) for _ in range(150)]
+        old = [self.make_message(20) for _ in range(3)]
+        channel = self.make_channel([*new, *old])
+        progress = mock.Mock()
+
+        deleted = await self.purge(channel, progress=progress)
+        assert deleted == [*new, *old]
+
+        assert [c.args[0] for c in channel.delete_messages.await_args_list] == [
+            new[:100],
+            new[100:],
+        ]
+        for message in old:
+            message.delete.assert_awaited_once_with()
+        assert progress.call_args_list[-1] == mock.call(153, 153)
+
+    async def test_check_and_single(self) -> None:
+        messages = [self.make_message(0) for _ in range(10)]
+        channel = self.make_channel(messages)
+
+        deleted = await self.purge(channel, check=lambda m: m in messages[:5], bulk=False)
+        assert deleted == messages[:5]
+        channel.delete_messages.assert_not_awaited()
+        assert all(m.delete.await_count == 1 for m in messages[:5])
+        assert all(m.delete.await_count == 0 for m in messages[5:])
+
+    async def test_error(self) -> None:
+        messages = [self.make_message(20) for _ in range(3)]
+        messages[1].delete.side_effect = disnake.NotFound(mock.Mock(status=404), "unknown")
+        channel = self.make_channel(messages)
+
+        with pytest.raises(disnake.NotFound):
+            await self.purge(channel)
+
+    async def test_cancel(self) -> None:
+        messages = [self.make_message(20) for _ in range(3)]
+        event = asyncio.Event()
+        messages[0].delete.side_effect = event.wait
+        channel = self.make_channel(messages)
+
+        task = asyncio.create_task(self.purge(channel))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        messages[1].delete.assert_not_awaited()
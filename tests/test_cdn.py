@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: MIT
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from disnake.cdn import CDNCache
+
+URL = "https://cdn.discordapp.com/attachments/1/2/file.png"
+
+
+def test_key_ignores_signature() -> None:
+    assert CDNCache._key(f"{URL}?ex=1&is=2&hm=3") == CDNCache._key(f"{URL}?ex=4&is=5&hm=6")
+    assert CDNCache._key(f"{URL}?size=64") != CDNCache._key(f"{URL}?size=128")
+
+
+def test_put_get(tmp_path: Path) -> None:
+    cache = CDNCache(tmp_path)
+    assert cache.get(URL) is None
+
+    cache.put(URL, b"data")
+    assert cache.get(URL) == b"data"
+    assert cache.size == 4
+    assert len(cache) == 1
+
+    # entries are restored from disk
+    assert CDNCache(tmp_path).get(URL) == b"data"
+
+
+def test_writer_abort(tmp_path: Path) -> None:
+    cache = CDNCache(tmp_path)
+    writer = cache.writer(URL)
+    writer.write(b"partial")
+    writer.abort()
+
+    assert cache.get(URL) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_eviction(tmp_path: Path) -> None:
+    cache = CDNCache(tmp_path, max_size=10)
+    cache.put(f"{URL}/a", b"a" * 4)
+    cache.put(f"{URL}/b", b"b" * 4)
+    # mark `a` as recently used
+    assert cache.get(f"{URL}/a") is not None
+
+    cache.put(f"{URL}/c", b"c" * 4)
+    assert cache.get(f"{URL}/b") is None
+    assert cache.get(f"{URL}/a") is not None
+    assert cache.get(f"{URL}/c") is not None
+    assert cache.size == 8
+
+    # files larger than the cache aren't stored at all
+    cache.put(f"{URL}/d", b"d" * 11)
+    assert cache.get(f"{URL}/d") is None
+    assert len(cache) == 2
+
+
+def test_threads(tmp_path: Path) -> None:
+    cache = CDNCache(tmp_path, max_size=100)
+
+    def use(n: int) -> None:
+        url = f"{URL}/{n % 20}"
+        cache.put(url, b"x" * (n % 7 + 1))
+        cache.get(url)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(use, range(500)))
+
+    # the index stays consistent with the files on disk
+    assert cache.size == sum(cache._entries.values()) <= 100
+    assert sorted(os.listdir(tmp_path)) == sorted(cache._entries)
+
+
+def test_invalid_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_size"):
+        CDNCache(tmp_path, max_size=0)
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import functools
+import multiprocessing
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+import disnake
+from disnake.cluster import ClusterIPC, ClusterManager, _Channel, _split_shards
+
+
+def guild_names(client: Any, prefix: str) -> list[str]:
+    return [prefix + guild.name for guild in client.guilds]
+
+
+async def fail(client: Any) -> None:
+    msg = "nope"
+    raise RuntimeError(msg)
+
+
+class StubClient(disnake.AutoShardedClient):
+    # doesn't connect to Discord, and exits without being closed the first time cluster 0 starts
+    def __init__(self, state_dir: str, **options: Any) -> None:
+        super().__init__(**options)
+        self.state_dir = Path(state_dir)
+        self.stopped = asyncio.Event()
+
+    async def start(self, token: str, **kwargs: Any) -> None:
+        assert self.shard_ids is not None
+        cluster_id = self.shard_ids[0]
+        path = self.state_dir / f"cluster{cluster_id}"
+        starts = int(path.read_text()) if path.exists() else 0
+        path.write_text(str(starts + 1))
+        if cluster_id == 0 and starts == 0:
+            return
+        await self.stopped.wait()
+
+    async def close(self) -> None:
+        self.stopped.set()
+
+    def is_closed(self) -> bool:
+        return self.stopped.is_set()
+
+
+def create_stub_client(state_dir: str, **options: Any) -> StubClient:
+    return StubClient(state_dir, **options)
+
+
+def test_split_shards() -> None:
+    assert _split_shards(10, 3) == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert _split_shards(2, 2) == [[0], [1]]
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError, match="clusters"):
+        ClusterManager(mock.Mock(), "token", clusters=0)
+
+
+def make_client(shard_id: int, guild_ids: list[int]) -> Any:
+    guilds = {
+        guild_id: SimpleNamespace(
+            id=guild_id, name=f"guild{guild_id}", member_count=10, shard_id=shard_id
+        )
+        for guild_id in guild_ids
+    }
+    return SimpleNamespace(
+        guilds=list(guilds.values()),
+        get_guild=guilds.get,
+        latencies=[(shard_id, 0.1)],
+    )
+
+
+class TestIPC:
+    @pytest_asyncio.fixture
+    async def clusters(self) -> AsyncIterator[tuple[ClusterManager, list[ClusterIPC]]]:
+        manager = ClusterManager(mock.Mock(), "token", clusters=2, shard_count=2)
+        manager.cluster_shards = _split_shards(2, 2)
+
+        ipcs: list[ClusterIPC] = []
+        # guild IDs are assigned to shards by `(guild_id >> 22) % shard_count`
+        for cluster_id, guild_ids in enumerate(([0, 2 << 22], [1 << 22])):
+            parent, child = multiprocessing.Pipe()
+            process = SimpleNamespace(join=lambda timeout=None: None, exitcode=0)
+            manager._attach(cluster_id, process, parent)  # type: ignore[arg-type]
+            client = make_client(cluster_id, guild_ids)
+            ipcs.append(
+                ClusterIPC(
+                    client, child, cluster_id=cluster_id, cluster_shards=[[0], [1]], shard_count=2
+                )
+            )
+
+        yield manager, ipcs
+
+        manager._closing = True
+        for cluster in manager._clusters.values():
+            cluster.channel.close()
+        for ipc in ipcs:
+            ipc._close()
+
+    @pytest.mark.asyncio
+    async def test_queries(self, clusters: tuple[ClusterManager, list[ClusterIPC]]) -> None:
+        manager, (ipc0, ipc1) = clusters
+
+        assert await ipc0.guild_count() == 3
+        assert await manager.guild_count() == 3
+        assert await ipc1.latencies() == [(0, 0.1), (1, 0.1)]
+
+        guild = await ipc0.get_guild(1 << 22)
+        assert guild is not None
+        assert (guild.name, guild.cluster_id) == (f"guild{1 << 22}", 1)
+        assert await ipc1.get_guild(3 << 22) is None
+
+        assert await ipc1.broadcast(guild_names, "x") == [
+            ["xguild0", f"xguild{2 << 22}"],
+            [f"xguild{1 << 22}"],
+        ]
+        with pytest.raises(disnake.ClientException, match="nope"):
+            await manager.broadcast(fail)
+
+    @pytest.mark.asyncio
+    async def test_identify(self, clusters: tuple[ClusterManager, list[ClusterIPC]]) -> None:
+        manager, (ipc0, _) = clusters
+        manager._identify = limiter = mock.Mock(acquire=mock.AsyncMock())
+        await ipc0._wait_for_identify(0)
+        limiter.acquire.assert_awaited_once_with(0)
+
+
+@pytest.mark.asyncio
+async def test_respond_after_close() -> None:
+    parent, child = multiprocessing.Pipe()
+    handled: asyncio.Future[asyncio.Task[Any]] = asyncio.get_running_loop().create_future()
+
+    async def handle(name: str, args: tuple[Any, ...]) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        handled.set_result(task)
+        # e.g. closing the client closes the connection before the response is sent
+        channel.close()
+
+    channel = _Channel(child, handle)
+    parent.send(("call", 0, "close", ()))
+    task = await asyncio.wait_for(handled, 10)
+    await asyncio.wait([task])
+    assert task.exception() is None
+    parent.close()
+
+
+@pytest.mark.asyncio
+async def test_client_identify_hook() -> None:
+    client = disnake.AutoShardedClient(shard_count=2, shard_ids=[1])
+    client.cluster = cluster = mock.Mock(_wait_for_identify=mock.AsyncMock())
+    # doesn't sleep, unlike the default hook
+    await asyncio.wait_for(client._call_before_identify_hook(1, initial=False), 1)
+    cluster._wait_for_identify.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_processes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    http = mock.Mock(
+        static_login=mock.AsyncMock(),
+        get_bot_gateway=mock.AsyncMock(return_value=(2, "wss://gateway", {"max_concurrency": 1})),
+        close=mock.AsyncMock(),
+    )
+    monkeypatch.setattr(disnake.cluster, "HTTPClient", lambda **kwargs: http)
+    manager = ClusterManager(
+        functools.partial(create_stub_client, str(tmp_path)),
+        "token",
+        clusters=2,
+        restart_delay=0.1,
+    )
+    task = asyncio.create_task(manager.start())
+
+    def starts(cluster_id: int) -> int:
+        path = tmp_path / f"cluster{cluster_id}"
+        return int(path.read_text() or 0) if path.exists() else 0
+
+    async def wait_for_starts() -> None:
+        # cluster 0 exits right away the first time, and is restarted;
+        # the processes can only be observed through the files they write
+        while starts(0) < 2 or starts(1) < 1:  # noqa: ASYNC110
+            await asyncio.sleep(0.1)
+
+    try:
+        await asyncio.wait_for(wait_for_starts(), 60)
+        assert await asyncio.wait_for(manager.guild_count(), 30) == 0
+    finally:
+        processes = [cluster.process for cluster in manager._clusters.values()]
+        await manager.close(timeout=30)
+        await task
+
+    assert manager.shard_count == 2
+    assert (starts(0), starts(1)) == (2, 1)
+    assert len(processes) == 2
+    # the clusters were closed cleanly, instead of being terminated
+    assert [process.exitcode for process in processes] == [0, 0]
@@ -1,10 +1,22 @@
 # SPDX-License-Identifier: MIT
+import asyncio
+import inspect
+import sys
+import time
+from types import SimpleNamespace
 from typing import Any
+from unittest import mock
 
 import pytest
 
 import disnake
 from disnake import Event
+from disnake.client import (
+    _default_coalesce_key,
+    _ListenerOptions,
+    _merge_coalesced_args,
+    _timed_coroutine,
+)
 from disnake.ext import commands
 
 
@@ -49,6 +61,70 @@ def test_wait_for(client_or_bot: disnake.Client, event) -> None:
     coro.close()  # close coroutine to avoid warning
 
 
+@pytest.mark.asyncio
+async def test_wait_for_filters() -> None:
+    client = disnake.Client()
+
+    def message(channel_id: int, author_id: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            channel=SimpleNamespace(id=channel_id), author=SimpleNamespace(id=author_id)
+        )
+
+    checked: list[Any] = []
+
+    def check(m: Any) -> bool:
+        checked.append(m)
+        return True
+
+    by_channel = asyncio.ensure_future(client.wait_for("message", channel_id=1))
+    by_author = asyncio.ensure_future(
+        client.wait_for("message", channel_id=2, author_id=10, check=check)
+    )
+    unfiltered = asyncio.ensure_future(
+        client.wait_for("message", check=lambda m: m.author.id == 20)
+    )
+    await asyncio.sleep(0)
+    assert len(client._listeners["message"]) == 3
+
+    client.dispatch("message", message(3, 10))
+    # wrong author, the check of the indexed listener isn't called
+    client.dispatch("message", message(2, 11))
+    assert checked == []
+    assert not by_channel.done()
+    assert not by_author.done()
+    assert not unfiltered.done()
+
+    client.dispatch("message", match := message(2, 10))
+    assert checked == [match]
+    assert await by_author is match
+    assert not by_channel.done()
+
+    client.dispatch("message", match := message(1, 20))
+    assert await by_channel is match
+    assert await unfiltered is match
+
+    await asyncio.sleep(0)
+    assert "message" not in client._listeners
+
+
+@pytest.mark.asyncio
+async def test_wait_for_filters_timeout() -> None:
+    client = disnake.Client()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client.wait_for("button_click", custom_id="confirm", timeout=0)
+    await asyncio.sleep(0)
+    # timed out listeners are removed from the index
+    assert "button_click" not in client._listeners
+
+    waiter = asyncio.ensure_future(client.wait_for("button_click", custom_id="confirm"))
+    await asyncio.sleep(0)
+    inter = SimpleNamespace(data=SimpleNamespace(custom_id="confirm"))
+    client.dispatch("button_click", SimpleNamespace(data=SimpleNamespace(custom_id="cancel")))
+    client.dispatch("button_click", inter)
+    assert await waiter is inter
+
+
 # Client.add_listener / Client.remove_listener
 
 
@@ -107,3 +183,402 @@ def test_listener__implicit(bot: commands.Bot) -> None:
 
     bot.add_cog(Cog())
     assert len(bot.extra_events["on_automod_rule_update"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_listen_filters(
+    client_or_bot: disnake.Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def message(guild_id: int | None, channel_id: int, bot: bool = False) -> SimpleNamespace:
+        return SimpleNamespace(
+            guild=SimpleNamespace(id=guild_id) if guild_id else None,
+            channel=SimpleNamespace(id=channel_id),
+            author=SimpleNamespace(id=1, bot=bot),
+            content="hi",
+        )
+
+    @client_or_bot.listen("on_sample", guild_ids=[10], ignore_bots=True)
+    async def by_guild(message: Any) -> None: ...
+
+    @client_or_bot.listen("on_sample", channel_ids={20}, check=lambda m: m.content == "hi")
+    async def by_channel(message: Any) -> None: ...
+
+    @client_or_bot.listen()
+    async def on_sample(message: Any) -> None: ...
+
+    scheduled: list[Any] = []
+    monkeypatch.setattr(
+        client_or_bot, "_schedule_event", lambda coro, *args, **kwargs: scheduled.append(coro)
+    )
+
+    client_or_bot.dispatch("sample", message(10, 20))
+    assert scheduled == [by_guild, by_channel, on_sample]
+
+    scheduled.clear()
+    client_or_bot.dispatch("sample", message(10, 21, bot=True))
+    client_or_bot.dispatch("sample", message(None, 21))
+    assert scheduled == [on_sample, on_sample]
+
+    # removing the listener also removes its filters
+    client_or_bot.remove_listener(by_channel, "on_sample")
+    client_or_bot.add_listener(by_channel, "on_sample")
+    scheduled.clear()
+    client_or_bot.dispatch("sample", message(None, 21))
+    assert scheduled == [on_sample, by_channel]
+
+
+@pytest.mark.asyncio
+async def test_listen_filters_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = disnake.Client()
+    listeners = []
+    for channel_id in range(100):
+
+        async def listener(message: Any) -> None: ...
+
+        client.add_listener(listener, "on_sample", channel_ids=[channel_id])
+        listeners.append(listener)
+
+    @client.listen("on_sample", guild_ids=[10])
+    async def by_guild(message: Any) -> None: ...
+
+    scheduled: list[Any] = []
+    monkeypatch.setattr(
+        client, "_schedule_event", lambda coro, *args, **kwargs: scheduled.append(coro)
+    )
+    evaluated: list[_ListenerOptions] = []
+    original_matches = _ListenerOptions.matches
+
+    def matches(self: _ListenerOptions, values: Any) -> bool:
+        evaluated.append(self)
+        return original_matches(self, values)
+
+    monkeypatch.setattr(_ListenerOptions, "matches", matches)
+
+    message = SimpleNamespace(channel=SimpleNamespace(id=42), guild=SimpleNamespace(id=10))
+    client.dispatch("sample", message)
+    # only listeners of the event's channel and guild are evaluated, in order
+    assert len(evaluated) == 2
+    assert scheduled == [listeners[42], by_guild]
+
+    # the index is rebuilt when `extra_events` is modified directly
+    client.extra_events["on_sample"].remove(listeners[42])
+    evaluated.clear()
+    scheduled.clear()
+    client.dispatch("sample", message)
+    assert len(evaluated) == 1
+    assert scheduled == [by_guild]
+
+
+def test_listener_options(bot: commands.Bot) -> None:
+    class Cog(commands.Cog):
+        @commands.Cog.listener(Event.message, channel_ids=[20])
+        async def callback(self, *args: Any) -> None: ...
+
+    bot.add_cog(cog := Cog())
+    filters = bot._listener_options["on_message"]
+    assert filters[cog.callback].channel_ids == {20}
+
+    bot.remove_cog("Cog")
+    assert cog.callback not in filters
+
+
+@pytest.mark.asyncio
+async def test_dispatch_modes() -> None:
+    client = disnake.Client(event_dispatch_mode=disnake.EventDispatchMode.eager)
+    calls: list[str] = []
+    resume = asyncio.Event()
+
+    @client.listen("on_sample")
+    async def eager_sync(*args: Any) -> None:
+        calls.append("eager_sync")
+
+    @client.listen("on_sample")
+    async def eager_waiting(*args: Any) -> None:
+        calls.append("eager_waiting")
+        await resume.wait()
+        calls.append("eager_waiting_resumed")
+
+    @client.listen("on_sample", dispatch_mode=disnake.EventDispatchMode.batch)
+    async def batch1(*args: Any) -> None:
+        calls.append("batch1")
+
+    @client.listen("on_sample", dispatch_mode=disnake.EventDispatchMode.batch)
+    async def batch2(*args: Any) -> None:
+        calls.append("batch2")
+
+    tasks_before = asyncio.all_tasks()
+    client.dispatch("sample")
+    if sys.version_info >= (3, 12):
+        # eager listeners run until they first suspend during dispatch,
+        # and only the suspended one needs a task; the batch shares one task
+        assert calls == ["eager_sync", "eager_waiting"]
+        assert len(asyncio.all_tasks() - tasks_before) == 2
+    else:
+        # eager listeners run in their own tasks
+        assert calls == []
+        assert len(asyncio.all_tasks() - tasks_before) == 3
+
+    resume.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert sorted(calls) == [
+        "batch1",
+        "batch2",
+        "eager_sync",
+        "eager_waiting",
+        "eager_waiting_resumed",
+    ]
+    # batched listeners run in order
+    assert calls.index("batch1") < calls.index("batch2")
+
+
+class TestEventLimits:
+    def make_client(
+        self, overflow: disnake.EventOverflowPolicy, max_queue: int = 2
+    ) -> tuple[disnake.Client, list[int], asyncio.Event]:
+        client = disnake.Client(
+            event_limits={
+                "sample": disnake.EventLimit(
+                    max_concurrency=1, max_queue=max_queue, overflow=overflow
+                )
+            }
+        )
+        handled: list[int] = []
+        release = asyncio.Event()
+
+        @client.listen()
+        async def on_sample(n: int) -> None:
+            await release.wait()
+            handled.append(n)
+
+        return client, handled, release
+
+    async def drain(self) -> None:
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            disnake.EventLimit(max_concurrency=0)
+        with pytest.raises(ValueError, match="max_queue"):
+            disnake.EventLimit(max_concurrency=1, max_queue=-1)
+
+    @pytest.mark.parametrize(
+        ("overflow", "expected"),
+        [
+            (disnake.EventOverflowPolicy.drop_oldest, [0, 2, 3]),
+            (disnake.EventOverflowPolicy.drop_newest, [0, 1, 2]),
+            (disnake.EventOverflowPolicy.block, [0, 1, 2, 3]),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_overflow(
+        self, overflow: disnake.EventOverflowPolicy, expected: list[int]
+    ) -> None:
+        client, handled, release = self.make_client(overflow)
+
+        tasks_before = asyncio.all_tasks()
+        for n in range(4):
+            client.dispatch("sample", n)
+        # only one handler runs at a time
+        assert len(asyncio.all_tasks() - tasks_before) == 1
+
+        blocked = overflow is disnake.EventOverflowPolicy.block
+        assert client._gateway_reads_unblocked.is_set() is not blocked
+
+        release.set()
+        await self.drain()
+        assert handled == expected
+        assert client._gateway_reads_unblocked.is_set()
+
+    @pytest.mark.asyncio
+    async def test_block_without_queue(self) -> None:
+        client, handled, release = self.make_client(disnake.EventOverflowPolicy.block, max_queue=0)
+
+        client.dispatch("sample", 0)
+        client.dispatch("sample", 1)
+        assert not client._gateway_reads_unblocked.is_set()
+
+        # reads are resumed once the blocked event was taken from the queue
+        release.set()
+        await self.drain()
+        assert handled == [0, 1]
+        assert client._gateway_reads_unblocked.is_set()
+
+
+class TestCoalescing:
+    def test_merge_args(self) -> None:
+        first = ("before1", "after1")
+        latest = ("before2", "after2")
+        assert _merge_coalesced_args("on_member_update", first, latest) == ("before1", "after2")
+        # `member, before, after`
+        assert _merge_coalesced_args("on_voice_state_update", (1, "b1", "a1"), (1, "b2", "a2")) == (
+            1,
+            "b1",
+            "a2",
+        )
+        # other events always use the latest arguments, even if they have the same type
+        assert _merge_coalesced_args("on_sample", (None, None), (None, 1)) == (None, 1)
+        assert _merge_coalesced_args("on_sample", first, latest) == latest
+
+    def test_default_key(self) -> None:
+        channel = SimpleNamespace(id=1, guild=SimpleNamespace(id=2))
+        users = [mock.Mock(spec=disnake.User, id=user_id) for user_id in (10, 11)]
+
+        # typing events of different users in the same channel are separate
+        keys = {_default_coalesce_key(channel, user, None) for user in users}
+        assert len(keys) == 2
+
+        # raw reaction events of different messages are separate
+        reactions = [
+            SimpleNamespace(message_id=message_id, user_id=10, channel_id=1, guild_id=2)
+            for message_id in (100, 101)
+        ]
+        assert _default_coalesce_key(reactions[0]) != _default_coalesce_key(reactions[1])
+
+    def test_invalid(self, client: disnake.Client) -> None:
+        async def on_sample(*args: Any) -> None: ...
+
+        with pytest.raises(ValueError, match="coalesce"):
+            client.add_listener(on_sample, coalesce=0)
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_coalesce(self, client: disnake.Client) -> None:
+        calls: list[tuple[Any, ...]] = []
+
+        @client.listen(coalesce=1)
+        async def on_member_update(before: Any, after: Any) -> None:
+            calls.append((before.state, after.state))
+
+        def member(id: int, state: int) -> SimpleNamespace:
+            return SimpleNamespace(id=id, state=state)
+
+        client.dispatch("member_update", member(1, 0), member(1, 1))
+        await asyncio.sleep(0.5)
+        client.dispatch("member_update", member(1, 1), member(1, 2))
+        client.dispatch("member_update", member(2, 0), member(2, 1))
+        assert calls == []
+
+        await asyncio.sleep(0.6)
+        # the window of the first key is over
+        assert calls == [(0, 2)]
+
+        await asyncio.sleep(0.5)
+        assert calls == [(0, 2), (0, 1)]
+        assert not client._coalesced_events
+
+    @pytest.mark.asyncio
+    async def test_close(self, client: disnake.Client) -> None:
+        @client.listen(coalesce=60, coalesce_key=lambda n: n % 2)
+        async def on_sample(n: int) -> None: ...
+
+        for n in range(5):
+            client.dispatch("sample", n)
+        assert len(client._coalesced_events) == 2
+
+        await client.close()
+        assert not client._coalesced_events
+
+
+class TestListenerProfiling:
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="slow_threshold"):
+            disnake.ListenerProfiling(slow_threshold=0)
+        with pytest.raises(ValueError, match="samples"):
+            disnake.ListenerProfiling(samples=0)
+
+    def test_disabled(self, client: disnake.Client) -> None:
+        assert client.listener_stats() == []
+
+    @pytest.mark.asyncio
+    async def test_stats(
+        self, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = disnake.Client(listener_profiling=disnake.ListenerProfiling(slow_threshold=0.01))
+        monkeypatch.setattr(client, "on_error", on_error := mock.AsyncMock())
+        release = asyncio.Event()
+
+        @client.listen("on_sample")
+        async def waiting(n: int) -> None:
+            await release.wait()
+
+        @client.listen("on_sample")
+        async def blocking(n: int) -> None:
+            time.sleep(0.02)  # noqa: ASYNC251
+            if n:
+                raise RuntimeError
+
+        client.dispatch("sample", 0)
+        client.dispatch("sample", 1)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        stats = {s.name.rsplit(".", 1)[-1]: s for s in client.listener_stats("sample")}
+        assert stats["waiting"].running == 2
+        assert stats["waiting"].invocations == 2
+        assert stats["blocking"].running == 0
+        assert stats["blocking"].exceptions == 1
+        assert stats["blocking"].slow_invocations == 2
+        assert stats["blocking"].max_blocking_time >= 0.02
+        assert stats["blocking"].p99_time >= 0.02
+        assert "blocked the event loop" in caplog.text
+        assert on_error.await_count == 1
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        stats = {s.name.rsplit(".", 1)[-1]: s for s in client.listener_stats()}
+        assert stats["waiting"].running == 0
+        assert stats["waiting"].max_blocking_time < 0.01
+
+        client.reset_listener_stats()
+        assert client.listener_stats() == []
+
+    @pytest.mark.asyncio
+    async def test_close(self) -> None:
+        closed = False
+
+        async def handler() -> None:
+            nonlocal closed
+            try:
+                await asyncio.sleep(1)
+            finally:
+                closed = True
+
+        steps: list[float] = []
+        coro = handler()
+        gen = _timed_coroutine(coro, steps.append)
+        next(gen)
+        assert len(steps) == 1
+
+        # closing the wrapper closes the coroutine without resuming it
+        gen.close()
+        assert closed
+        assert inspect.getcoroutinestate(coro) == inspect.CORO_CLOSED
+        assert len(steps) == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_while_running(self) -> None:
+        client = disnake.Client(listener_profiling=disnake.ListenerProfiling())
+        release = asyncio.Event()
+
+        @client.listen("on_sample")
+        async def waiting() -> None:
+            await release.wait()
+
+        client.dispatch("sample")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # the running handler keeps being counted
+        client.reset_listener_stats()
+        (stats,) = client.listener_stats()
+        assert (stats.invocations, stats.running) == (0, 1)
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        (stats,) = client.listener_stats()
+        assert (stats.invocations, stats.running) == (0, 0)
+        assert stats.total_time > 0
@@ -1,9 +1,88 @@
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import io
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
+from typing_extensions import Self
 
 import disnake
-from disnake.http import HTTPClient
+from disnake.cdn import CDNCache
+from disnake.http import (
+    HTTPClient,
+    PriorityLimiter,
+    RequestMetrics,
+    RequestPriority,
+    RetryPolicy,
+    Route,
+    _request_priority,
+    _session_clients,
+    build_form_data,
+    json_or_text,
+    prepare_form,
+    request_priority,
+    retry_policy,
+    to_multipart,
+)
+from disnake.ratelimit import RateLimitStore
+from disnake.utils import _to_json, _to_json_bytes
+from disnake.webhook.async_ import AsyncWebhookAdapter
+
+
+class FakeResponse:
+    def __init__(
+        self, status: int, body: Any = None, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status = status
+        self.reason = "Reason"
+        self.headers = {"content-type": "application/json", **(headers or {})}
+        self._body = _to_json(body).encode() if body is not None else b""
+
+    async def read(self) -> bytes:
+        return self._body
+
+    @property
+    def content(self) -> Self:
+        return self
+
+    async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:
+        for i in range(0, len(self._body), n):
+            yield self._body[i : i + n]
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._body.decode(encoding)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+        self.requests: list[tuple[str, str, dict[str, Any]]] = []
+        self.headers: dict[str, str] = {}
+        self.closed = False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.requests.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self.request("GET", url, **kwargs)
+
+
+def make_client(*responses: FakeResponse) -> tuple[HTTPClient, FakeSession]:
+    http = HTTPClient(loop=asyncio.get_running_loop())
+    session = FakeSession(*responses)
+    http._HTTPClient__session = session  # pyright: ignore[reportAttributeAccessIssue]
+    return http, session
 
 
 @pytest.mark.parametrize(
@@ -46,3 +125,585 @@ from disnake.http import HTTPClient
 )
 def test_format_gateway_url(url: str, params: disnake.GatewayParams, expected: str) -> None:
     assert HTTPClient._format_gateway_url(url, params=params) == expected
+
+
+@pytest.mark.asyncio
+async def test_json_or_text() -> None:
+    assert await json_or_text(FakeResponse(200, {"a": "ü"})) == {"a": "ü"}  # pyright: ignore[reportArgumentType]
+
+    response = FakeResponse(200, headers={"content-type": "text/html"})
+    response._body = "ü".encode()
+    assert await json_or_text(response) == "ü"  # pyright: ignore[reportArgumentType]
+
+
+def test_to_json_bytes() -> None:
+    assert _to_json_bytes({"a": [1, "ü"]}) == _to_json({"a": [1, "ü"]}).encode()
+
+
+def test_route_priority() -> None:
+    assert Route("GET", "/users/@me").priority is RequestPriority.normal
+    route = Route(
+        "POST",
+        "/interactions/{interaction_id}/{interaction_token}/callback",
+        interaction_id=1234,
+        interaction_token="token",  # noqa: S106
+    )
+    assert route.priority is RequestPriority.high
+    # routes using the webhook parameters for interactions
+    route = Route(
+        "POST",
+        "/interactions/{webhook_id}/{webhook_token}/callback",
+        webhook_id=1234,
+        webhook_token="token",  # noqa: S106
+    )
+    assert route.priority is RequestPriority.high
+
+
+class TestPriorityLimiter:
+    @pytest.mark.asyncio
+    async def test_order(self) -> None:
+        limiter = PriorityLimiter(1)
+        await limiter.acquire()
+
+        order: list[str] = []
+
+        async def waiter(name: str, priority: RequestPriority) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+            limiter.release()
+
+        tasks = [
+            asyncio.create_task(waiter("low", RequestPriority.low)),
+            asyncio.create_task(waiter("normal", RequestPriority.normal)),
+            asyncio.create_task(waiter("high", RequestPriority.high)),
+        ]
+        await asyncio.sleep(0)
+        assert order == []
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert order == ["high", "normal", "low"]
+
+    @pytest.mark.asyncio
+    async def test_pause(self) -> None:
+        limiter = PriorityLimiter(5)
+        limiter.pause()
+
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        limiter.resume()
+        await task
+        assert limiter._in_use == 1
+
+    @pytest.mark.asyncio
+    async def test_reserved(self) -> None:
+        limiter = PriorityLimiter(2, reserved=1)
+        await limiter.acquire(RequestPriority.low)
+
+        task = asyncio.create_task(limiter.acquire(RequestPriority.normal))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        # the reserved slot is still available for high priority requests
+        await asyncio.wait_for(limiter.acquire(RequestPriority.high), 1)
+
+        limiter.release()
+        limiter.release()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self) -> None:
+        limiter = PriorityLimiter(1)
+        await limiter.acquire()
+
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        limiter.release()
+        # the cancelled waiter must not hold on to the slot
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+
+@pytest.mark.asyncio
+async def test_webhook_adapter_limiter() -> None:
+    http, session = make_client(FakeResponse(204), FakeResponse(204))
+    _session_clients[session] = http  # pyright: ignore[reportArgumentType]
+    http._limiter = PriorityLimiter(1)
+    await http._limiter.acquire()
+
+    adapter = AsyncWebhookAdapter()
+    followup = asyncio.create_task(
+        adapter.execute_webhook(5678, "token", session=session)  # pyright: ignore[reportArgumentType]
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    callback = asyncio.create_task(
+        adapter.create_interaction_response(1234, "token", session=session, type=1)  # pyright: ignore[reportArgumentType]
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    # requests on the client's session wait for a connection slot as well
+    assert len(http._limiter._waiters) == 2
+    assert session.requests == []
+
+    http._limiter.release()
+    await asyncio.gather(followup, callback)
+    # the interaction callback is scheduled ahead of the regular webhook request
+    assert [url for _, url, _ in session.requests] == [
+        f"{Route.BASE}/interactions/1234/token/callback?with_response=1",
+        f"{Route.BASE}/webhooks/5678/token",
+    ]
+    assert http._limiter._in_use == 0
+
+
+def test_request_priority_context() -> None:
+    assert _request_priority.get() is None
+    with request_priority(RequestPriority.low):
+        assert _request_priority.get() is RequestPriority.low
+    assert _request_priority.get() is None
+
+
+@pytest.mark.looptime
+@pytest.mark.asyncio
+async def test_request_metrics() -> None:
+    http, session = make_client(
+        FakeResponse(500, {"message": "oops"}),
+        FakeResponse(429, {"retry_after": 2, "global": False}, headers={"Via": "1.1 google"}),
+        FakeResponse(200, {"id": "1234"}),
+    )
+    collected: list[RequestMetrics] = []
+    http.add_metrics_listener(collected.append)
+
+    route = Route("GET", "/channels/{channel_id}", channel_id=1234)
+    assert await http.request(route) == {"id": "1234"}
+
+    assert len(session.requests) == 3
+    assert session.requests[0][2]["trace_request_ctx"] is collected[0]
+
+    (metrics,) = collected
+    assert metrics.route == "/channels/{channel_id}"
+    assert metrics.bucket == route.bucket
+    assert metrics.status == 200
+    assert metrics.retries == 2
+    assert metrics.ratelimited == 1
+    assert metrics.response_size == len(b'{"id":"1234"}')
+    assert metrics.exception is None
+    # 1s for the 5xx retry, 2s for the rate limit
+    assert metrics.total_time >= 3
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_failure() -> None:
+    http, _ = make_client(FakeResponse(404, {"message": "Unknown Channel", "code": 10003}))
+    collected: list[RequestMetrics] = []
+    http.add_metrics_listener(collected.append)
+
+    with pytest.raises(disnake.NotFound):
+        await http.request(Route("GET", "/channels/{channel_id}", channel_id=1234))
+
+    (metrics,) = collected
+    assert metrics.status == 404
+    assert isinstance(metrics.exception, disnake.NotFound)
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"tries": 0}, {"backoff": -1}, {"backoff_step": -1}, {"jitter": 2}, {"deadline": 0}],
+    )
+    def test_invalid(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError, match="must"):
+            RetryPolicy(**kwargs)
+
+    def test_backoff(self) -> None:
+        policy = RetryPolicy(backoff=1, backoff_step=2)
+        assert [policy._backoff_delay(n) for n in range(3)] == [1, 3, 5]
+
+        policy = RetryPolicy(backoff=10, backoff_step=0, jitter=0.5)
+        for _ in range(20):
+            assert 5 <= policy._backoff_delay(0) <= 15
+
+    @pytest.mark.asyncio
+    async def test_resolution(self) -> None:
+        http, _ = make_client()
+        custom, by_method, by_path = (
+            RetryPolicy(tries=1),
+            RetryPolicy(tries=2),
+            RetryPolicy(tries=3),
+        )
+        http.retry_policy = custom
+        http.route_retry_policies = {
+            "POST /channels/{channel_id}/messages": by_method,
+            "/channels/{channel_id}/messages": by_path,
+        }
+
+        messages = "/channels/{channel_id}/messages"
+        assert http._get_retry_policy(Route("POST", messages, channel_id=1)) is by_method
+        assert http._get_retry_policy(Route("GET", messages, channel_id=1)) is by_path
+        assert http._get_retry_policy(Route("GET", "/users/@me")) is custom
+
+        interaction = Route(
+            "POST",
+            "/interactions/{interaction_id}/{interaction_token}/callback",
+            interaction_id=1,
+            interaction_token="token",  # noqa: S106
+        )
+        assert interaction.retry_policy is not None
+        assert interaction.retry_policy.deadline is not None
+        assert http._get_retry_policy(interaction) is interaction.retry_policy
+
+        with retry_policy(by_path):
+            assert http._get_retry_policy(interaction) is by_path
+            assert http._get_retry_policy(Route("GET", "/users/@me")) is by_path
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_deadline_ratelimit(self, looptime: float) -> None:
+        http, session = make_client(
+            FakeResponse(429, {"retry_after": 5, "global": False}, headers={"Via": "1.1 google"}),
+            FakeResponse(200, {}),
+        )
+        http.retry_policy = RetryPolicy(deadline=3)
+        route = Route("GET", "/channels/{channel_id}", channel_id=1234)
+
+        # the rate limit exceeds the deadline, fail without waiting for it
+        with pytest.raises(disnake.RateLimited) as exc_info:
+            await http.request(route)
+        assert exc_info.value.retry_after == 5
+        assert looptime == 0
+        assert len(session.requests) == 1
+
+        # the bucket stays locked until the rate limit is over, which is known to
+        # exceed the deadline as well
+        await asyncio.sleep(1)
+        with pytest.raises(disnake.RateLimited) as exc_info:
+            await http.request(route)
+        assert exc_info.value.retry_after == 4
+        assert looptime == 1
+        assert len(session.requests) == 1
+
+        # without a deadline, the request waits for the remaining 4 seconds
+        with retry_policy(RetryPolicy()):
+            await http.request(route)
+        assert looptime == 5
+        assert len(session.requests) == 2
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_deadline_global(self, looptime: float) -> None:
+        http, _ = make_client(
+            FakeResponse(429, {"retry_after": 5, "global": True}, headers={"Via": "1.1 google"}),
+            FakeResponse(200, {}),
+        )
+        http.retry_policy = RetryPolicy(deadline=3)
+
+        with pytest.raises(disnake.RateLimited):
+            await http.request(Route("GET", "/channels/{channel_id}", channel_id=1))
+        # requests in other buckets fail right away too
+        with pytest.raises(disnake.RateLimited) as exc_info:
+            await http.request(Route("GET", "/users/@me"))
+        assert exc_info.value.retry_after == 5
+        assert looptime == 0
+
+        with retry_policy(RetryPolicy()):
+            await http.request(Route("GET", "/users/@me"))
+        assert looptime == 5
+        assert http._global_reset is None
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_global_cancelled(self, looptime: float) -> None:
+        http, _ = make_client(
+            FakeResponse(429, {"retry_after": 5, "global": True}, headers={"Via": "1.1 google"}),
+            FakeResponse(200, {}),
+        )
+
+        task = asyncio.create_task(http.request(Route("GET", "/users/@me")))
+        await asyncio.sleep(1)
+        assert not http._global_over.is_set()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # the global rate limit is still lifted once it's over
+        await http.request(Route("GET", "/users/@me"))
+        assert looptime == 5
+        assert http._global_over.is_set()
+        assert not http._limiter._paused
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_webhook_adapter(self, looptime: float) -> None:
+        ratelimited = FakeResponse(
+            429,
+            {"retry_after": 5, "global": False},
+            headers={"Content-Type": "application/json", "Via": "1.1 google"},
+        )
+        http, session = make_client(ratelimited, FakeResponse(204))
+        _session_clients[session] = http  # pyright: ignore[reportArgumentType]
+        http.route_retry_policies = {
+            "/webhooks/{webhook_id}/{webhook_token}": RetryPolicy(deadline=3)
+        }
+        adapter = AsyncWebhookAdapter()
+        route = Route(
+            "POST",
+            "/webhooks/{webhook_id}/{webhook_token}",
+            webhook_id=1,
+            webhook_token="token",  # noqa: S106
+        )
+
+        # the client's retry policies apply to webhook requests on its session
+        with pytest.raises(disnake.RateLimited):
+            await adapter.request(route, session)  # pyright: ignore[reportArgumentType]
+        with pytest.raises(disnake.RateLimited) as exc_info:
+            await adapter.request(route, session)  # pyright: ignore[reportArgumentType]
+        assert exc_info.value.retry_after == 5
+        assert looptime == 0
+
+        with retry_policy(RetryPolicy()):
+            await adapter.request(route, session)  # pyright: ignore[reportArgumentType]
+        assert looptime == 5
+        assert len(session.requests) == 2
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_tries(self, looptime: float) -> None:
+        http, session = make_client(
+            FakeResponse(502, {"message": "oops"}),
+            FakeResponse(502, {"message": "oops"}),
+        )
+        http.retry_policy = RetryPolicy(tries=2, backoff=4)
+
+        with pytest.raises(disnake.DiscordServerError):
+            await http.request(Route("GET", "/users/@me"))
+        assert len(session.requests) == 2
+        # no backoff after the last attempt
+        assert looptime == 4
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_deadline_backoff(self, looptime: float) -> None:
+        http, session = make_client(
+            FakeResponse(500, {"message": "oops"}),
+            FakeResponse(500, {"message": "oops"}),
+        )
+        http.retry_policy = RetryPolicy(backoff=1, backoff_step=5, deadline=3)
+
+        with pytest.raises(disnake.DiscordServerError):
+            await http.request(Route("GET", "/users/@me"))
+        # the second backoff (6s) would exceed the deadline
+        assert len(session.requests) == 2
+        assert looptime == 1
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    def __init__(self, **delays: float) -> None:
+        self.delays = delays
+        self.set_calls: list[tuple[str, float]] = []
+
+    async def get_delay(self, key: str) -> float:
+        return self.delays.pop(key, 0)
+
+    async def set_delay(self, key: str, delay: float) -> None:
+        self.set_calls.append((key, delay))
+
+
+@pytest.mark.looptime
+@pytest.mark.asyncio
+async def test_ratelimit_store(looptime: float) -> None:
+    http, _ = make_client(
+        FakeResponse(429, {"retry_after": 2, "global": True}, headers={"Via": "1.1 google"}),
+        FakeResponse(
+            200, {}, headers={"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset-After": "3"}
+        ),
+    )
+    route = Route("GET", "/channels/{channel_id}", channel_id=1234)
+    # pretend another process hit the rate limit for this bucket
+    store = http.ratelimit_store = MemoryRateLimitStore(**{route.bucket: 5})
+
+    await http.request(route)
+
+    # 5s waiting for the shared bucket, 2s for the global rate limit
+    assert looptime == 7
+    assert store.set_calls == [(store.GLOBAL, 2), (route.bucket, 3)]
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _read_all(file: disnake.File) -> bytes:
+    value = file._get_upload_value()
+    assert not isinstance(value, io.IOBase)
+    return b"".join([chunk async for chunk in value])
+
+
+class TestStreamingUploads:
+    def test_prepare_form(self) -> None:
+        file = disnake.File(io.BytesIO(b"abc"), "a.txt")
+        form = prepare_form([{"name": 'file"1', "value": file}])
+        assert form == [{"name": 'file\\"1', "value": file}]
+
+        # files are only resolved when building the form data for an attempt
+        assert file._get_upload_value() is file.fp
+        assert build_form_data(form)._fields[0][2] is file.fp
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_stream_factory(self) -> None:
+        calls = 0
+
+        def factory() -> AsyncIterator[bytes]:
+            nonlocal calls
+            calls += 1
+            return _stream(b"ab", b"c")
+
+        file = disnake.File._from_stream_factory(factory, "a.txt", size=3)
+        # no stream is created until the file is uploaded
+        assert calls == 0
+
+        uploads: list[bytes] = []
+
+        class UploadResponse(FakeResponse):
+            data: Any = None
+
+            async def __aenter__(self) -> Self:
+                # consume the multipart body like aiohttp would
+                for _, _, value in self.data._fields:
+                    if isinstance(value, AsyncIterator):
+                        uploads.append(b"".join([chunk async for chunk in value]))
+                return self
+
+        class UploadSession(FakeSession):
+            def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+                response = super().request(method, url, **kwargs)
+                response.data = kwargs["data"]  # pyright: ignore[reportAttributeAccessIssue]
+                return response
+
+        http, _ = make_client()
+        session = UploadSession(UploadResponse(500, {"message": "oops"}), UploadResponse(200, {}))
+        http._HTTPClient__session = session  # pyright: ignore[reportAttributeAccessIssue]
+
+        await http.request(
+            Route("POST", "/channels/{channel_id}/messages", channel_id=1234),
+            form=to_multipart({}, [file]),
+            files=[file],
+        )
+        # the failed attempt is retried with a new stream
+        assert uploads == [b"abc", b"abc"]
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_progress(self) -> None:
+        progress: list[tuple[int, int | None]] = []
+        file = disnake.File(
+            io.BytesIO(b"a" * 100_000), "a.txt", progress=lambda *args: progress.append(args)
+        )
+
+        assert await _read_all(file) == b"a" * 100_000
+        assert progress == [(65536, 100_000), (100_000, 100_000)]
+
+    @pytest.mark.asyncio
+    async def test_stream(self) -> None:
+        progress: list[tuple[int, int | None]] = []
+        file = disnake.File(
+            _stream(b"abc", b"de"), "a.txt", progress=lambda *args: progress.append(args)
+        )
+        assert file._replayable
+        with pytest.raises(TypeError):
+            _ = file.bytes_length
+
+        assert await _read_all(file) == b"abcde"
+        assert progress == [(3, None), (5, None)]
+        assert not file._replayable
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_stream_not_retried(self) -> None:
+        http, session = make_client(FakeResponse(500, {"message": "oops"}))
+        file = disnake.File(_stream(b"abc"), "a.txt")
+        multipart = to_multipart({"content": "hi"}, [file])
+
+        # pretend the stream was sent by the first attempt
+        await _read_all(file)
+
+        with pytest.raises(disnake.DiscordServerError):
+            await http.request(
+                Route("POST", "/channels/{channel_id}/messages", channel_id=1234),
+                form=multipart,
+                files=[file],
+            )
+        assert len(session.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_from_cdn(tmp_path: Path) -> None:
+    http, _ = make_client()
+    cdn = FakeSession(FakeResponse(200, list(range(100))))
+    http._HTTPClient__cdn_session = cdn  # pyright: ignore[reportAttributeAccessIssue]
+    http.cdn_cache = CDNCache(tmp_path)
+
+    url = "https://cdn.discordapp.com/avatars/1/abc.png"
+    expected = _to_json(list(range(100))).encode()
+    assert [c async for c in http.stream_from_cdn(url, chunk_size=64)] == [
+        expected[i : i + 64] for i in range(0, len(expected), 64)
+    ]
+
+    # served from the cache afterwards
+    assert b"".join([c async for c in http.stream_from_cdn(url)]) == expected
+    assert await http.get_from_cdn(url) == expected
+    assert len(cdn.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_from_cdn_not_found(tmp_path: Path) -> None:
+    http, _ = make_client()
+    cdn = FakeSession(FakeResponse(404))
+    http._HTTPClient__cdn_session = cdn  # pyright: ignore[reportAttributeAccessIssue]
+    http.cdn_cache = CDNCache(tmp_path)
+
+    with pytest.raises(disnake.NotFound):
+        await anext(http.stream_from_cdn("https://cdn.discordapp.com/avatars/1/abc.png"))
+    assert len(http.cdn_cache) == 0
+
+
+@pytest.mark.looptime
+@pytest.mark.asyncio
+async def test_attachment_stream_file() -> None:
+    http, session = make_client(FakeResponse(500, {"message": "oops"}), FakeResponse(200, {}))
+    cdn = FakeSession(FakeResponse(200, "abc"), FakeResponse(200, "abc"))
+    http._HTTPClient__cdn_session = cdn  # pyright: ignore[reportAttributeAccessIssue]
+
+    attachment = disnake.Attachment(
+        data={
+            "id": 1,
+            "size": 5,
+            "filename": "a.txt",
+            "url": "https://cdn.discordapp.com/attachments/1/2/a.txt",
+            "proxy_url": "https://media.discordapp.net/attachments/1/2/a.txt",
+        },
+        state=SimpleNamespace(http=http),  # pyright: ignore[reportArgumentType]
+    )
+    file = await attachment.to_file(stream=True)
+    assert file.bytes_length == 5
+    # nothing is downloaded until the file is sent
+    assert not cdn.requests
+
+    # every attempt downloads the attachment again
+    assert await _read_all(file) == b'"abc"'
+    assert await _read_all(file) == b'"abc"'
+    assert len(cdn.requests) == 2
+
+    # so failed uploads are retried
+    await http.request(
+        Route("POST", "/channels/{channel_id}/messages", channel_id=1234),
+        form=to_multipart({}, [file]),
+        files=[file],
+    )
+    assert len(session.requests) == 2
@@ -0,0 +1,502 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import datetime
+import gc
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import disnake
+from disnake import Object
+from disnake.iterators import AuditLogTail, BanIterator, BulkMemberEditIterator, HistoryScanner
+
+
+def make_guild(*pages: list[int]) -> mock.Mock:
+    calls: list[dict[str, Any]] = []
+
+    async def get_bans(guild_id: int, limit: int, **kwargs: Any) -> list[dict[str, Any]]:
+        calls.append(kwargs)
+        await asyncio.sleep(0)
+        page = pages[len(calls) - 1] if len(calls) <= len(pages) else []
+        return [{"user": {"id": str(user_id)}, "reason": None} for user_id in page]
+
+    guild = mock.Mock(id=123)
+    guild._state.http.get_bans = get_bans
+    guild._state.create_user = lambda data: disnake.Object(data["id"])
+    guild.calls = calls
+    return guild
+
+
+def make_channel(channel_id: int, message_ids: list[int]) -> mock.Mock:
+    # message IDs in ascending order; pages are returned newest first, like the API
+    async def logs_from(
+        channel_id: int, limit: int, before: int | None = None, after: int | None = None
+    ) -> list[dict[str, Any]]:
+        await asyncio.sleep(0)
+        if after is not None:
+            ids = [i for i in message_ids if i > after][:limit]
+        else:
+            ids = [i for i in message_ids if before is None or i < before][-limit:]
+        return [{"id": str(i)} for i in reversed(ids)]
+
+    async def get_channel() -> mock.Mock:
+        return channel
+
+    channel = mock.Mock(id=channel_id)
+    channel._get_channel = get_channel
+    channel._state.http.logs_from = logs_from
+    channel._state.create_message = lambda channel, data: Object(int(data["id"]))
+    return channel
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+class TestPrefetch:
+    async def test_sequential(self) -> None:
+        guild = make_guild(list(range(1, 1001)), list(range(1001, 1501)))
+        iterator = BanIterator(guild, limit=None)
+
+        assert (await iterator.next()).user.id == 1
+        await settle()
+        assert len(guild.calls) == 1
+
+        assert [ban.user.id async for ban in iterator] == list(range(2, 1501))
+        assert guild.calls == [{"after": 0}, {"after": 1000}]
+
+    async def test_prefetch(self) -> None:
+        guild = make_guild(list(range(1, 1001)), list(range(1001, 2001)), [2001])
+        iterator = BanIterator(guild, limit=None, prefetch=1)
+
+        assert (await iterator.next()).user.id == 1
+        # the second page is requested while the first one is being consumed
+        await settle()
+        assert guild.calls == [{"after": 0}, {"after": 1000}]
+
+        assert [ban.user.id async for ban in iterator] == list(range(2, 2002))
+        assert guild.calls == [{"after": 0}, {"after": 1000}, {"after": 2000}]
+
+    async def test_aclose(self) -> None:
+        guild = make_guild(list(range(1, 1001)), list(range(1001, 2001)))
+        iterator = BanIterator(guild, limit=None, prefetch=2)
+
+        await iterator.next()
+        (*tasks,) = iterator._pages._pending
+        await iterator.aclose()
+        await settle()
+        assert all(t.cancelled() for t in tasks)
+        assert len(guild.calls) == 1
+
+    async def test_break(self) -> None:
+        guild = make_guild(*(list(range(n, n + 1000)) for n in range(1, 5001, 1000)))
+        iterator = BanIterator(guild, limit=None, prefetch=2)
+
+        async for _ in iterator:
+            break
+        (*tasks,) = iterator._pages._pending
+        # dropping the iterator without closing it cancels pending prefetches
+        del iterator
+        gc.collect()
+        await settle()
+        assert all(t.done() for t in tasks)
+        assert tasks[-1].cancelled()
+        assert len(guild.calls) < 3
+
+
+def test_prefetch_invalid() -> None:
+    with pytest.raises(ValueError, match="prefetch"):
+        BanIterator(make_guild(), prefetch=-1)
+
+
+@pytest.mark.asyncio
+async def test_raw() -> None:
+    guild = make_guild([1, 2])
+    iterator = BanIterator(guild, limit=None)
+
+    assert await iterator.raw().flatten() == [
+        {"user": {"id": "1"}, "reason": None},
+        {"user": {"id": "2"}, "reason": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cursor() -> None:
+    guild = make_guild(list(range(1, 1001)), list(range(1001, 2001)), [2001])
+    iterator = BanIterator(guild, limit=None, prefetch=1)
+    start = {"strategy": "after", "position": 0, "limit": None}
+    assert iterator.cursor == start
+
+    await iterator.next()
+    # the first page wasn't consumed completely yet, continue after the last yielded ban
+    assert iterator.cursor == {"strategy": "after", "position": 1, "limit": None}
+
+    for _ in range(999):
+        await iterator.next()
+    cursor = iterator.cursor
+    assert cursor == {"strategy": "after", "position": 1000, "limit": None}
+    await iterator.aclose()
+
+    guild = make_guild(list(range(1001, 2001)), [2001])
+    resumed = BanIterator(guild, limit=None).resume(cursor)
+    assert [ban.user.id async for ban in resumed] == list(range(1001, 2002))
+    assert guild.calls[0] == {"after": 1000}
+
+    with pytest.raises(RuntimeError):
+        resumed.resume(cursor)
+    with pytest.raises(ValueError, match="pagination"):
+        BanIterator(guild, before=mock.Mock(id=1)).resume(cursor)
+
+
+@pytest.mark.asyncio
+class TestHistoryScanner:
+    async def test_unordered(self) -> None:
+        channels = [
+            make_channel(1, list(range(1, 250))),
+            make_channel(2, list(range(1000, 1050))),
+            make_channel(3, []),
+        ]
+        scanner = HistoryScanner(channels, limit=None, concurrency=2)
+
+        messages = [m.id async for m in scanner]
+        assert sorted(messages) == [*range(1, 250), *range(1000, 1050)]
+        assert scanner.cursors == {
+            1: {"strategy": "before", "position": 1, "limit": 0},
+            2: {"strategy": "before", "position": 1000, "limit": 0},
+            3: {"strategy": "before", "position": None, "limit": 0},
+        }
+
+    async def test_ordered(self) -> None:
+        channels = [
+            make_channel(1, list(range(1, 300, 3))),
+            make_channel(2, list(range(2, 300, 3))),
+            make_channel(3, list(range(3, 300, 3))),
+        ]
+
+        scanner = HistoryScanner(channels, limit=None, ordered=True, concurrency=1)
+        assert [m.id async for m in scanner] == list(range(299, 0, -1))
+
+        scanner = HistoryScanner(channels, limit=50, ordered=True, oldest_first=True)
+        assert [m.id async for m in scanner] == list(range(1, 151))
+
+    async def test_ordered_concurrency(self) -> None:
+        channels = [make_channel(i, list(range(i, 1200, 4))) for i in range(1, 5)]
+        in_flight: list[int] = []
+        max_in_flight = 0
+
+        for channel in channels:
+            logs_from = channel._state.http.logs_from
+
+            async def tracked(*args: Any, logs_from: Any = logs_from, **kwargs: Any) -> Any:
+                nonlocal max_in_flight
+                in_flight.append(1)
+                max_in_flight = max(max_in_flight, len(in_flight))
+                try:
+                    await asyncio.sleep(0.01)
+                    return await logs_from(*args, **kwargs)
+                finally:
+                    in_flight.pop()
+
+            channel._state.http.logs_from = tracked
+
+        scanner = HistoryScanner(channels, limit=None, ordered=True, concurrency=3)
+        # skip the initial requests, which are concurrent regardless
+        await scanner.next()
+        max_in_flight = 0
+
+        assert [m.id async for m in scanner] == list(range(1198, 0, -1))
+        # pages after the first one are requested concurrently too, but no more than allowed
+        assert max_in_flight == 3
+
+    async def test_resume(self) -> None:
+        channels = [make_channel(1, list(range(1, 150))), make_channel(2, list(range(150, 200)))]
+        scanner = HistoryScanner(channels, limit=None, ordered=True)
+
+        seen = [(await scanner.next()).id for _ in range(120)]
+        cursors = scanner.cursors
+        await scanner.aclose()
+
+        resumed = HistoryScanner(channels, limit=None, ordered=True, cursors=cursors)
+        rest = [m.id async for m in resumed]
+        # messages that were already yielded aren't yielded again
+        assert sorted([*seen, *rest]) == list(range(1, 200))
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    async def test_break(self, ordered: bool) -> None:
+        channels = [make_channel(i, list(range(i, 1000, 3))) for i in range(1, 4)]
+        scanner = HistoryScanner(channels, limit=None, ordered=ordered, concurrency=2)
+
+        async for _ in scanner:
+            # stop once the scanner is fetching messages in the background
+            if len(asyncio.all_tasks()) > 1:
+                break
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        # dropping the scanner without closing it cancels its background tasks
+        del scanner
+        gc.collect()
+        await settle()
+        assert all(t.cancelled() for t in tasks)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_error(self) -> None:
+        channel = make_channel(1, list(range(1, 10)))
+
+        async def logs_from(*args: Any, **kwargs: Any) -> Any:
+            msg = "oops"
+            raise RuntimeError(msg)
+
+        channel._state.http.logs_from = logs_from
+        scanner = HistoryScanner([make_channel(2, list(range(1, 10))), channel])
+        with pytest.raises(RuntimeError, match="oops"):
+            await scanner.flatten()
+
+
+def test_history_scanner_invalid() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        HistoryScanner([], concurrency=0)
+
+
+class TestBulkMemberEdit:
+    @pytest.fixture
+    def guild(self) -> mock.Mock:
+        state = mock.Mock()
+        state.store_user.side_effect = lambda data: disnake.User(state=state, data=data)
+        state.http.add_role = mock.AsyncMock()
+        state.http.remove_role = mock.AsyncMock()
+
+        guild = mock.Mock(id=123, _state=state)
+        guild._members = {}
+        guild.get_member = guild._members.get
+
+        async def edit_member(
+            guild_id: int, user_id: int, *, reason: str | None, **fields: Any
+        ) -> dict[str, Any]:
+            return self.member_data(user_id, **fields)
+
+        state.http.edit_member = mock.AsyncMock(side_effect=edit_member)
+        return guild
+
+    @staticmethod
+    def member_data(user_id: int, roles: list[int] = [], **fields: Any) -> dict[str, Any]:  # noqa: B006
+        return {
+            "user": {"id": str(user_id), "username": "u", "discriminator": "0", "avatar": None},
+            "roles": [str(r) for r in roles],
+            "joined_at": None,
+            **fields,
+        }
+
+    def add_member(self, guild: mock.Mock, user_id: int, **fields: Any) -> disnake.Member:
+        member = disnake.Member(
+            data=self.member_data(user_id, **fields), guild=guild, state=guild._state
+        )
+        guild._members[user_id] = member
+        return member
+
+    @pytest.mark.asyncio
+    async def test_roles(self, guild: mock.Mock) -> None:
+        self.add_member(guild, 1, roles=[10])
+        self.add_member(guild, 2, roles=[20])
+        iterator = BulkMemberEditIterator(
+            guild, [Object(1), Object(2), Object(3), Object(1)], add_roles=[10], remove_roles=[20]
+        )
+
+        results = {r.member.id: r async for r in iterator}
+        assert results.keys() == {1, 2, 3}
+        assert results[1].skipped
+        assert not results[2].skipped
+        assert not results[3].skipped
+
+        http = guild._state.http
+        assert sorted(c.args for c in http.add_role.await_args_list) == [(123, 2, 10), (123, 3, 10)]
+        assert sorted(c.args for c in http.remove_role.await_args_list) == [
+            (123, 2, 20),
+            (123, 3, 20),
+        ]
+        http.edit_member.assert_not_awaited()
+        assert iterator.remaining == []
+
+    @pytest.mark.asyncio
+    async def test_fields(self, guild: mock.Mock) -> None:
+        self.add_member(guild, 1, nick="same")
+        self.add_member(guild, 2, nick="other")
+        iterator = BulkMemberEditIterator(
+            guild, [Object(1), Object(2)], fields={"nick": "same"}, reason="r"
+        )
+
+        results = await iterator.flatten()
+        assert [r.skipped for r in sorted(results, key=lambda r: r.member.id)] == [True, False]
+        guild._state.http.edit_member.assert_awaited_once_with(123, 2, reason="r", nick="same")
+        (edited,) = [r.member for r in results if not r.skipped]
+        assert isinstance(edited, disnake.Member)
+        assert edited.nick == "same"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, guild: mock.Mock) -> None:
+        current = disnake.utils.utcnow() + datetime.timedelta(hours=1)
+        self.add_member(guild, 1, communication_disabled_until=current.isoformat())
+        self.add_member(guild, 2, communication_disabled_until=None)
+        self.add_member(guild, 3, communication_disabled_until=None)
+        until = current + datetime.timedelta(seconds=1)
+        self.add_member(guild, 4, communication_disabled_until=until.isoformat())
+
+        # a timeout that was set slightly earlier by the same duration is unchanged
+        iterator = BulkMemberEditIterator(
+            guild, [Object(1), Object(2)], fields={"communication_disabled_until": until}
+        )
+        results = {r.member.id: r.skipped async for r in iterator}
+        assert results == {1: True, 2: False}
+        guild._state.http.edit_member.assert_awaited_once_with(
+            123, 2, reason=None, communication_disabled_until=until.isoformat()
+        )
+
+        guild._state.http.edit_member.reset_mock()
+        iterator = BulkMemberEditIterator(
+            guild, [Object(3), Object(4)], fields={"communication_disabled_until": None}
+        )
+        results = {r.member.id: r.skipped async for r in iterator}
+        assert results == {3: True, 4: False}
+        guild._state.http.edit_member.assert_awaited_once_with(
+            123, 4, reason=None, communication_disabled_until=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_errors(self, guild: mock.Mock) -> None:
+        error = disnake.Forbidden(mock.Mock(status=403), "nope")
+        guild._state.http.add_role.side_effect = [None, error, None]
+        iterator = BulkMemberEditIterator(
+            guild, [Object(1), Object(2), Object(3)], add_roles=[10], concurrency=1
+        )
+
+        results = await iterator.flatten()
+        assert [r.error for r in results] == [None, error, None]
+
+    @pytest.mark.asyncio
+    async def test_stop(self, guild: mock.Mock) -> None:
+        iterator = BulkMemberEditIterator(
+            guild, [Object(i) for i in range(10)], add_roles=[10], concurrency=2
+        )
+
+        first = await iterator.next()
+        await iterator.aclose()
+        assert first.member.id not in {m.id for m in iterator.remaining}
+        assert len(iterator.remaining) == 9
+
+    @pytest.mark.asyncio
+    async def test_break(self, guild: mock.Mock) -> None:
+        async def add_role(*args: Any, **kwargs: Any) -> None:
+            await asyncio.sleep(0)
+
+        guild._state.http.add_role.side_effect = add_role
+        iterator = BulkMemberEditIterator(
+            guild, [Object(i) for i in range(100)], add_roles=[10], concurrency=2
+        )
+
+        async for _ in iterator:
+            break
+        (*tasks,) = iterator._workers
+        # dropping the iterator without closing it stops editing the remaining members
+        del iterator
+        gc.collect()
+        await settle()
+        assert all(t.cancelled() for t in tasks)
+        assert guild._state.http.add_role.await_count < 10
+
+    def test_invalid(self, guild: mock.Mock) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            BulkMemberEditIterator(guild, [], concurrency=0)
+
+
+def make_audit_log_guild(entry_ids: list[int]) -> mock.Mock:
+    calls: list[dict[str, Any]] = []
+
+    async def get_audit_logs(guild_id: int, limit: int, **kwargs: Any) -> dict[str, Any]:
+        calls.append(kwargs)
+        await asyncio.sleep(0)
+        after = kwargs["after"]
+        ids = [i for i in entry_ids if i > after][:limit]
+        return {
+            "audit_log_entries": [
+                {"id": str(i), "action_type": 22, "user_id": "1", "target_id": None} for i in ids
+            ]
+        }
+
+    guild = mock.Mock(id=123)
+    guild._state.http.get_audit_logs = get_audit_logs
+    guild._state._audit_log_tails = {}
+    guild._state._get_guild.return_value = guild
+    guild.calls = calls
+    return guild
+
+
+def make_entry(entry_id: int, user_id: int = 1) -> mock.Mock:
+    return mock.Mock(id=entry_id, action=disnake.AuditLogAction.ban, user=Object(user_id))
+
+
+@pytest.mark.asyncio
+class TestAuditLogTail:
+    async def test_live(self) -> None:
+        guild = make_audit_log_guild([])
+        tail = AuditLogTail(guild, after=None, action_type=22)
+        # tails are registered before they are first iterated
+        (registered,) = guild._state._audit_log_tails[123]
+        assert registered is tail
+
+        task = asyncio.create_task(tail.next())
+        await settle()
+        assert not guild.calls
+
+        now = tail.last_id
+        old = make_entry(now - 1)
+        entries = [make_entry(now + 3), make_entry(now + 2)]
+        tail._push(old)
+        for entry in entries:
+            tail._push(entry)
+        tail._push(entries[0])
+
+        assert await task is entries[1]
+        assert await tail.next() is entries[0]
+        assert tail.last_id == now + 3
+
+        await tail.aclose()
+        assert not guild._state._audit_log_tails[123]
+
+    async def test_catch_up(self) -> None:
+        guild = make_audit_log_guild([10, 20, 30])
+        tail = AuditLogTail(guild, after=Object(15), user_id=1)
+
+        # live entries received while catching up are deduplicated
+        tail._push(make_entry(30))
+        tail._push(make_entry(40))
+        tail._push(make_entry(50, user_id=2))
+
+        assert [(await tail.next()).id for _ in range(3)] == [20, 30, 40]
+        assert guild.calls == [{"user_id": 1, "action_type": None, "after": 15}]
+
+        # a new session was started
+        guild.calls.clear()
+        tail._mark_gap()
+        tail._push(make_entry(60))
+        assert (await tail.next()).id == 60
+        assert guild.calls == [{"user_id": 1, "action_type": None, "after": 40}]
+        await tail.aclose()
+
+    async def test_out_of_order(self) -> None:
+        guild = make_audit_log_guild([])
+        tail = AuditLogTail(guild, after=Object(10))
+        tail._gap = False
+
+        tail._push(make_entry(30))
+        assert (await tail.next()).id == 30
+        # entries received late are still returned, but only once
+        tail._push(make_entry(20))
+        tail._push(make_entry(30))
+        tail._push(make_entry(40))
+        tail._push(make_entry(5))
+        assert [(await tail.next()).id for _ in range(2)] == [20, 40]
+        assert not tail._live
+        assert tail.last_id == 40
+        await tail.aclose()
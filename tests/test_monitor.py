@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+import disnake
+from disnake.monitor import LoopMonitor
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        LoopMonitor(interval=0)
+    with pytest.raises(ValueError, match="samples"):
+        LoopMonitor(samples=0)
+
+
+@pytest.mark.asyncio
+async def test_record_lag() -> None:
+    monitor = LoopMonitor(spike_threshold=0.5)
+    monitor._record_event("message")
+    monitor._record_lag(0.1)
+    monitor._record_event("typing")
+    monitor._record_event("typing")
+    monitor._record_lag(0.7)
+    monitor._record_lag(0.2)
+
+    stats = monitor.snapshot()
+    assert stats.samples == 3
+    assert stats.lag_p50 == 0.2
+    assert stats.lag_max == 0.7
+    assert len(stats.spikes) == 1
+    # only events dispatched since the previous sample are attributed to the spike
+    assert stats.spikes[0].events == {"typing": 2}
+
+
+@pytest.mark.asyncio
+async def test_sample() -> None:
+    client = disnake.Client()
+    monitor = LoopMonitor(interval=0.01, spike_threshold=0.03)
+    await monitor._start(client)
+    try:
+        await asyncio.sleep(0.005)
+        client.dispatch("sample")
+        time.sleep(0.05)  # noqa: ASYNC251
+        await asyncio.sleep(0.02)
+    finally:
+        await monitor._stop()
+
+    stats = monitor.snapshot()
+    assert stats.lag_max >= 0.03
+    assert stats.spikes
+    assert stats.spikes[0].events == {}  # not attached to the client
+
+
+@pytest.mark.asyncio
+async def test_health_endpoint() -> None:
+    monitor = LoopMonitor(health_port=0)
+    client = disnake.Client(loop_monitor=monitor)
+    client.dispatch("sample")
+    assert monitor._events == {"sample": 1}
+
+    await monitor._start(client)
+    try:
+        host, port = monitor.health_addresses[0][:2]
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://{host}:{port}/health") as resp:
+                # not connected
+                assert resp.status == 503
+                data = await resp.json()
+                assert data["status"] == "unhealthy"
+                assert data["latencies"] == {"0": None}
+
+            async with session.get(f"http://{host}:{port}/metrics") as resp:
+                assert resp.status == 200
+                assert 'disnake_loop_lag_seconds{quantile="0.99"}' in await resp.text()
+    finally:
+        await client.close()
+
+    assert monitor.health_addresses == []
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from disnake.ratelimit import SharedMemoryRateLimitStore, fcntl
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_store(tmp_path: Path) -> None:
+    path = tmp_path / "ratelimits"
+    first = SharedMemoryRateLimitStore(path, slots=16)
+    second = SharedMemoryRateLimitStore(path, slots=16)
+
+    try:
+        assert await first.get_delay("bucket") == 0
+        assert await first.get_delay(first.GLOBAL) == 0
+
+        await first.set_delay("bucket", 10)
+        assert 9 < await second.get_delay("bucket") <= 10
+        # the global rate limit is stored separately
+        assert await second.get_delay(second.GLOBAL) == 0
+
+        # shorter delays don't overwrite longer ones
+        await second.set_delay("bucket", 1)
+        assert await first.get_delay("bucket") > 9
+
+        await second.set_delay(second.GLOBAL, 5)
+        assert 4 < await first.get_delay(first.GLOBAL) <= 5
+    finally:
+        await first.close()
+        await second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_store_budget(tmp_path: Path) -> None:
+    path = tmp_path / "ratelimits"
+    first = SharedMemoryRateLimitStore(path, slots=16)
+    second = SharedMemoryRateLimitStore(path, slots=16)
+
+    try:
+        # the budget is unknown until the first response
+        assert await first.reserve("bucket") == 0
+        await first.update("bucket", 2, 10)
+
+        # the remaining requests are shared between both processes
+        assert await second.reserve("bucket") == 0
+        assert await first.reserve("bucket") == 0
+        assert 9 < await second.reserve("bucket") <= 10
+        assert 9 < await first.get_delay("bucket") <= 10
+
+        # late responses from earlier in the window don't restore the budget
+        await second.update("bucket", 1, 10)
+        assert await first.reserve("bucket") > 9
+    finally:
+        await first.close()
+        await second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_store_global_limit(tmp_path: Path) -> None:
+    path = tmp_path / "ratelimits"
+    first = SharedMemoryRateLimitStore(path, slots=16, global_limit=3)
+    second = SharedMemoryRateLimitStore(path, slots=16, global_limit=3)
+
+    try:
+        assert await first.reserve("a") == 0
+        assert await second.reserve("b") == 0
+        assert await first.reserve("c") == 0
+        # the global budget per second is used up, regardless of the bucket
+        assert 0 < await second.reserve("d") <= 1
+    finally:
+        await first.close()
+        await second.close()
+
+
+@pytest.mark.skipif(fcntl is None, reason="requires fcntl")
+@pytest.mark.asyncio
+async def test_shared_memory_store_lock(tmp_path: Path) -> None:
+    assert fcntl is not None
+    path = tmp_path / "ratelimits"
+    store = SharedMemoryRateLimitStore(path, slots=16)
+    # pretend another process holds the lock
+    fd = os.open(path, os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+    try:
+        task = asyncio.create_task(store.set_delay("bucket", 10))
+        await asyncio.sleep(0.05)
+        # waiting for the lock doesn't block the event loop
+        assert not task.done()
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        await asyncio.wait_for(task, 1)
+        assert await store.get_delay("bucket") > 9
+    finally:
+        os.close(fd)
+        await store.close()
+
+
+def test_shared_memory_store_slots(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="at least 2"):
+        SharedMemoryRateLimitStore(tmp_path / "ratelimits", slots=1)
+    with pytest.raises(ValueError, match="at least 1"):
+        SharedMemoryRateLimitStore(tmp_path / "ratelimits", global_limit=0)
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import disnake
+from disnake.shard import _IdentifyLimiter
+
+
+@pytest.mark.looptime
+@pytest.mark.asyncio
+async def test_identify_limiter(looptime: Any) -> None:
+    limiter = _IdentifyLimiter(max_concurrency=2)
+    done: dict[int, float] = {}
+
+    async def identify(shard_id: int) -> None:
+        await limiter.acquire(shard_id)
+        done[shard_id] = asyncio.get_running_loop().time()
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(identify(shard_id) for shard_id in range(5)))
+    # shards 0, 2 and 4 share a bucket, as do 1 and 3
+    assert {k: round(v - start) for k, v in done.items()} == {0: 0, 1: 0, 2: 5, 3: 5, 4: 10}
+
+
+class TestLaunchShards:
+    @pytest.fixture
+    def identified(self, monkeypatch: pytest.MonkeyPatch) -> dict[int, list[float]]:
+        # shard ID -> times of IDENTIFY attempts
+        identified: dict[int, list[float]] = {}
+
+        async def from_client(
+            client: Any, *, shard_id: int, initial: bool = False, **kwargs: Any
+        ) -> Any:
+            await client._call_before_identify_hook(shard_id, initial=initial)
+            identified.setdefault(shard_id, []).append(asyncio.get_running_loop().time())
+            return mock.Mock(shard_id=shard_id)
+
+        monkeypatch.setattr(disnake.shard.DiscordWebSocket, "from_client", from_client)
+        monkeypatch.setattr(disnake.shard.Shard, "launch", lambda self: None)
+        return identified
+
+    def make_client(
+        self, shard_count: int, max_concurrency: int, cls: type[Any] = disnake.AutoShardedClient
+    ) -> Any:
+        client = cls()
+        client._reconnect = True
+        session_start_limit = {
+            "total": 1000,
+            "remaining": 1000,
+            "reset_after": 0,
+            "max_concurrency": max_concurrency,
+        }
+        client.http.get_bot_gateway = mock.AsyncMock(
+            return_value=(shard_count, "wss://gateway", session_start_limit)
+        )
+        return client
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_buckets(self, looptime: Any, identified: dict[int, list[float]]) -> None:
+        client = self.make_client(shard_count=6, max_concurrency=3)
+
+        start = asyncio.get_running_loop().time()
+        await client.launch_shards()
+
+        # shards in different buckets are identified at the same time
+        assert {k: [round(t - start) for t in v] for k, v in identified.items()} == {
+            0: [0],
+            1: [0],
+            2: [0],
+            3: [5],
+            4: [5],
+            5: [5],
+        }
+        assert sorted(client.shards) == list(range(6))
+        assert client._connection.shards_launched.is_set()
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_failure(
+        self,
+        looptime: Any,
+        identified: dict[int, list[float]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        client = self.make_client(shard_count=4, max_concurrency=2)
+        from_client = disnake.shard.DiscordWebSocket.from_client
+        failed: list[int] = []
+
+        async def flaky_from_client(client: Any, *, shard_id: int, **kwargs: Any) -> Any:
+            ws = await from_client(client, shard_id=shard_id, **kwargs)
+            if shard_id == 0 and not failed:
+                failed.append(shard_id)
+                raise OSError
+            return ws
+
+        monkeypatch.setattr(disnake.shard.DiscordWebSocket, "from_client", flaky_from_client)
+
+        start = asyncio.get_running_loop().time()
+        await client.launch_shards()
+
+        # the failed IDENTIFY still counts towards the rate limit,
+        # and only holds up shards in the same bucket
+        assert {k: [round(t - start) for t in v] for k, v in identified.items()} == {
+            0: [0, 5],
+            1: [0],
+            2: [10],
+            3: [5],
+        }
+        assert sorted(client.shards) == list(range(4))
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_user_hook(self, looptime: Any, identified: dict[int, list[float]]) -> None:
+        hook = mock.AsyncMock()
+
+        class Client(disnake.AutoShardedClient):
+            async def before_identify_hook(
+                self, shard_id: int | None, *, initial: bool = False
+            ) -> None:
+                await hook(shard_id, initial=initial)
+
+        client = self.make_client(shard_count=2, max_concurrency=2, cls=Client)
+        await client.launch_shards()
+
+        assert hook.await_args_list == [
+            mock.call(0, initial=True),
+            mock.call(1, initial=False),
+        ]
+
+    @pytest.mark.looptime
+    @pytest.mark.asyncio
+    async def test_reidentify(self, looptime: Any, identified: dict[int, list[float]]) -> None:
+        client = self.make_client(shard_count=4, max_concurrency=2)
+        await client.launch_shards()
+        identified.clear()
+
+        start = asyncio.get_running_loop().time()
+        done: dict[int, float] = {}
+
+        async def reidentify(shard_id: int) -> None:
+            await client._call_before_identify_hook(shard_id)
+            done[shard_id] = asyncio.get_running_loop().time()
+
+        # resuming isn't rate limited, even if the shard's bucket is busy
+        async def resume() -> None:
+            done[-1] = asyncio.get_running_loop().time()
+
+        for shard_id in range(4):
+            shard = client._AutoShardedClient__shards[shard_id]
+            client._run_shard_task(shard, reidentify(shard_id), identify=True)
+        client._run_shard_task(shard, resume(), identify=False)
+        await asyncio.sleep(20)
+
+        assert {k: round(v - start) for k, v in done.items()} == {-1: 0, 0: 5, 1: 5, 2: 10, 3: 10}
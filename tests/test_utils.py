@@ -7,7 +7,7 @@ import inspect
 import os
 import sys
 import warnings
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from datetime import timedelta, timezone
 from typing import (
@@ -447,6 +447,26 @@ def test_valid_icon_size() -> None:
         assert not utils.valid_icon_size(s)
 
 
+@pytest.mark.asyncio
+async def test_save_stream(tmp_path) -> None:
+    async def stream(*chunks: bytes, fail: bool = False) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+        if fail:
+            msg = "connection lost"
+            raise OSError(msg)
+
+    path = tmp_path / "file.bin"
+    assert await utils._save_stream(stream(b"ab", b"cd"), path, seek_begin=False) == 4
+    assert path.read_bytes() == b"abcd"
+
+    # a failed download leaves the existing file untouched
+    with pytest.raises(OSError, match="connection lost"):
+        await utils._save_stream(stream(b"ef", fail=True), path, seek_begin=False)
+    assert path.read_bytes() == b"abcd"
+    assert os.listdir(tmp_path) == ["file.bin"]
+
+
 @pytest.mark.parametrize(("s", "expected"), [("a一b", 4), ("abc", 3)])
 def test_string_width(s, expected) -> None:
     assert utils._string_width(s) == expected
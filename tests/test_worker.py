@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import pytest
+
+import disnake
+from disnake.worker import WorkerObject, _snapshot, _WorkerHandler
+
+
+def moderate(message: str, n: int) -> Any:
+    if message == "bad":
+        return [
+            disnake.DeleteMessage(1, 2, reason="bad"),
+            disnake.AddReaction(1, 3, "\N{WARNING SIGN}"),
+        ]
+    return None
+
+
+def get_pid(*args: Any) -> disnake.SendMessage:
+    return disnake.SendMessage(1, str(os.getpid()))
+
+
+def invalid_result(*args: Any) -> int:
+    return 42
+
+
+def test_snapshot() -> None:
+    assert _snapshot("text") == "text"
+    assert _snapshot([1, None]) == (1, None)
+
+    channel = SimpleNamespace(id=10, guild=SimpleNamespace(id=20))
+    assert _snapshot(channel) == WorkerObject(
+        type="SimpleNamespace", id=10, guild_id=20, channel_id=None
+    )
+
+
+def test_add_listener() -> None:
+    client = disnake.Client()
+    with pytest.raises(ValueError, match="worker_pool"):
+        client.add_listener(moderate, "on_sample", dispatch_mode=disnake.EventDispatchMode.process)
+
+    client.worker_pool = ThreadPoolExecutor(1)
+
+    async def coro(*args: Any) -> None: ...
+
+    with pytest.raises(TypeError, match="must not be coroutines"):
+        client.add_listener(coro, "on_sample", dispatch_mode=disnake.EventDispatchMode.process)
+
+    with pytest.raises(ValueError, match="individual listeners"):
+        disnake.Client(event_dispatch_mode=disnake.EventDispatchMode.process)
+
+
+def test_handler_equality() -> None:
+    client = disnake.Client()
+    handler = _WorkerHandler(client, moderate)
+    assert handler == _WorkerHandler(client, moderate)
+    assert hash(handler) == hash(moderate)
+    assert handler.__qualname__ == "moderate"
+
+
+@pytest.mark.asyncio
+async def test_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    with ThreadPoolExecutor(1) as pool:
+        client = disnake.Client(worker_pool=pool)
+        monkeypatch.setattr(client.http, "delete_message", delete := mock.AsyncMock())
+        monkeypatch.setattr(client.http, "add_reaction", react := mock.AsyncMock())
+        client.add_listener(moderate, "on_sample", dispatch_mode=disnake.EventDispatchMode.process)
+
+        client.dispatch("sample", "good", 1)
+        client.dispatch("sample", "bad", 2)
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if react.await_count:
+                break
+
+    delete.assert_awaited_once_with(1, 2, reason="bad")
+    react.assert_awaited_once_with(1, 3, "\N{WARNING SIGN}")
+
+
+@pytest.mark.asyncio
+async def test_invalid_result() -> None:
+    with ThreadPoolExecutor(1) as pool:
+        client = disnake.Client(worker_pool=pool)
+        with pytest.raises(TypeError, match="WorkerAction"):
+            await _WorkerHandler(client, invalid_result)("x")
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork start method"
+)
+@pytest.mark.asyncio
+async def test_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("fork")) as pool:
+        client = disnake.Client(worker_pool=pool)
+        monkeypatch.setattr(client.http, "send_message", send := mock.AsyncMock())
+        await _WorkerHandler(client, get_pid)(SimpleNamespace(id=1))
+
+    send.assert_awaited_once()
+    assert send.await_args is not None
+    assert send.await_args.kwargs["content"] != str(os.getpid())